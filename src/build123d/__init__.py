@@ -5,6 +5,7 @@ from build123d.build_line import *
 from build123d.build_part import *
 from build123d.build_sketch import *
 from build123d.exporters import *
+from build123d.exporters3d import *
 from build123d.geometry import *
 from build123d.importers import *
 from build123d.joints import *
@@ -16,6 +17,7 @@ from build123d.operations_generic import *
 from build123d.operations_part import *
 from build123d.operations_sketch import *
 from build123d.pack import *
+from build123d.parallel import Parallelism
 from build123d.topology import *
 from build123d.drafting import *
 from build123d.persistence import modify_copyreg
@@ -43,7 +45,9 @@ __all__ = [
     "Extrinsic",
     "FontStyle",
     "FrameMethod",
+    "FuseStrategy",
     "GeomType",
+    "GlueMode",
     "HeadType",
     "Intrinsic",
     "Keep",
@@ -132,6 +136,7 @@ __all__ = [
     "VectorLike",
     "Vertex",
     "Edge",
+    "EdgeIntersection",
     "Wire",
     "Face",
     "Matrix",
@@ -140,6 +145,9 @@ __all__ = [
     "Part",
     "Plane",
     "Compound",
+    "BooleanSession",
+    "DefaultGlue",
+    "Parallelism",
     "Location",
     "LocationEncoder",
     "Joint",
@@ -155,15 +163,24 @@ __all__ = [
     "ExportSVG",
     "LineType",
     "DotLength",
+    "DrawingSheet",
+    "DrawingView",
     "Mesher",
+    # Exporter functions
+    "export_drawing_sheets",
+    "export_gltf",
     # Importer functions
+    "import_bin_brep",
     "import_brep",
     "import_step",
+    "import_step_roots",
     "import_stl",
     "import_svg",
     "import_svg_as_buildline_code",
     # Other functions
+    "build_in_threads",
     "delta",
+    "edge_intersections",
     "edges_to_wires",
     "new_edges",
     "pack",
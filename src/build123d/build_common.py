@@ -46,12 +46,15 @@ import logging
 import sys
 import warnings
 import functools
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 from itertools import product
 from math import sqrt
 from typing import Any, Callable, Iterable, Optional, Union, TypeVar
 from typing_extensions import Self, ParamSpec, Concatenate
 
+import numpy as np
+
 from build123d.build_enums import Align, Mode, Select
 from build123d.geometry import Axis, Location, Plane, Vector, VectorLike
 from build123d.topology import (
@@ -66,6 +69,7 @@ from build123d.topology import (
     Solid,
     Vertex,
     Wire,
+    BooleanSession,
     tuplify,
     new_edges,
 )
@@ -123,6 +127,12 @@ def flatten_sequence(*obj: T) -> list[Any]:
         # and break them into a list of floats.
         if isinstance(item, (list, tuple, filter, set)) and not _is_point(item):
             flat_list.extend(flatten_sequence(*item))
+        elif isinstance(item, np.ndarray) and item.dtype.kind in "iuf":
+            # A numeric array of points (one per row) or a single point
+            flat_list.extend(map(tuple, np.atleast_2d(item).tolist()))
+        elif isinstance(item, np.ndarray):
+            # Other arrays, e.g. of shapes, are flattened like lists
+            flat_list.extend(flatten_sequence(*item.ravel().tolist()))
         else:
             flat_list.append(item)
 
@@ -181,6 +191,9 @@ class Builder(ABC):
     _shape = None
     _sub_class = None
 
+    # Builders that defer subtracting solids override this
+    batch_cuts = False
+
     @property
     @abstractmethod
     def _obj(self) -> Shape:
@@ -190,11 +203,15 @@ class Builder(ABC):
     @property
     def max_dimension(self) -> float:
         """Maximum size of object in all directions"""
+        if self._cut_session is not None:
+            # Cuts can't increase the size of the object so avoid applying them
+            return self._cut_session.base.bounding_box().diagonal
         return self._obj.bounding_box().diagonal if self._obj else 0.0
 
     @property
     def new_edges(self) -> ShapeList[Edge]:
         """Edges that changed during last operation"""
+        self._apply_deferred_cuts()
         before_list = [] if self.obj_before is None else [self.obj_before]
         return new_edges(*(before_list + self.to_combine), combined=self._obj)
 
@@ -212,12 +229,19 @@ class Builder(ABC):
         assert current_frame.f_back is not None
         self._python_frame = current_frame.f_back.f_back
         self.builder_parent = None
-        self.lasts: dict = {Vertex: [], Edge: [], Face: [], Solid: []}
+        self._lasts: dict = {Vertex: [], Edge: [], Face: [], Solid: []}
+        self._cut_session: Optional[BooleanSession] = None
         self.workplanes_context = None
         self.exit_workplanes = None
         self.obj_before: Optional[Shape] = None
         self.to_combine: list[Shape] = []
 
+    @property
+    def lasts(self) -> dict:
+        """Objects of each type created during the last operation"""
+        self._apply_deferred_cuts()
+        return self._lasts
+
     def __enter__(self):
         """Upon entering record the parent and a token to restore contextvars"""
 
@@ -258,6 +282,7 @@ class Builder(ABC):
 
     def __exit__(self, exception_type, exception_value, traceback):
         """Upon exiting restore context and send object to parent"""
+        self._apply_deferred_cuts()
         self._current.reset(self._reset_tok)
 
         self._exit_extras()  # custom builder exit code
@@ -335,6 +360,9 @@ class Builder(ABC):
         # pylint: disable=too-many-branches
         # pylint: disable=too-many-statements
 
+        if self._defer_cut(objects, clean, mode):
+            return
+
         self.obj_before = self._obj
         self.to_combine = list(objects)
         if mode != Mode.PRIVATE and len(objects) > 0:
@@ -439,7 +467,7 @@ class Builder(ABC):
             # just was added - no need for the set math.
             for cls in [Vertex, Edge, Face, Solid]:
                 post = set() if self._obj is None else set(self._shapes(cls))
-                self.lasts[cls] = (
+                self._lasts[cls] = (
                     ShapeList(typed[cls])
                     if self._shape == cls
                     else ShapeList(post - pre[cls])
@@ -465,6 +493,48 @@ class Builder(ABC):
             elif self._tag == "BuildSketch":
                 self._add_to_pending(*typed[Edge])
 
+    def _defer_cut(
+        self,
+        objects: tuple[Union[Edge, Wire, Face, Solid, Compound], ...],
+        clean: bool,
+        mode: Mode,
+    ) -> bool:
+        """Record solids to be subtracted later by the cut session of builders that
+        batch their cuts"""
+        if (
+            not self.batch_cuts
+            or mode != Mode.SUBTRACT
+            or not clean
+            or not objects
+            or not all(isinstance(obj, Solid) for obj in objects)
+        ):
+            return False
+        if self._cut_session is None:
+            if self._obj is None:
+                return False
+            self._cut_session = BooleanSession(self._obj)
+        logger.debug("Deferring the subtraction of %d solid(s)", len(objects))
+        self._cut_session.cut(*objects)
+        return True
+
+    def _apply_deferred_cuts(self):
+        """Subtract the solids of deferred cuts from the builder's object
+
+        All but the last of the deferred cuts are applied with a single boolean
+        operation and the last cut is added to the builder as usual such that the
+        Select.LAST objects are those of the last operation.
+        """
+        if self._cut_session is None:
+            return
+        session, self._cut_session = self._cut_session, None
+        base, tools = session.collapse()
+        self._obj = self._sub_class(base.wrapped)
+        batch_cuts, self.batch_cuts = self.batch_cuts, False
+        try:
+            self._add_to_context(*tools, mode=Mode.SUBTRACT)
+        finally:
+            self.batch_cuts = batch_cuts
+
     # Known pylint issue with Enums
     # pylint: disable=no-member
     def vertices(self, select: Select = Select.ALL) -> ShapeList[Vertex]:
@@ -1233,6 +1303,68 @@ class WorkplaneList:
         return result
 
 
+def _run_isolated(func: Callable[..., Any], *args: Any) -> Any:
+    """Run func without the builder, locations and workplanes of the caller"""
+    for context_class in (Builder, LocationList, WorkplaneList):
+        context_class._current.set(None)
+    return func(*args)
+
+
+def build_in_threads(
+    func: Callable[..., Any], *iterables: Iterable[Any], max_workers: int = None
+) -> list[Any]:
+    """build_in_threads
+
+    Run independent builds concurrently in a pool of threads, like the builtin
+    map, returning the results in order.
+
+    Each call of func runs in a copy of the caller's context: the Parallelism,
+    DefaultGlue and SkipClean settings of the caller apply but any builder,
+    Locations or workplanes that are active in the caller are not visible to the
+    build. Unlike a process pool, the threads share the fonts, glyphs,
+    tessellations and other caches of the process as well as any shapes passed
+    to them (e.g. an imported STEP file) without serializing them.
+
+    The caches of build123d are safe to use from multiple threads but shapes
+    aren't locked; a build may read shared shapes but shouldn't move them or
+    change their parent or children (e.g. by adding them to a Compound) as the
+    other builds would see the change. OCP holds the Python GIL while an OCCT
+    algorithm runs so the threads mostly overlap I/O and Python code; use
+    Parallelism to let the OCCT algorithms themselves use multiple cores or a
+    process pool for builds that are dominated by geometry computation.
+
+    Example:
+
+    .. code-block:: python
+
+        def plate(serial: str) -> Part:
+            with BuildPart() as builder:
+                Box(80, 40, 5)
+                with BuildSketch(builder.faces().sort_by(Axis.Z)[-1]):
+                    Text(serial, 8)
+                extrude(amount=-1, mode=Mode.SUBTRACT)
+            return builder.part
+
+        plates = build_in_threads(plate, [f"SN-{i:04}" for i in range(100)])
+
+    Args:
+        func (Callable[..., Any]): build function taking one argument from each
+            of the iterables
+        iterables (Iterable[Any]): arguments of the builds
+        max_workers (int, optional): maximum number of threads. Defaults to None
+            (the ThreadPoolExecutor default).
+
+    Returns:
+        list[Any]: the result of each build
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, _run_isolated, func, *args)
+            for args in zip(*iterables)
+        ]
+        return [future.result() for future in futures]
+
+
 P = ParamSpec("P")
 
 
@@ -103,6 +103,17 @@ class FrameMethod(Enum):
         return f"<{self.__class__.__name__}.{self.name}>"
 
 
+class FuseStrategy(Enum):
+    """Boolean fuse strategy for many operands"""
+
+    AUTO = auto()
+    SINGLE = auto()
+    TREE = auto()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}.{self.name}>"
+
+
 class GeomType(Enum):
     """CAD geometry object type"""
 
@@ -127,6 +138,17 @@ class GeomType(Enum):
         return f"<{self.__class__.__name__}.{self.name}>"
 
 
+class GlueMode(Enum):
+    """Boolean fuse glue option"""
+
+    AUTO = auto()
+    OFF = auto()
+    SHIFT = auto()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}.{self.name}>"
+
+
 class HeadType(Enum):
     """Arrow head types"""
 
@@ -51,6 +51,9 @@ class BuildPart(Builder):
     Args:
         workplanes (Plane, optional): initial plane to work on. Defaults to Plane.XY.
         mode (Mode, optional): combination mode. Defaults to Mode.ADD.
+        batch_cuts (bool, optional): defer subtracting solids from the part until
+            the part or the objects of the last operation are accessed and then
+            subtract them all at once. Defaults to False.
     """
 
     _tag = "BuildPart"  # Alternate for __class__.__name__
@@ -62,6 +65,16 @@ class BuildPart(Builder):
     def _obj(self) -> Part:
         return self.part
 
+    @property
+    def part(self) -> Part:
+        """The part being built"""
+        self._apply_deferred_cuts()
+        return self._part
+
+    @part.setter
+    def part(self, value: Part) -> None:
+        self._part = value
+
     @_obj.setter
     def _obj(self, value: Part) -> None:
         self.part = value
@@ -80,9 +93,11 @@ class BuildPart(Builder):
         self,
         *workplanes: Union[Face, Plane, Location],
         mode: Mode = Mode.ADD,
+        batch_cuts: bool = False,
     ):
         self.joints: dict[str, Joint] = {}
-        self.part: Part = None
+        self.batch_cuts = batch_cuts
+        self._part: Part = None
         self.pending_faces: list[Face] = []
         self.pending_face_planes: list[Plane] = []
         self.pending_planes: list[Plane] = []
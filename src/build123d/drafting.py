@@ -25,10 +25,14 @@ license:
     limitations under the License.
 
 """
-from dataclasses import dataclass
+import copy
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date
+from itertools import repeat
 from math import copysign, floor, gcd, log2, pi
-from typing import ClassVar, Iterable, Optional, Union
+from typing import ClassVar, Iterable, NamedTuple, Optional, Union
 
 from build123d.build_common import IN, MM
 from build123d.build_enums import (
@@ -44,12 +48,14 @@ from build123d.build_enums import (
 )
 from build123d.build_line import BuildLine
 from build123d.build_sketch import BuildSketch
+from build123d.exporters import ExportDXF, ExportSVG, LineType
 from build123d.geometry import Axis, Location, Plane, Pos, Vector, VectorLike
 from build123d.objects_curve import Line, TangentArc
 from build123d.objects_sketch import BaseSketchObject, Polygon, Text
 from build123d.operations_generic import fillet, mirror, sweep
 from build123d.operations_sketch import make_face, trace
-from build123d.topology import Compound, Edge, Sketch, Vertex, Wire
+from build123d.parallel import Parallelism
+from build123d.topology import Compound, Edge, Shape, Sketch, Vertex, Wire
 
 
 class ArrowHead(BaseSketchObject):
@@ -574,6 +580,17 @@ class ExtensionLine(BaseSketchObject):
         super().__init__(obj=e_line_sketch, rotation=0, align=None, mode=mode)
 
 
+class _TitleBlockFrame(NamedTuple):
+    """The parts of a TechnicalDrawing shared by drawings with the same layout"""
+
+    frame: Sketch
+    ticks: Sketch
+    grid_labels: Sketch
+    box_frame: Sketch
+    labels: list[Sketch]
+    base_lines: tuple[Edge, Edge, Edge]
+
+
 class TechnicalDrawing(BaseSketchObject):
     """Sketch Object: TechnicalDrawing
 
@@ -611,6 +628,10 @@ class TechnicalDrawing(BaseSketchObject):
     }
     margin = 5 * MM
 
+    # (page_size, nominal_text_size, line_width) -> _TitleBlockFrame
+    _frames: ClassVar[dict] = {}
+    _frames_lock: ClassVar[threading.RLock] = threading.RLock()
+
     def __init__(
         self,
         designed_by: str = "build123d",
@@ -625,8 +646,55 @@ class TechnicalDrawing(BaseSketchObject):
         line_width: float = 0.5,
         mode: Mode = Mode.ADD,
     ):
-        # pylint: disable=too-many-locals
+        # The frame only depends on the page and text size so is shared by
+        # all drawings with the same layout
+        key = (page_size, nominal_text_size, line_width)
+        with TechnicalDrawing._frames_lock:
+            if key not in TechnicalDrawing._frames:
+                TechnicalDrawing._frames[key] = TechnicalDrawing._make_frame(*key)
+            frame = TechnicalDrawing._frames[key]
 
+        # Text
+        def label(base_line: Edge, position: float, txt: str, size: float) -> Sketch:
+            return Pos(base_line @ position) * Sketch(
+                Compound.make_text(txt, size, align=(Align.MIN, Align.CENTER)).wrapped
+            )
+
+        t_base_line1, t_base_line2, t_base_line3 = frame.base_lines
+        labels = [copy.copy(static_label) for static_label in frame.labels]
+        labels += [
+            label(t_base_line1, 9 / 12, designed_by, nominal_text_size / 2),
+            label(t_base_line1, 5 / 12, design_date.isoformat(), nominal_text_size / 2),
+            label(
+                t_base_line1, 1 / 12, "1:" + str(drawing_scale), nominal_text_size / 2
+            ),
+            label(t_base_line2, 10 / 12, title, nominal_text_size),
+            label(t_base_line2, 6 / 12, sub_title, nominal_text_size),
+            label(t_base_line2, 1 / 12, drawing_number, nominal_text_size / 2),
+        ]
+        if sheet_number is not None:
+            labels.append(
+                label(t_base_line3, 1 / 12, str(sheet_number), nominal_text_size / 2)
+            )
+
+        technical_drawing = Compound(
+            children=[
+                copy.copy(frame.frame),
+                copy.copy(frame.ticks),
+                copy.copy(frame.grid_labels),
+                copy.copy(frame.box_frame),
+                Sketch() + labels,
+            ]
+        )
+
+        super().__init__(obj=technical_drawing, rotation=0, align=None, mode=mode)
+
+    @staticmethod
+    def _make_frame(
+        page_size: PageSize, nominal_text_size: float, line_width: float
+    ) -> "_TitleBlockFrame":
+        """The parts of a TechnicalDrawing that don't depend on the title block text"""
+        # pylint: disable=too-many-locals
         page_dim = TechnicalDrawing.page_sizes[page_size]
         # Frame
         frame_width = page_dim[0] - 2 * TechnicalDrawing.margin - 2 * nominal_text_size
@@ -658,15 +726,18 @@ class TechnicalDrawing(BaseSketchObject):
             )
         ticks = trace(tick_lines, line_width, mode=Mode.PRIVATE)
         # Numbers
-        grid_labels = Sketch()
+        grid_labels = []
         y_centers = {0: -3 / 8, 1: -1 / 8, 2: 1 / 8, 3: 3 / 8}
         for label in range(4):
             for x_index in [-0.5, 0.5]:
-                grid_labels += Pos(
-                    x_index * (frame_width + 1.5 * nominal_text_size),
-                    y_centers[label] * frame_height,
-                ) * Sketch(
-                    Compound.make_text(str(label + 1), nominal_text_size).wrapped
+                grid_labels.append(
+                    Pos(
+                        x_index * (frame_width + 1.5 * nominal_text_size),
+                        y_centers[label] * frame_height,
+                    )
+                    * Sketch(
+                        Compound.make_text(str(label + 1), nominal_text_size).wrapped
+                    )
                 )
 
         # Letters
@@ -680,10 +751,13 @@ class TechnicalDrawing(BaseSketchObject):
         }
         for i, label in enumerate(["F", "E", "D", "C", "B", "A"]):
             for y_index in [-0.5, 0.5]:
-                grid_labels += Pos(
-                    x_centers[i] * frame_width,
-                    y_index * (frame_height + 1.5 * nominal_text_size),
-                ) * Sketch(Compound.make_text(label, nominal_text_size).wrapped)
+                grid_labels.append(
+                    Pos(
+                        x_centers[i] * frame_width,
+                        y_index * (frame_height + 1.5 * nominal_text_size),
+                    )
+                    * Sketch(Compound.make_text(label, nominal_text_size).wrapped)
+                )
 
         # Text Box Frame
         bf_pnt1 = frame_wire.edges().sort_by(Axis.Y)[0] @ 0.5
@@ -704,84 +778,161 @@ class TechnicalDrawing(BaseSketchObject):
         )
         box_frame = trace(box_frame_curve, line_width, mode=Mode.PRIVATE)
         # Text
-        labels = Sketch()
         t_base_line1 = Edge.make_line(bf_pnt1, (bf_pnt1.X, bf_pnt2.Y)).moved(
             Location((nominal_text_size / 5, 0))
         )
         t_base_line2 = t_base_line1.moved(Location((frame_width / 6, 0)))
         t_base_line3 = t_base_line1.moved(Location((2 * frame_width / 6, 0)))
-        labels += Pos(t_base_line1 @ (11 / 12)) * Sketch(
-            Compound.make_text(
-                "DESIGNED BY:", nominal_text_size / 3, align=(Align.MIN, Align.CENTER)
-            ).wrapped
-        )
-        labels += Pos(t_base_line1 @ (9 / 12)) * Sketch(
-            Compound.make_text(
-                designed_by, nominal_text_size / 2, align=(Align.MIN, Align.CENTER)
-            ).wrapped
-        )
-        labels += Pos(t_base_line1 @ (7 / 12)) * Sketch(
-            Compound.make_text(
-                "DATE:", nominal_text_size / 3, align=(Align.MIN, Align.CENTER)
-            ).wrapped
-        )
-        labels += Pos(t_base_line1 @ (5 / 12)) * Sketch(
-            Compound.make_text(
-                design_date.isoformat(),
-                nominal_text_size / 2,
-                align=(Align.MIN, Align.CENTER),
-            ).wrapped
-        )
-        labels += Pos(t_base_line1 @ (3 / 12)) * Sketch(
-            Compound.make_text(
-                "SCALE:", nominal_text_size / 3, align=(Align.MIN, Align.CENTER)
-            ).wrapped
-        )
-        labels += Pos(t_base_line1 @ (1 / 12)) * Sketch(
-            Compound.make_text(
-                "1:" + str(drawing_scale),
-                nominal_text_size / 2,
-                align=(Align.MIN, Align.CENTER),
-            ).wrapped
-        )
-        labels += Pos(t_base_line2 @ (10 / 12)) * Sketch(
-            Compound.make_text(
-                title, nominal_text_size, align=(Align.MIN, Align.CENTER)
-            ).wrapped
-        )
-        labels += Pos(t_base_line2 @ (6 / 12)) * Sketch(
-            Compound.make_text(
-                sub_title, nominal_text_size, align=(Align.MIN, Align.CENTER)
-            ).wrapped
-        )
-        labels += Pos(t_base_line2 @ (3 / 12)) * Sketch(
-            Compound.make_text(
-                "DRAWING NUMBER:",
-                nominal_text_size / 3,
-                align=(Align.MIN, Align.CENTER),
-            ).wrapped
-        )
-        labels += Pos(t_base_line2 @ (1 / 12)) * Sketch(
-            Compound.make_text(
-                drawing_number, nominal_text_size / 2, align=(Align.MIN, Align.CENTER)
-            ).wrapped
-        )
-        labels += Pos(t_base_line3 @ (3 / 12)) * Sketch(
-            Compound.make_text(
-                "SHEET:", nominal_text_size / 3, align=(Align.MIN, Align.CENTER)
-            ).wrapped
-        )
-        if sheet_number is not None:
-            labels += Pos(t_base_line3 @ (1 / 12)) * Sketch(
+        labels = [
+            Pos(t_base_line @ position)
+            * Sketch(
                 Compound.make_text(
-                    str(sheet_number),
-                    nominal_text_size / 2,
-                    align=(Align.MIN, Align.CENTER),
+                    txt, nominal_text_size / 3, align=(Align.MIN, Align.CENTER)
                 ).wrapped
             )
+            for t_base_line, position, txt in [
+                (t_base_line1, 11 / 12, "DESIGNED BY:"),
+                (t_base_line1, 7 / 12, "DATE:"),
+                (t_base_line1, 3 / 12, "SCALE:"),
+                (t_base_line2, 3 / 12, "DRAWING NUMBER:"),
+                (t_base_line3, 3 / 12, "SHEET:"),
+            ]
+        ]
 
-        technical_drawing = Compound(
-            children=[frame, ticks, grid_labels, box_frame, labels]
+        return _TitleBlockFrame(
+            frame,
+            ticks,
+            Sketch() + grid_labels,
+            box_frame,
+            labels,
+            (t_base_line1, t_base_line2, t_base_line3),
         )
 
-        super().__init__(obj=technical_drawing, rotation=0, align=None, mode=mode)
+
+@dataclass
+class DrawingView:
+    """DrawingView
+
+    A projection of the part on a drawing sheet.
+
+    Args:
+        viewport_origin (VectorLike): location of the viewport (camera)
+        viewport_up (VectorLike, optional): direction of the viewport y axis.
+            Defaults to (0, 0, 1).
+        look_at (VectorLike, optional): point to look at. Defaults to None
+            (center of the part).
+        position (VectorLike, optional): center of the view on the sheet.
+            Defaults to (0, 0).
+    """
+
+    viewport_origin: VectorLike
+    viewport_up: VectorLike = (0, 0, 1)
+    look_at: Optional[VectorLike] = None
+    position: VectorLike = (0, 0)
+
+
+@dataclass
+class DrawingSheet:
+    """DrawingSheet
+
+    A drawing sheet of a part: its views within a TechnicalDrawing border.
+
+    Args:
+        part (Shape): the object to draw
+        views (list[DrawingView]): the views of part on the sheet
+        file_name (str): destination, a ".dxf" file or otherwise an SVG file
+        title_block (dict, optional): TechnicalDrawing parameters, e.g. title,
+            page_size or drawing_scale (which also scales the views). Defaults to {}.
+    """
+
+    part: Shape
+    views: list[DrawingView]
+    file_name: str
+    title_block: dict = field(default_factory=dict)
+
+
+def _export_drawing_sheet(sheet: DrawingSheet, exact: bool, deflection: float) -> str:
+    """Project the views, add the border and write a drawing sheet
+
+    A module level function such that it can be executed in a separate process.
+    """
+    border = TechnicalDrawing(**sheet.title_block)
+    scale = 1 / sheet.title_block.get("drawing_scale", 1.0)
+    projections = sheet.part.project_to_viewports(
+        [
+            (view.viewport_origin, view.viewport_up, view.look_at)
+            for view in sheet.views
+        ],
+        exact,
+        deflection,
+        max_workers=1,
+    )
+
+    visible_edges, hidden_edges = [], []
+    for view, (visible, hidden) in zip(sheet.views, projections):
+        if not visible and not hidden:
+            continue
+        visible = Compound.make_compound(visible).scale(scale)
+        hidden = Compound.make_compound(hidden).scale(scale)
+        center = Compound.make_compound([visible, hidden]).bounding_box().center()
+        offset = Pos(Vector(view.position) - center)
+        visible_edges.append(offset * visible)
+        hidden_edges.append(offset * hidden)
+
+    exporter: Union[ExportDXF, ExportSVG]
+    if sheet.file_name.lower().endswith(".dxf"):
+        exporter = ExportDXF()
+        exporter.add_layer("border")
+        exporter.add_layer("hidden", line_type=LineType.ISO_DOT)
+    else:
+        exporter = ExportSVG()
+        exporter.add_layer("border", fill_color=(0, 0, 0), line_color=None)
+        exporter.add_layer(
+            "hidden", line_color=(99, 99, 99), line_type=LineType.ISO_DOT
+        )
+    with exporter:
+        exporter.add_layer("visible")
+        exporter.add_shape(border, layer="border")
+        exporter.add_shape(visible_edges, layer="visible")
+        exporter.add_shape(hidden_edges, layer="hidden")
+        exporter.write(sheet.file_name)
+    return sheet.file_name
+
+
+def export_drawing_sheets(
+    sheets: Iterable[DrawingSheet],
+    exact: bool = True,
+    deflection: float = 1e-3,
+    max_workers: int = None,
+) -> list[str]:
+    """export_drawing_sheets
+
+    Generate a set of drawing sheets in parallel. Each sheet - the hidden line
+    removal of its views, its TechnicalDrawing border and the DXF or SVG file - is
+    created in one of a pool of processes, which reuse the borders (except for
+    the title block text) of sheets with the same page and text sizes.
+
+    Args:
+        sheets (Iterable[DrawingSheet]): the sheets to create
+        exact (bool, optional): use exact (True) or polygonal (False) hidden line
+            removal. Defaults to True.
+        deflection (float, optional): linear deflection used by polygonal hidden
+            line removal. Defaults to 1e-3.
+        max_workers (int, optional): maximum number of processes, 1 disables
+            multiprocessing. Defaults to None (the number of "hlr" threads set by
+            Parallelism).
+
+    Returns:
+        list[str]: the file names of the sheets
+    """
+    sheets = list(sheets)
+    if max_workers is None:
+        max_workers = Parallelism.threads("hlr")
+    if len(sheets) > 1 and max_workers != 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    _export_drawing_sheet, sheets, repeat(exact), repeat(deflection)
+                )
+            )
+    return [_export_drawing_sheet(sheet, exact, deflection) for sheet in sheets]
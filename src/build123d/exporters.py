@@ -31,32 +31,53 @@ license:
 # pylint: disable=no-name-in-module, import-error
 # pylint: disable=too-many-lines
 
+import gzip
 import math
-import xml.etree.ElementTree as ET
+import shutil
+import threading
+import weakref
+from collections import OrderedDict
 from enum import Enum, auto
-from typing import Callable, Iterable, Optional, Union, List
+from functools import cached_property
+from tempfile import SpooledTemporaryFile
+from typing import Callable, Iterable, NamedTuple, Optional, Union, List
 from copy import copy
+from xml.sax.saxutils import quoteattr
 
 import ezdxf
-import svgpathtools as PT
 from ezdxf import zoom
+from ezdxf.addons.r12writer import R12FastStreamWriter
 from ezdxf.colors import RGB, aci2rgb
 from ezdxf.math import Vec2
+import numpy as np
+from OCP.Bnd import Bnd_Box  # type: ignore
 from OCP.BRepLib import BRepLib  # type: ignore
 from OCP.BRepTools import BRepTools_WireExplorer  # type: ignore
-from OCP.Geom import Geom_BezierCurve  # type: ignore
+from OCP.Geom import Geom_BezierCurve, Geom_BSplineCurve  # type: ignore
 from OCP.GeomConvert import GeomConvert  # type: ignore
 from OCP.GeomConvert import GeomConvert_BSplineCurveToBezierCurve  # type: ignore
-from OCP.gp import gp_Ax2, gp_Dir, gp_Pnt, gp_Vec, gp_XYZ  # type: ignore
+from OCP.gp import (  # type: ignore
+    gp_Ax2,
+    gp_Dir,
+    gp_Pnt,
+    gp_Trsf,
+    gp_TrsfForm,
+    gp_Vec,
+    gp_XYZ,
+)
 from OCP.HLRAlgo import HLRAlgo_Projector  # type: ignore
 from OCP.HLRBRep import HLRBRep_Algo, HLRBRep_HLRToShape  # type: ignore
 from OCP.TopAbs import TopAbs_Orientation, TopAbs_ShapeEnum  # type: ignore
 from OCP.TopExp import TopExp_Explorer  # type: ignore
+from OCP.TopLoc import TopLoc_Location  # type: ignore
+from OCP.TopTools import TopTools_MapOfShape  # type: ignore
+from OCP.TopoDS import TopoDS_Shape  # type: ignore
 from typing_extensions import Self
 
 from build123d.build_enums import Unit
 from build123d.geometry import TOLERANCE
 from build123d.topology import (
+    HASH_CODE_MAX,
     BoundBox,
     Compound,
     Edge,
@@ -67,7 +88,14 @@ from build123d.topology import (
     VectorLike,
 )
 
-PathSegment = Union[PT.Line, PT.Arc, PT.QuadraticBezier, PT.CubicBezier]
+
+class PathSegment(NamedTuple):
+    """A segment of an SVG path: the command drawing it from start to end"""
+
+    start: complex
+    end: complex
+    command: str
+
 
 # ---------------------------------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -280,6 +308,9 @@ class Export2D:
     # this case.
     PARAMETRIC_TOLERANCE = 1e-9
 
+    # Serialized entities beyond this size (in characters) are spooled to disk
+    _SPOOL_SIZE = 1 << 22
+
     DEFAULT_COLOR_INDEX = ColorIndex.BLACK
     DEFAULT_LINE_WEIGHT = 0.09
     DEFAULT_LINE_TYPE = LineType.CONTINUOUS
@@ -450,6 +481,344 @@ class Export2D:
         Unit.M: 0.00254,
     }
 
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    def _spool(self, encoding: str) -> SpooledTemporaryFile:
+        """A temporary file for serialized entities that is closed with the exporter"""
+        spool = SpooledTemporaryFile(
+            max_size=self._SPOOL_SIZE, mode="w+", encoding=encoding
+        )
+        self._spools.append(weakref.finalize(self, spool.close))
+        return spool
+
+    def close(self):
+        """close
+
+        Release the temporary files holding the serialized shapes. The exporter
+        can't be used once closed. Exporters are also closed on leaving a with
+        block or when they are garbage collected.
+        """
+        for close_spool in self._spools:
+            close_spool()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    @staticmethod
+    def _wire_edges(wire: Wire, reverse: bool) -> List[Edge]:
+        edges = []
+        explorer = BRepTools_WireExplorer(wire.wrapped)
+        while explorer.More():
+            topo_edge = explorer.Current()
+            edges.append(Edge(topo_edge))
+            explorer.Next()
+        if reverse:
+            edges.reverse()
+        return edges
+
+
+# ---------------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def _poles(curve: Union[Geom_BSplineCurve, Geom_BezierCurve]) -> np.ndarray:
+    """An (n, 3) array of the poles of a curve"""
+    # Indexing is much faster than iterating over the TColgp_Array1OfPnt
+    poles = [curve.Pole(i).Coord() for i in range(1, curve.NbPoles() + 1)]
+    return np.array(poles, dtype=float).reshape(-1, 3)
+
+
+def _knot_sequence(curve: Geom_BSplineCurve) -> list[float]:
+    """The knots of a curve repeated by their multiplicity"""
+    return [
+        curve.Knot(i)
+        for i in range(1, curve.NbKnots() + 1)
+        for _ in range(curve.Multiplicity(i))
+    ]
+
+
+def _transformed(points: np.ndarray, transformation: gp_Trsf) -> np.ndarray:
+    """Apply transformation to an (n, 3) array of points"""
+    if transformation.Form() == gp_TrsfForm.gp_Identity:
+        return points
+    matrix = np.array(
+        [[transformation.Value(r, c) for c in range(1, 5)] for r in range(1, 4)]
+    )
+    return points @ matrix[:, :3].T + matrix[:, 3]
+
+
+class ConvertedSpline:
+    """ConvertedSpline
+
+    The degree 3 B-Spline approximation of an edge in the edge's local
+    coordinate system, as used by the 2D exporters.
+
+    Args:
+        spline (Geom_BSplineCurve): the approximation
+        u1 (float): first parameter of the edge on spline
+        u2 (float): last parameter of the edge on spline
+        transformation (gp_Trsf): placement of spline within the edge
+    """
+
+    def __init__(
+        self, spline: Geom_BSplineCurve, u1: float, u2: float, transformation: gp_Trsf
+    ):
+        self.spline = spline
+        self.u1 = u1
+        self.u2 = u2
+        self.transformation = transformation
+
+    @cached_property
+    def bspline(self) -> tuple[int, list[float], np.ndarray, Optional[list[float]]]:
+        """The order, knot sequence, poles and weights (if rational) of the spline
+        trimmed to the edge with the poles of periodic splines wrapped around"""
+        spline = GeomConvert.SplitBSplineCurve_s(
+            self.spline, self.u1, self.u2, Export2D.PARAMETRIC_TOLERANCE
+        )
+        poles = _transformed(_poles(spline), self.transformation)
+        weights = (
+            [spline.Weight(i) for i in range(1, spline.NbPoles() + 1)]
+            if spline.IsRational()
+            else None
+        )
+        if spline.IsPeriodic():
+            pad = spline.NbKnots() - spline.LastUKnotIndex()
+            poles = np.vstack((poles, poles[:pad]))
+        return spline.Degree() + 1, _knot_sequence(spline), poles, weights
+
+    @cached_property
+    def beziers(self) -> tuple[np.ndarray, list[int]]:
+        """The poles of the Bézier curves making up the edge, stacked into a
+        single array, and the number of poles of each curve"""
+        # According to the OCCT 7.6.0 documentation,
+        # "ParametricTolerance is not used."
+        converter = GeomConvert_BSplineCurveToBezierCurve(
+            self.spline, self.u1, self.u2, Export2D.PARAMETRIC_TOLERANCE
+        )
+        arcs = [converter.Arc(i) for i in range(1, converter.NbArcs() + 1)]
+        poles = np.vstack([_poles(arc) for arc in arcs])
+        return _transformed(poles, self.transformation), [a.NbPoles() for a in arcs]
+
+
+class SplineCache:
+    """SplineCache
+
+    Cache of the B-Spline approximations of edges shared by `ExportDXF` and
+    `ExportSVG`.
+
+    Approximating an edge with B-Splines (see `Edge.to_splines`) is by far the
+    most expensive step of exporting a drawing, and drawings often contain many
+    copies of the same edge at different locations. Approximations are
+    therefore stored in the local coordinate system of the edge and shared by
+    all edges with the same underlying curve - B-Spline curves are identified by
+    their definition (so deep copies match), other curves by their TShape. The
+    location of each edge is applied to the resulting poles afterwards.
+
+    Args:
+        max_size (int, optional): maximum number of cached curves. Defaults to 4096.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        # key -> [(unlocated TopoDS_Shape or None if keyed by curve, ConvertedSpline)]
+        self._entries: OrderedDict[
+            tuple, list[tuple[Optional[TopoDS_Shape], ConvertedSpline]]
+        ] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def clear(self):
+        """Remove all of the cached splines"""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _curve_key(edge: Edge, unlocated: TopoDS_Shape) -> tuple:
+        """Key identifying the underlying curve of an edge"""
+        if edge.geom_type() != GeomType.BSPLINE.name:
+            return ("shape", unlocated.HashCode(HASH_CODE_MAX))
+        adaptor = Edge(unlocated)._geom_adaptor()
+        curve = adaptor.Curve().Curve()
+        transformation = adaptor.Trsf()
+        return (
+            "bspline",
+            curve.Degree(),
+            curve.IsPeriodic(),
+            _poles(curve).tobytes(),
+            tuple(_knot_sequence(curve)),
+            (
+                tuple(curve.Weight(i) for i in range(1, curve.NbPoles() + 1))
+                if curve.IsRational()
+                else None
+            ),
+            adaptor.FirstParameter(),
+            adaptor.LastParameter(),
+            tuple(transformation.Value(r, c) for r in range(1, 4) for c in range(1, 5)),
+        )
+
+    def spline(self, edge: Edge) -> ConvertedSpline:
+        """spline
+
+        Find or create the B-Spline approximation of an edge.
+
+        Args:
+            edge (Edge): edge to approximate
+
+        Returns:
+            ConvertedSpline: approximation in the local coordinate system of edge
+        """
+        unlocated = edge.wrapped.Located(TopLoc_Location())
+        key = self._curve_key(edge, unlocated)
+        with self._lock:
+            for other, converted in self._entries.get(key, []):
+                if other is None or other.IsPartner(unlocated):
+                    self._entries.move_to_end(key)
+                    return converted
+
+        # This reduces the B-Spline to degree 3, generally adding
+        # poles and knots to approximate the original.
+        # This also will convert basically any edge into a B-Spline.
+        adaptor = Edge(unlocated).to_splines()._geom_adaptor()
+        converted = ConvertedSpline(
+            adaptor.Curve().Curve(),
+            adaptor.FirstParameter(),
+            adaptor.LastParameter(),
+            adaptor.Trsf(),
+        )
+        with self._lock:
+            self._entries.setdefault(key, []).append(
+                (None if key[0] == "bspline" else unlocated, converted)
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return converted
+
+
+spline_cache = SplineCache()
+
+
+class _StreamingModelspace:
+    """_StreamingModelspace
+
+    Stand-in for the ezdxf modelspace used by `ExportDXF` in streaming mode.
+
+    Provides the subset of the modelspace API used by the ExportDXF converters
+    but writes simple DXF R12 entities straight to a stream with the ezdxf fast
+    R12 writer instead of creating DXF entity objects. Consecutive connected
+    lines with the same attributes are merged into polylines, while ellipses
+    and splines (which don't exist in DXF R12) are approximated by polylines.
+
+    Args:
+        stream (TextIO): destination of the ENTITIES section
+        tolerance (float): maximum deviation of polylines approximating curves
+    """
+
+    def __init__(self, stream, tolerance: float):
+        self._writer = R12FastStreamWriter(stream)
+        self._tolerance = tolerance
+        self._polyline: list[Vec2] = []
+        self._polyline_attribs: dict = {}
+        self._spline_attribs: Optional[dict] = None
+
+    @staticmethod
+    def _attribs(dxfattribs: Optional[dict]) -> dict:
+        """R12 writer keyword arguments of ezdxf style attributes"""
+        return {"layer": (dxfattribs or {}).get("layer", "0")}
+
+    def flush(self):
+        """Write the polyline being accumulated from lines"""
+        points, self._polyline = self._polyline, []
+        if len(points) == 2:
+            self._writer.add_line(points[0], points[1], **self._polyline_attribs)
+        elif len(points) > 2:
+            closed = points[0].isclose(points[-1], abs_tol=TOLERANCE)
+            self._writer.add_polyline_2d(
+                points[:-1] if closed else points,
+                closed=closed,
+                **self._polyline_attribs,
+            )
+
+    def _add_polyline(self, points: Iterable, dxfattribs: Optional[dict]):
+        self.flush()
+        self._polyline = [Vec2(p) for p in points]
+        self._polyline_attribs = self._attribs(dxfattribs)
+        self.flush()
+
+    def add_line(self, start: Vec2, end: Vec2, dxfattribs: Optional[dict] = None):
+        """Add a line, extending the current polyline if connected"""
+        attribs = self._attribs(dxfattribs)
+        if (
+            self._polyline
+            and attribs == self._polyline_attribs
+            and self._polyline[-1].isclose(start, abs_tol=TOLERANCE)
+        ):
+            self._polyline.append(end)
+        else:
+            self.flush()
+            self._polyline = [start, end]
+            self._polyline_attribs = attribs
+
+    def add_circle(
+        self, center: Vec2, radius: float, dxfattribs: Optional[dict] = None
+    ):
+        """Add a circle"""
+        self.flush()
+        self._writer.add_circle(center, radius, **self._attribs(dxfattribs))
+
+    def add_arc(
+        self,
+        center: Vec2,
+        radius: float,
+        start_angle: float,
+        end_angle: float,
+        is_counter_clockwise: bool = True,
+        dxfattribs: Optional[dict] = None,
+    ):
+        """Add an arc, R12 arcs are always counter clockwise"""
+        self.flush()
+        if not is_counter_clockwise:
+            start_angle, end_angle = end_angle, start_angle
+        self._writer.add_arc(
+            center, radius, start_angle, end_angle, **self._attribs(dxfattribs)
+        )
+
+    def add_ellipse(
+        self,
+        center: Vec2,
+        major_axis: Vec2,
+        ratio: float,
+        start_param: float,
+        end_param: float,
+        dxfattribs: Optional[dict] = None,
+    ):
+        """Add an ellipse approximated by a polyline"""
+        ellipse = ezdxf.math.ConstructionEllipse(
+            center,
+            major_axis,
+            ratio=ratio,
+            start_param=start_param,
+            end_param=end_param,
+        )
+        self._add_polyline(ellipse.flattening(self._tolerance), dxfattribs)
+
+    def add_spline(self, dxfattribs: Optional[dict] = None) -> Self:
+        """Add a spline (approximated by a polyline) defined by the construction
+        tool passed to apply_construction_tool"""
+        self._spline_attribs = dxfattribs
+        return self
+
+    def apply_construction_tool(self, spline: ezdxf.math.BSpline):
+        """Add the polyline approximating spline"""
+        self._add_polyline(spline.flattening(self._tolerance), self._spline_attribs)
+
 
 # ---------------------------------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -475,6 +844,13 @@ class ExportDXF(Export2D):
             (stroke width) for shapes, in millimeters. . Defaults to None.
         line_type (Optional[LineType], optional): e default line type for shapes.
             It should be a LineType enum or None.. Defaults to None.
+        streaming (bool, optional): Write simple DXF R12 entities to a temporary
+            file as shapes are added instead of building a DXF document in memory.
+            Connected lines are merged into polylines and ellipses and splines are
+            approximated by polylines. The version and line weights are ignored.
+            The temporary file is released by `close`. Defaults to False.
+        tolerance (float, optional): The maximum deviation of the polylines
+            approximating ellipses and splines in streaming mode. Defaults to 1e-3.
 
 
     Example:
@@ -519,14 +895,33 @@ class ExportDXF(Export2D):
         color: Optional[ColorIndex] = None,
         line_weight: Optional[float] = None,
         line_type: Optional[LineType] = None,
+        streaming: bool = False,
+        tolerance: float = 1e-3,
     ):
         self._non_planar_point_count = 0
+        self._spools: list[weakref.finalize] = []
         if unit not in self._UNITS_LOOKUP:
             raise ValueError(f"unit `{unit.name}` not supported.")
         if unit in ExportDXF.METRIC_UNITS:
             self._linetype_scale = Export2D.LTYPE_SCALE[Unit.MM]
         else:
             self._linetype_scale = 1
+
+        if streaming:
+            self._document = None
+            self._units = self._UNITS_LOOKUP[unit]
+            # name -> (description, pattern) and name -> layer attributes
+            self._linetypes: dict[str, tuple[str, list[float]]] = {}
+            self._layers: dict[str, dict] = {}
+            self._entities = self._spool("cp1252")
+            self._modelspace = _StreamingModelspace(self._entities, tolerance)
+            default_layer = self._layers.setdefault("0", {})
+            if color is not None:
+                default_layer["color"] = color.value
+            if line_type is not None:
+                default_layer["linetype"] = self._linetype(line_type)
+            return
+
         self._document = ezdxf.new(
             dxfversion=version,
             units=self._UNITS_LOOKUP[unit],
@@ -582,7 +977,12 @@ class ExportDXF(Export2D):
         if line_weight is not None:
             kwargs["lineweight"] = round(line_weight * 100)
 
-        self._document.layers.add(name, **kwargs)
+        if self._document is None:
+            # DXF R12 doesn't support line weights
+            kwargs.pop("lineweight", None)
+            self._layers[name] = kwargs
+        else:
+            self._document.layers.add(name, **kwargs)
         return self
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
@@ -591,7 +991,11 @@ class ExportDXF(Export2D):
         """Ensure that the specified LineType has been defined in the document,
         and return its string name."""
         linetype = line_type.value
-        if linetype not in self._document.linetypes:
+        if self._document is None:
+            if linetype not in Export2D.LINETYPE_DEFS:
+                raise ValueError(f"Unknown linetype `{linetype}`.")
+            self._linetypes[linetype] = Export2D.LINETYPE_DEFS[linetype]
+        elif linetype not in self._document.linetypes:
             # The linetype is not in the doc yet.
             # Add it from our available definitions.
             if linetype in Export2D.LINETYPE_DEFS:
@@ -638,8 +1042,27 @@ class ExportDXF(Export2D):
         attributes = {}
         if layer:
             attributes["layer"] = layer
-        for edge in shape.edges():
-            self._convert_edge(edge, attributes)
+        if self._document is not None:
+            for edge in shape.edges():
+                self._convert_edge(edge, attributes)
+            return
+
+        # Convert the edges in wire order such that connected lines can be
+        # merged into polylines, without repeating edges shared by faces
+        converted = TopTools_MapOfShape()
+        for wire in shape.wires():
+            for edge in Export2D._wire_edges(wire, reverse=False):
+                if converted.Add(edge.wrapped):
+                    self._convert_edge(edge, attributes)
+        explorer = TopExp_Explorer(
+            shape.wrapped,
+            ToFind=TopAbs_ShapeEnum.TopAbs_EDGE,
+            ToAvoid=TopAbs_ShapeEnum.TopAbs_WIRE,
+        )
+        while explorer.More():
+            if converted.Add(explorer.Current()):
+                self._convert_edge(Edge(explorer.Current()), attributes)
+            explorer.Next()
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
@@ -652,6 +1075,10 @@ class ExportDXF(Export2D):
             file_name (str): The file name (including path) where the DXF data will
                 be written.
         """
+        if self._document is None:
+            self._write_r12(file_name)
+            return
+
         # Reset the main CAD viewport of the model space to the
         # extents of its entities.
         # https://github.com/gumyr/build123d/issues/382 tracks
@@ -660,6 +1087,45 @@ class ExportDXF(Export2D):
 
         self._document.saveas(file_name)
 
+    def _write_r12(self, file_name: str):
+        """Write the header and tables followed by the streamed entities"""
+        self._modelspace.flush()
+
+        def table(name: str, entries: list[str]) -> str:
+            return (
+                f"0\nTABLE\n2\n{name}\n70\n{len(entries)}\n"
+                f"{''.join(entries)}0\nENDTAB\n"
+            )
+
+        linetypes = {"CONTINUOUS": ("Solid line", [0.0])} | self._linetypes
+        ltype_entries = []
+        for name, (description, pattern) in linetypes.items():
+            pattern = [self._linetype_scale * v for v in pattern]
+            elements = "".join(f"49\n{v}\n" for v in pattern[1:])
+            ltype_entries.append(
+                f"0\nLTYPE\n2\n{name}\n70\n0\n3\n{description}\n72\n65\n"
+                f"73\n{len(pattern) - 1}\n40\n{pattern[0]}\n{elements}"
+            )
+        layer_entries = [
+            f"0\nLAYER\n2\n{name}\n70\n0\n62\n{attributes.get('color', 7)}\n"
+            f"6\n{attributes.get('linetype', 'CONTINUOUS')}\n"
+            for name, attributes in self._layers.items()
+        ]
+
+        with open(file_name, "w", encoding="cp1252") as dxf_file:
+            # $INSUNITS isn't part of R12 but is widely used to find the units
+            dxf_file.write(
+                "0\nSECTION\n2\nHEADER\n9\n$ACADVER\n1\nAC1009\n"
+                f"9\n$INSUNITS\n70\n{self._units}\n0\nENDSEC\n"
+                "0\nSECTION\n2\nTABLES\n"
+                f"{table('LTYPE', ltype_entries)}{table('LAYER', layer_entries)}"
+                "0\nENDSEC\n"
+            )
+            self._entities.seek(0)
+            shutil.copyfileobj(self._entities, dxf_file)
+            self._entities.seek(0, 2)
+            dxf_file.write("0\nENDSEC\n0\nEOF\n")
+
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
     def _convert_point(self, pt: Union[gp_XYZ, gp_Pnt, gp_Vec, Vector]) -> Vec2:
@@ -677,15 +1143,22 @@ class ExportDXF(Export2D):
             self._non_planar_point_count += 1
         return Vec2(x, y)
 
+    def _convert_points(self, points: np.ndarray) -> list[Vec2]:
+        """Create Vec2s from an (n, 3) array of points.
+        This method also checks for points z != 0."""
+        self._non_planar_point_count += int(np.count_nonzero(abs(points[:, 2]) > 1e-6))
+        return [Vec2(x, y) for x, y in points[:, :2].tolist()]
+
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
     def _convert_line(self, edge: Edge, attribs: dict):
         """Converts a Line object into a DXF line entity."""
-        self._modelspace.add_line(
-            self._convert_point(edge.start_point()),
-            self._convert_point(edge.end_point()),
-            attribs,
-        )
+        curve = edge._geom_adaptor()
+        start = self._convert_point(curve.Value(curve.FirstParameter()))
+        end = self._convert_point(curve.Value(curve.LastParameter()))
+        if edge.wrapped.Orientation() == TopAbs_Orientation.TopAbs_REVERSED:
+            start, end = end, start
+        self._modelspace.add_line(start, end, attribs)
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
@@ -745,43 +1218,14 @@ class ExportDXF(Export2D):
 
     def _convert_bspline(self, edge: Edge, attribs):
         """Converts a BSpline object into a DXF spline entity."""
-        # This reduces the B-Spline to degree 3, generally adding
-        # poles and knots to approximate the original.
-        # This also will convert basically any edge into a B-Spline.
-        edge = edge.to_splines()
-
-        # This pulls the underlying Geom_BSplineCurve out of the Edge.
-        # The adaptor also supplies a parameter range for the curve.
-        adaptor = edge._geom_adaptor()
-        curve = adaptor.Curve().Curve()
-        u1 = adaptor.FirstParameter()
-        u2 = adaptor.LastParameter()
-
-        # Extract the relevant segment of the curve.
-        spline = GeomConvert.SplitBSplineCurve_s(
-            curve,
-            u1,
-            u2,
-            Export2D.PARAMETRIC_TOLERANCE,
+        # The cached degree 3 B-Spline approximation of the edge (which
+        # will convert basically any edge into a B-Spline) is placed at
+        # the location of the edge.
+        order, knots, poles, weights = spline_cache.spline(edge).bspline
+        poles = self._convert_points(
+            _transformed(poles, edge.location.wrapped.Transformation())
         )
 
-        # need to apply the transform on the geometry level
-        t = edge.location.wrapped.Transformation()
-        spline.Transform(t)
-
-        order = spline.Degree() + 1
-        knots = list(spline.KnotSequence())
-        poles = [self._convert_point(p) for p in spline.Poles()]
-        weights = (
-            [spline.Weight(i) for i in range(1, spline.NbPoles() + 1)]
-            if spline.IsRational()
-            else None
-        )
-
-        if spline.IsPeriodic():
-            pad = spline.NbKnots() - spline.LastUKnotIndex()
-            poles += poles[:pad]
-
         dxf_spline = ezdxf.math.BSpline(poles, order, knots, weights)
 
         self._modelspace.add_spline(dxfattribs=attribs).apply_construction_tool(
@@ -851,6 +1295,11 @@ class ExportSVG(Export2D):
             Can be either a DotLength enum or a float value in tenths of an inch.
             Defaults to DotLength.INKSCAPE_COMPAT.
 
+    Shapes are converted to SVG elements as they are added and the elements of each
+    layer are spooled to a temporary file such that very large drawings don't have
+    to be held in memory. The temporary files are released by `close`, on leaving
+    a with block or when the exporter is garbage collected. The segments of wires and faces are merged into single
+    path elements with coordinates formatted to `precision` decimal places.
 
     Example:
 
@@ -866,7 +1315,7 @@ class ExportSVG(Export2D):
 
     """
     # pylint: disable=too-many-instance-attributes
-    _Converter = Callable[[Edge], ET.Element]
+    _Converter = Callable[[Edge], str]
 
     # These are the units which are available in the Unit enum *and*
     # are valid units in SVG.
@@ -884,6 +1333,7 @@ class ExportSVG(Export2D):
             line_color: Union[ColorIndex, RGB, None],
             line_weight: float,
             line_type: LineType,
+            elements: SpooledTemporaryFile,
         ):
             def color_from_index(ci: ColorIndex) -> RGB:
                 """The easydxf color indices BLACK and WHITE have the same
@@ -903,7 +1353,14 @@ class ExportSVG(Export2D):
             self.line_color = line_color
             self.line_weight = line_weight
             self.line_type = line_type
-            self.elements: list[ET.Element] = []
+            self.elements = elements
+            self.element_count = 0
+
+        def add_elements(self, elements: list[str]):
+            """Append serialized elements to the layer's spool"""
+            for element in elements:
+                self.elements.write(f"      {element}\n")
+            self.element_count += len(elements)
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
@@ -932,8 +1389,9 @@ class ExportSVG(Export2D):
         self.precision = precision
         self.dot_length = dot_length
         self._non_planar_point_count = 0
+        self._spools: list[weakref.finalize] = []
         self._layers: dict[str, ExportSVG._Layer] = {}
-        self._bounds: BoundBox = None
+        self._bounds = Bnd_Box()  # accumulated bounds of all shapes
 
         # Add the default layer.
         self.add_layer(
@@ -989,6 +1447,7 @@ class ExportSVG(Export2D):
             line_color=line_color,
             line_weight=line_weight,
             line_type=line_type,
+            elements=self._spool("utf-8"),
         )
         self._layers[name] = layer
         return self
@@ -1028,8 +1487,7 @@ class ExportSVG(Export2D):
     def _add_single_shape(self, shape: Shape, layer: _Layer, reverse_wires: bool):
         # pylint: disable=too-many-locals
         self._non_planar_point_count = 0
-        bb = shape.bounding_box()
-        self._bounds = self._bounds.add(bb) if self._bounds else bb
+        self._bounds.Add(shape.bounding_box().wrapped)
         elements = []
 
         # Process Faces.
@@ -1051,8 +1509,7 @@ class ExportSVG(Export2D):
                 for i in inner:
                     segments = self._wire_segments(i, reverse_wires)
                     face_segments.extend(segments)
-                face_path = PT.Path(*face_segments)
-                face_element = ET.Element("path", {"d": face_path.d()})
+                face_element = self._path_element(face_segments)
             elements.append(face_element)
 
         # Process Wires that are not part of Faces.
@@ -1092,7 +1549,7 @@ class ExportSVG(Export2D):
         loose_edge_elements = [self._edge_element(edge) for edge in loose_edges]
         elements.extend(loose_edge_elements)
 
-        layer.elements.extend(elements)
+        layer.add_elements(elements)
         if self._non_planar_point_count > 0:
             print("WARNING, exporting non-planar shape to 2D format.")
             print("  This is probably not what you want.")
@@ -1102,20 +1559,6 @@ class ExportSVG(Export2D):
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    @staticmethod
-    def _wire_edges(wire: Wire, reverse: bool) -> List[Edge]:
-        edges = []
-        explorer = BRepTools_WireExplorer(wire.wrapped)
-        while explorer.More():
-            topo_edge = explorer.Current()
-            edges.append(Edge(topo_edge))
-            explorer.Next()
-        if reverse:
-            edges.reverse()
-        return edges
-
-    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-
     def _wire_segments(self, wire: Wire, reverse: bool) -> list[PathSegment]:
         edges = ExportSVG._wire_edges(wire, reverse)
         wire_segments: list[PathSegment] = []
@@ -1126,7 +1569,7 @@ class ExportSVG(Export2D):
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def _wire_element(self, wire: Wire, reverse: bool) -> ET.Element:
+    def _wire_element(self, wire: Wire, reverse: bool) -> str:
         edges = ExportSVG._wire_edges(wire, reverse)
         if len(edges) == 1:
             wire_element = self._edge_element(edges[0])
@@ -1135,15 +1578,55 @@ class ExportSVG(Export2D):
             for edge in edges:
                 edge_segments = self._edge_segments(edge, reverse)
                 wire_segments.extend(edge_segments)
-            wire_path = PT.Path(*wire_segments)
-            wire_element = ET.Element("path", {"d": wire_path.d()})
+            wire_element = self._path_element(wire_segments)
         return wire_element
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
+    def _number(self, value: float) -> str:
+        """Format a number with at most `precision` decimal places"""
+        text = f"{value:.{self.precision}f}"
+        if "." in text:
+            text = text.rstrip("0").rstrip(".")
+        return "0" if text == "-0" else text
+
+    def _point(self, pt: complex) -> str:
+        """Format a path point as x,y"""
+        return f"{self._number(pt.real)},{self._number(pt.imag)}"
+
+    @staticmethod
+    def _element(tag: str, attributes: dict[str, str]) -> str:
+        """Serialize an empty SVG element"""
+        return f"<{tag} {ExportSVG._attributes(attributes)} />"
+
+    @staticmethod
+    def _start_tag(tag: str, attributes: dict[str, str]) -> str:
+        """Serialize the opening tag of an SVG element"""
+        return f"<{tag} {ExportSVG._attributes(attributes)}>"
+
+    @staticmethod
+    def _attributes(attributes: dict[str, str]) -> str:
+        """Serialize the attributes of an SVG element"""
+        return " ".join(f"{k}={quoteattr(v)}" for k, v in attributes.items())
+
+    def _path_element(self, segments: list[PathSegment]) -> str:
+        """Merge segments into a single SVG path element
+
+        A move command is only required where a segment doesn't start at the end
+        of the previous one."""
+        commands = []
+        current = None
+        for segment in segments:
+            if segment.start != current:
+                commands.append(f"M {self._point(segment.start)}")
+            commands.append(segment.command)
+            current = segment.end
+        return self._element("path", {"d": " ".join(commands)})
+
+    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
     def _path_point(self, pt: Union[gp_Pnt, Vector]) -> complex:
         """Create a complex point from a gp_Pnt or Vector.
-        We are using complex because that is what svgpathtools wants.
         This method also checks for points z != 0."""
         if isinstance(pt, gp_Pnt):
             xyz = pt.X(), pt.Y(), pt.Z()
@@ -1158,37 +1641,61 @@ class ExportSVG(Export2D):
             self._non_planar_point_count += 1
         return complex(x, y)
 
+    def _path_points(self, points: np.ndarray) -> list[complex]:
+        """Create complex points from an (n, 3) array of points.
+        This method also checks for points z != 0."""
+        points = np.round(points, self.precision)
+        self._non_planar_point_count += int(np.count_nonzero(points[:, 2]))
+        return [complex(x, y) for x, y in points[:, :2].tolist()]
+
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def _line_segment(self, edge: Edge, reverse: bool) -> PT.Line:
+    def _line_segment(self, edge: Edge, reverse: bool) -> PathSegment:
         curve = edge._geom_adaptor()
         fp = curve.FirstParameter()
         lp = curve.LastParameter()
         (u0, u1) = (lp, fp) if reverse else (fp, lp)
         p0 = self._path_point(curve.Value(u0))
         p1 = self._path_point(curve.Value(u1))
-        result = PT.Line(p0, p1)
+        result = PathSegment(p0, p1, f"L {self._point(p1)}")
         return result
 
     def _line_segments(self, edge: Edge, reverse: bool) -> list[PathSegment]:
         return [self._line_segment(edge, reverse)]
 
-    def _line_element(self, edge: Edge) -> ET.Element:
+    def _line_element(self, edge: Edge) -> str:
         """Converts a Line object into an SVG line element."""
         segment = self._line_segment(edge, reverse=False)
-        result = ET.Element(
+        result = self._element(
             "line",
             {
-                "x1": str(segment.start.real),
-                "y1": str(segment.start.imag),
-                "x2": str(segment.end.real),
-                "y2": str(segment.end.imag),
+                "x1": self._number(segment.start.real),
+                "y1": self._number(segment.start.imag),
+                "x2": self._number(segment.end.real),
+                "y2": self._number(segment.end.imag),
             },
         )
         return result
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
+    def _arc_segment(
+        self,
+        start: complex,
+        radius: complex,
+        rotation: float,
+        large_arc: bool,
+        sweep: bool,
+        end: complex,
+    ) -> PathSegment:
+        """An elliptical arc path segment"""
+        return PathSegment(
+            start,
+            end,
+            f"A {self._point(radius)} {self._number(rotation)} "
+            f"{int(large_arc)},{int(sweep)} {self._point(end)}",
+        )
+
     def _circle_segments(self, edge: Edge, reverse: bool) -> list[PathSegment]:
         # pylint: disable=too-many-locals
         curve = edge._geom_adaptor()
@@ -1209,14 +1716,16 @@ class ExportSVG(Export2D):
         if curve.IsClosed():
             midway = self._path_point(curve.Value((u0 + u1) / 2))
             result = [
-                PT.Arc(start, radius, rotation, False, sweep, midway),
-                PT.Arc(midway, radius, rotation, False, sweep, end),
+                self._arc_segment(start, radius, rotation, False, sweep, midway),
+                self._arc_segment(midway, radius, rotation, False, sweep, end),
             ]
         else:
-            result = [PT.Arc(start, radius, rotation, large_arc, sweep, end)]
+            result = [
+                self._arc_segment(start, radius, rotation, large_arc, sweep, end)
+            ]
         return result
 
-    def _circle_element(self, edge: Edge) -> ET.Element:
+    def _circle_element(self, edge: Edge) -> str:
         """Converts a Circle object into an SVG circle element."""
         if edge.is_closed:
             curve = edge._geom_adaptor()
@@ -1224,13 +1733,17 @@ class ExportSVG(Export2D):
             radius = circle.Radius()
             center = circle.Location()
             c = self._path_point(center)
-            result = ET.Element(
-                "circle", {"cx": str(c.real), "cy": str(c.imag), "r": str(radius)}
+            result = self._element(
+                "circle",
+                {
+                    "cx": self._number(c.real),
+                    "cy": self._number(c.imag),
+                    "r": self._number(radius),
+                },
             )
         else:
             arcs = self._circle_segments(edge, reverse=False)
-            path = PT.Path(*arcs)
-            result = ET.Element("path", {"d": path.d()})
+            result = self._path_element(arcs)
         return result
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
@@ -1256,88 +1769,62 @@ class ExportSVG(Export2D):
         if curve.IsClosed():
             midway = self._path_point(curve.Value((u0 + u1) / 2))
             result = [
-                PT.Arc(start, radius, rotation, False, sweep, midway),
-                PT.Arc(midway, radius, rotation, False, sweep, end),
+                self._arc_segment(start, radius, rotation, False, sweep, midway),
+                self._arc_segment(midway, radius, rotation, False, sweep, end),
             ]
         else:
-            result = [PT.Arc(start, radius, rotation, large_arc, sweep, end)]
+            result = [
+                self._arc_segment(start, radius, rotation, large_arc, sweep, end)
+            ]
         return result
 
-    def _ellipse_element(self, edge: Edge) -> ET.Element:
+    def _ellipse_element(self, edge: Edge) -> str:
         """Converts an Ellipse object into an SVG ellipse element."""
         arcs = self._ellipse_segments(edge, reverse=False)
-        path = PT.Path(*arcs)
-        result = ET.Element("path", {"d": path.d()})
-        return result
+        return self._path_element(arcs)
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
     def _bspline_segments(self, edge: Edge, reverse: bool) -> list[PathSegment]:
-        # This reduces the B-Spline to degree 3, generally adding
-        # poles and knots to approximate the original.
-        # This also will convert basically any edge into a B-Spline.
-        edge = edge.to_splines()
-
-        # This pulls the underlying Geom_BSplineCurve out of the Edge.
-        # The adaptor also supplies a parameter range for the curve.
-        adaptor = edge._geom_adaptor()
-        spline = adaptor.Curve().Curve()
-        u1 = adaptor.FirstParameter()
-        u2 = adaptor.LastParameter()
-
-        # Apply the shape location to the geometry.
-        t = edge.location.wrapped.Transformation()
-        spline.Transform(t)
-        # describe_bspline(spline)
-
-        # Convert the B-Spline to Bezier curves.
-        # According to the OCCT 7.6.0 documentation,
-        # "ParametricTolerance is not used."
-        converter = GeomConvert_BSplineCurveToBezierCurve(
-            spline, u1, u2, Export2D.PARAMETRIC_TOLERANCE
+        # The cached Bézier curves of the degree 3 B-Spline approximation of
+        # the edge (which will convert basically any edge into a B-Spline)
+        # are placed at the location of the edge.
+        poles, pole_counts = spline_cache.spline(edge).beziers
+        points = self._path_points(
+            _transformed(poles, edge.location.wrapped.Transformation())
         )
-
-        def make_segment(bezier: Geom_BezierCurve, reverse: bool) -> PathSegment:
-            p = [self._path_point(p) for p in bezier.Poles()]
+        commands = {2: "L", 3: "Q", 4: "C"}
+
+        result = []
+        end = 0
+        for count in pole_counts:
+            p = points[end : end + count]
+            end += count
+            if count not in commands:
+                raise ValueError(f"Surprising Bézier of degree {count - 1}!")
             if reverse:
                 p.reverse()
-            if len(p) == 2:
-                result = PT.Line(start=p[0], end=p[1])
-            elif len(p) == 3:
-                result = PT.QuadraticBezier(start=p[0], control=p[1], end=p[2])
-            elif len(p) == 4:
-                result = PT.CubicBezier(
-                    start=p[0], control1=p[1], control2=p[2], end=p[3]
-                )
-            else:
-                raise ValueError(f"Surprising Bézier of degree {bezier.Degree()}!")
-            return result
-
-        result = [
-            make_segment(converter.Arc(i), reverse)
-            for i in range(1, converter.NbArcs() + 1)
-        ]
+            coordinates = " ".join(self._point(pt) for pt in p[1:])
+            result.append(PathSegment(p[0], p[-1], f"{commands[count]} {coordinates}"))
         if reverse:
             result.reverse()
         return result
 
-    def _bspline_element(self, edge: Edge) -> ET.Element:
+    def _bspline_element(self, edge: Edge) -> str:
         """Converts a BSpline object into an SVG path element representing a Bézier curve."""
         segments = self._bspline_segments(edge, reverse=False)
-        path = PT.Path(*segments)
-        result = ET.Element("path", {"d": path.d()})
-        return result
+        return self._path_element(segments)
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
     def _other_segments(self, edge: Edge, reverse: bool):
         # _bspline_segments can actually handle basically anything
-        # because it calls Edge.to_splines() first thing.
+        # because it uses the Edge.to_splines() approximation.
         return self._bspline_segments(edge, reverse)
 
-    def _other_element(self, edge: Edge) -> ET.Element:
+    def _other_element(self, edge: Edge) -> str:
         # _bspline_element can actually handle basically anything
-        # because it calls Edge.to_splines() first thing.
+        # because it uses the Edge.to_splines() approximation.
         return self._bspline_element(edge)
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
@@ -1363,7 +1850,7 @@ class ExportSVG(Export2D):
         GeomType.BSPLINE.name: _bspline_element,
     }
 
-    def _edge_element(self, edge: Edge) -> ET.Element:
+    def _edge_element(self, edge: Edge) -> str:
         geom_type = edge.geom_type()
         element = self._ELEMENT_LOOKUP.get(geom_type, ExportSVG._other_element)
         result = element(self, edge)
@@ -1390,7 +1877,8 @@ class ExportSVG(Export2D):
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def _group_for_layer(self, layer: _Layer, attribs: dict = None) -> ET.Element:
+    def _group_for_layer(self, layer: _Layer, attribs: dict = None) -> str:
+        """The opening tag of the group containing the elements of a layer"""
         if attribs is None:
             attribs = {}
         if layer.fill_color:
@@ -1405,39 +1893,33 @@ class ExportSVG(Export2D):
             stroke = "none"
         lwscale = unit_conversion_scale(Unit.MM, self.unit) / self.scale
         stroke_width = layer.line_weight * lwscale
-        result = ET.Element(
-            "g",
-            attribs
-            | {
-                "fill": fill,
-                "stroke": stroke,
-                "stroke-width": f"{stroke_width}",
-            },
-        )
+        attribs = attribs | {
+            "fill": fill,
+            "stroke": stroke,
+            "stroke-width": f"{stroke_width}",
+        }
         if layer.name:
-            result.set("id", layer.name)
+            attribs["id"] = layer.name
 
         if layer.line_type is not LineType.CONTINUOUS:
             dash_array = self._stroke_dasharray(layer)
-            result.set("stroke-dasharray", " ".join(dash_array))
-
-        for element in layer.elements:
-            result.append(element)
+            attribs["stroke-dasharray"] = " ".join(dash_array)
 
-        return result
+        return self._start_tag("g", attribs)
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
     def write(self, path: str):
         """write
 
-        Writes the SVG data to the specified file path.
+        Writes the SVG data to the specified file path. Paths ending in ``.svgz``
+        are written as gzip compressed SVG.
 
         Args:
             path (str): The file path where the SVG data will be written.
         """
         # pylint: disable=too-many-locals
-        bb = self._bounds
+        bb = BoundBox(self._bounds)
         doc_margin = self.margin
         if self.fit_to_stroke:
             max_line_weight = max(l.line_weight for l in self._layers.values())
@@ -1451,7 +1933,7 @@ class ExportSVG(Export2D):
         doc_width = round(view_width * self.scale, self.precision)
         doc_height = round(view_height * self.scale, self.precision)
         doc_unit = self._UNIT_STRING.get(self.unit, "")
-        svg = ET.Element(
+        svg = self._start_tag(
             "svg",
             {
                 "width": f"{doc_width}{doc_unit}",
@@ -1461,21 +1943,28 @@ class ExportSVG(Export2D):
                 "xmlns": "http://www.w3.org/2000/svg",
             },
         )
-
-        container_group = ET.Element(
+        container_group = self._start_tag(
             "g",
             {
                 "transform": "scale(1,-1)",
                 "stroke-linecap": "round",
             },
         )
-        svg.append(container_group)
-
-        for _, layer in self._layers.items():
-            if layer.elements:
-                layer_group = self._group_for_layer(layer)
-                container_group.append(layer_group)
 
-        xml = ET.ElementTree(svg)
-        ET.indent(xml, "  ")
-        xml.write(path, encoding="utf-8", xml_declaration=True, default_namespace=False)
+        if str(path).endswith(".svgz"):
+            svg_file = gzip.open(path, "wt", encoding="utf-8")
+        else:
+            svg_file = open(path, "w", encoding="utf-8")
+        with svg_file:
+            svg_file.write("<?xml version='1.0' encoding='utf-8'?>\n")
+            svg_file.write(svg + "\n")
+            svg_file.write("  " + container_group + "\n")
+            for _, layer in self._layers.items():
+                if layer.element_count:
+                    svg_file.write("    " + self._group_for_layer(layer) + "\n")
+                    layer.elements.seek(0)
+                    shutil.copyfileobj(layer.elements, svg_file)
+                    layer.elements.seek(0, 2)
+                    svg_file.write("    </g>\n")
+            svg_file.write("  </g>\n")
+            svg_file.write("</svg>\n")
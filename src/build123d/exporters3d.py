@@ -0,0 +1,335 @@
+"""
+build123d 3D exporters
+
+name: exporters3d.py
+by:   Gumyr
+date: Oct 19th 2026
+
+desc:
+    This module provides an exporter for the glTF 2.0 file format in both its
+    binary (.glb) and JSON (.gltf) forms.
+
+    glTF is a compact, GPU ready format intended for delivering 3D content to
+    web browsers and other real time viewers. The exported document mirrors
+    the structure of the build123d object:
+
+        Nodes: every Compound (and each of its children) becomes a node whose
+    transformation matrix is the Location of the object relative to its parent.
+
+        Meshes: leaf shapes are tessellated in their own coordinate system.
+    Shapes that share the same underlying OCCT TShape (e.g. references created
+    with `copy.copy`) are tessellated once and referenced by many
+    nodes - i.e. instancing.
+
+        Materials: the `color` of a Shape (or of its nearest colored parent)
+    becomes a PBR material.
+
+        Buffers: vertex positions, normals and triangle indices are packed
+    directly from numpy arrays into a single binary buffer.
+
+license:
+
+    Copyright 2026 Gumyr
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint has trouble with the OCP imports
+# pylint: disable=no-name-in-module, import-error
+import base64
+import json
+import struct
+from typing import Optional
+
+import numpy as np
+from OCP.TopAbs import TopAbs_ShapeEnum
+from OCP.TopLoc import TopLoc_Location
+from OCP.TopoDS import TopoDS_Iterator, TopoDS_Shape
+
+from build123d.build_enums import Unit
+from build123d.exporters import unit_conversion_scale
+from build123d.geometry import Color
+from build123d.tessellation import tessellation_cache
+from build123d.topology import HASH_CODE_MAX, Compound, Shape
+
+# glTF constants
+_GLB_MAGIC = 0x46546C67  # "glTF"
+_GLB_JSON_CHUNK = 0x4E4F534A  # "JSON"
+_GLB_BIN_CHUNK = 0x004E4942  # "BIN\0"
+_FLOAT = 5126
+_UNSIGNED_SHORT = 5123
+_UNSIGNED_INT = 5125
+_ARRAY_BUFFER = 34962
+_ELEMENT_ARRAY_BUFFER = 34963
+
+
+def _location_matrix(obj: TopoDS_Shape) -> list[float]:
+    """The Location of obj as a column-major glTF matrix"""
+    trsf = obj.Location().Transformation()
+    matrix = []
+    for col in range(1, 5):
+        matrix.extend(trsf.Value(row, col) for row in range(1, 4))
+        matrix.append(1.0 if col == 4 else 0.0)
+    return matrix
+
+
+class _GltfDocument:
+    """Accumulates the glTF json structure and binary buffer"""
+
+    def __init__(self, linear_deflection: float, angular_deflection: float):
+        self.linear_deflection = linear_deflection
+        self.angular_deflection = angular_deflection
+        self.nodes: list[dict] = []
+        self.meshes: list[dict] = []
+        self.materials: list[dict] = []
+        self.accessors: list[dict] = []
+        self.buffer_views: list[dict] = []
+        self.buffer = bytearray()
+        self._material_lut: dict[tuple, int] = {}
+        # hash code -> [(unlocated TopoDS_Shape, material, mesh index)]
+        self._mesh_lut: dict[int, list[tuple[TopoDS_Shape, Optional[int], int]]] = {}
+
+    def _add_accessor(self, data: np.ndarray, target: int, **kwargs) -> int:
+        """Append data to the buffer and create a bufferView and accessor for it"""
+        self.buffer.extend(b"\x00" * (-len(self.buffer) % 4))
+        self.buffer_views.append(
+            {
+                "buffer": 0,
+                "byteOffset": len(self.buffer),
+                "byteLength": data.nbytes,
+                "target": target,
+            }
+        )
+        self.buffer.extend(data.tobytes())
+        self.accessors.append(
+            {"bufferView": len(self.buffer_views) - 1, "count": len(data), **kwargs}
+        )
+        return len(self.accessors) - 1
+
+    def _material(self, color: Optional[Color]) -> Optional[int]:
+        """Find or create the material for color"""
+        if color is None:
+            return None
+        rgba = tuple(round(c, 6) for c in color.to_tuple())
+        if rgba not in self._material_lut:
+            material = {
+                "pbrMetallicRoughness": {
+                    "baseColorFactor": list(rgba),
+                    "metallicFactor": 0.0,
+                    "roughnessFactor": 0.5,
+                }
+            }
+            if rgba[3] < 1.0:
+                material["alphaMode"] = "BLEND"
+            self.materials.append(material)
+            self._material_lut[rgba] = len(self.materials) - 1
+        return self._material_lut[rgba]
+
+    def _mesh(self, obj: TopoDS_Shape, color: Optional[Color]) -> Optional[int]:
+        """Find or create the mesh of an unlocated shape"""
+        material = self._material(color)
+        instances = self._mesh_lut.setdefault(obj.HashCode(HASH_CODE_MAX), [])
+        for other, other_material, mesh_index in instances:
+            if other_material == material and other.IsEqual(obj):
+                return mesh_index
+
+        positions, normals, indices = tessellation_cache.tessellate(
+            obj, self.linear_deflection, self.angular_deflection
+        )
+        if len(indices) == 0:
+            return None
+        positions = positions.astype(np.float32)
+
+        index_type, index_dtype = (
+            (_UNSIGNED_SHORT, np.uint16)
+            if len(positions) <= 0xFFFF
+            else (_UNSIGNED_INT, np.uint32)
+        )
+        primitive = {
+            "attributes": {
+                "POSITION": self._add_accessor(
+                    positions,
+                    _ARRAY_BUFFER,
+                    componentType=_FLOAT,
+                    type="VEC3",
+                    min=positions.min(axis=0).tolist(),
+                    max=positions.max(axis=0).tolist(),
+                ),
+                "NORMAL": self._add_accessor(
+                    normals, _ARRAY_BUFFER, componentType=_FLOAT, type="VEC3"
+                ),
+            },
+            "indices": self._add_accessor(
+                indices.astype(index_dtype).ravel(),
+                _ELEMENT_ARRAY_BUFFER,
+                componentType=index_type,
+                type="SCALAR",
+            ),
+        }
+        if material is not None:
+            primitive["material"] = material
+        self.meshes.append({"primitives": [primitive]})
+        instances.append((obj, material, len(self.meshes) - 1))
+        return len(self.meshes) - 1
+
+    def add_node(
+        self,
+        obj: TopoDS_Shape,
+        label: str = "",
+        color: Optional[Color] = None,
+        children: Optional[list[Shape]] = None,
+    ) -> Optional[int]:
+        """Recursively add obj and its children as nodes
+
+        Args:
+            obj (TopoDS_Shape): OCCT shape with a location relative to its parent
+            label (str, optional): node name. Defaults to "".
+            color (Color, optional): material color. Defaults to None.
+            children (list[Shape], optional): build123d assembly children.
+                Defaults to None.
+
+        Returns:
+            Optional[int]: node index or None if nothing was meshed
+        """
+        node: dict = {}
+        if label:
+            node["name"] = label
+        if not obj.Location().IsIdentity():
+            node["matrix"] = _location_matrix(obj)
+
+        child_nodes = []
+        if children:
+            for child in children:
+                child_nodes.append(
+                    self.add_node(
+                        child.wrapped,
+                        child.label,
+                        child.color if child.color is not None else color,
+                        child.children if isinstance(child, Compound) else None,
+                    )
+                )
+        elif obj.ShapeType() == TopAbs_ShapeEnum.TopAbs_COMPOUND:
+            iterator = TopoDS_Iterator(obj, cumOri=True, cumLoc=False)
+            while iterator.More():
+                child_nodes.append(self.add_node(iterator.Value(), color=color))
+                iterator.Next()
+        else:
+            mesh = self._mesh(obj.Located(TopLoc_Location()), color)
+            if mesh is not None:
+                node["mesh"] = mesh
+
+        child_nodes = [c for c in child_nodes if c is not None]
+        if child_nodes:
+            node["children"] = child_nodes
+        if "mesh" not in node and not child_nodes:
+            return None
+
+        self.nodes.append(node)
+        return len(self.nodes) - 1
+
+    def to_json(self, root: int, buffer_uri: Optional[str] = None) -> dict:
+        """The glTF json structure"""
+        buffer = {"byteLength": len(self.buffer)}
+        if buffer_uri is not None:
+            buffer["uri"] = buffer_uri
+        document = {
+            "asset": {"version": "2.0", "generator": "build123d"},
+            "scene": 0,
+            "scenes": [{"nodes": [root]}],
+            "nodes": self.nodes,
+            "meshes": self.meshes,
+            "accessors": self.accessors,
+            "bufferViews": self.buffer_views,
+            "buffers": [buffer],
+        }
+        if self.materials:
+            document["materials"] = self.materials
+        return document
+
+
+def export_gltf(
+    to_export: Shape,
+    file_path: str,
+    unit: Unit = Unit.MM,
+    binary: bool = True,
+    linear_deflection: float = 0.001,
+    angular_deflection: float = 0.1,
+) -> bool:
+    """export_gltf
+
+    Export a shape or assembly to a glTF 2.0 file. Compounds (and their children)
+    become a hierarchy of nodes positioned by their Locations, shapes sharing the
+    same underlying geometry are meshed once and instanced, and Shape colors are
+    converted to materials. As glTF is a meter based, y-up format the model is
+    scaled from `unit` to meters and rotated such that +Z becomes +Y.
+
+    Args:
+        to_export (Shape): object or assembly to export
+        file_path (str): glTF file path, typically ending in .glb or .gltf
+        unit (Unit, optional): model units. Defaults to Unit.MM.
+        binary (bool, optional): write a binary .glb file (True) or a .gltf json
+            file with an embedded buffer (False). Defaults to True.
+        linear_deflection (float, optional): relative mesh control for edges.
+            Defaults to 0.001.
+        angular_deflection (float, optional): mesh control for non-planar surfaces.
+            Defaults to 0.1.
+
+    Raises:
+        ValueError: no faces to export
+
+    Returns:
+        bool: Success
+    """
+    document = _GltfDocument(linear_deflection, angular_deflection)
+    shape_node = document.add_node(
+        to_export.wrapped,
+        to_export.label,
+        to_export.color,
+        to_export.children if isinstance(to_export, Compound) else None,
+    )
+    if shape_node is None:
+        raise ValueError(f"{to_export} has no faces to export")
+
+    # Convert from build123d units with +Z up to glTF meters with +Y up
+    scale = unit_conversion_scale(unit, Unit.M)
+    document.nodes.append(
+        {
+            "matrix": [scale, 0, 0, 0, 0, 0, -scale, 0, 0, scale, 0, 0, 0, 0, 0, 1],
+            "children": [shape_node],
+        }
+    )
+    root = len(document.nodes) - 1
+
+    if binary:
+        json_chunk = json.dumps(document.to_json(root), separators=(",", ":")).encode(
+            "utf-8"
+        )
+        json_chunk += b" " * (-len(json_chunk) % 4)
+        bin_chunk = bytes(document.buffer) + b"\x00" * (-len(document.buffer) % 4)
+        with open(file_path, "wb") as gltf_file:
+            gltf_file.write(
+                struct.pack(
+                    "<III", _GLB_MAGIC, 2, 12 + 8 + len(json_chunk) + 8 + len(bin_chunk)
+                )
+            )
+            gltf_file.write(struct.pack("<II", len(json_chunk), _GLB_JSON_CHUNK))
+            gltf_file.write(json_chunk)
+            gltf_file.write(struct.pack("<II", len(bin_chunk), _GLB_BIN_CHUNK))
+            gltf_file.write(bin_chunk)
+    else:
+        uri = "data:application/octet-stream;base64," + base64.b64encode(
+            document.buffer
+        ).decode("ascii")
+        with open(file_path, "w", encoding="utf-8") as gltf_file:
+            json.dump(document.to_json(root, uri), gltf_file)
+
+    return True
@@ -0,0 +1,378 @@
+"""
+build123d fonts
+
+name: fonts.py
+by:   Gumyr
+date: Oct 19th 2026
+
+desc:
+    This module caches the fonts and glyph outlines used to create text.
+
+    Finding a font with the OCCT font manager, loading it and converting the
+    outline of each glyph into planar faces is expensive compared to the cost
+    of placing those faces. The GlyphCache keeps the loaded fonts and the
+    faces (and bounding box) of every glyph that has been rendered such that
+    text is assembled by positioning cached glyphs with the kerning and line
+    layout of the OCCT text formatter. Outlines are rendered once at a
+    reference size and scaled to the size of the text so text of any size
+    shares the rendered glyphs. Optionally, the outlines can also be stored on
+    disk in a binary BRep format such that they persist between runs.
+
+license:
+
+    Copyright 2026 Gumyr
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint has trouble with the OCP imports
+# pylint: disable=no-name-in-module, import-error
+import hashlib
+import logging
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from OCP.Bnd import Bnd_Box
+from OCP.BinTools import BinTools
+from OCP.BRepBndLib import BRepBndLib
+from OCP.BRepBuilderAPI import BRepBuilderAPI_Transform
+from OCP.Font import (
+    Font_FA_Bold,
+    Font_FA_Italic,
+    Font_FA_Regular,
+    Font_FontMgr,
+    Font_SystemFont,
+    Font_TextFormatter,
+)
+from OCP.gp import gp_Pnt, gp_Trsf, gp_Vec
+from OCP.Graphic3d import Graphic3d_HTA_LEFT, Graphic3d_VTA_BOTTOM
+from OCP.NCollection import NCollection_Utf8String
+from OCP.Standard import Standard_Failure
+from OCP.StdPrs import StdPrs_BRepFont
+from OCP.Storage import Storage_StreamReadError
+from OCP.TCollection import TCollection_AsciiString
+from OCP.TopAbs import TopAbs_ShapeEnum
+from OCP.TopExp import TopExp_Explorer
+from OCP.TopoDS import TopoDS, TopoDS_Face, TopoDS_Shape
+
+from build123d.build_enums import FontStyle
+
+logger = logging.getLogger("build123d")
+
+# The OCCT font manager finds the system fonts with fontconfig. The environment
+# is only modified here - once on import and without overriding the user's
+# settings - as changing it while other threads are running isn't safe.
+if sys.platform.startswith("linux"):
+    os.environ.setdefault("FONTCONFIG_FILE", "/etc/fonts/fonts.conf")
+    os.environ.setdefault("FONTCONFIG_PATH", "/etc/fonts/")
+
+# Glyph outlines are rendered at this size and scaled to the size of the text
+FONT_REFERENCE_SIZE = 1.0
+
+
+class Glyph(NamedTuple):
+    """The outline of a character at the origin, its faces and bounding boxes"""
+
+    shape: TopoDS_Shape
+    bounding_box: Bnd_Box
+    faces: tuple[tuple[TopoDS_Face, Bnd_Box], ...]
+
+
+class PlacedGlyph(NamedTuple):
+    """A glyph and its translation within a string"""
+
+    glyph: Glyph
+    position: gp_Trsf
+
+
+class GlyphCache:
+    """GlyphCache
+
+    Process wide cache of fonts and glyph outlines used by `Compound.make_text`.
+    OCCT fonts can't render glyphs in multiple threads at once so the cache
+    serializes access to them.
+
+    Args:
+        cache_dir (str, optional): directory used to persist glyphs between runs.
+            Defaults to None (memory only).
+        max_size (int, optional): maximum number of glyphs scaled to a font size
+            retained, the least recently used are discarded first. Defaults to 4096.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size: int = 4096):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        # (font, font_path, font_style) -> (StdPrs_BRepFont, font id)
+        self._fonts: dict[tuple, tuple[StdPrs_BRepFont, str]] = {}
+        # (font id, character) -> Glyph at the reference size or None for invisible
+        # characters
+        self._outlines: dict[tuple, Optional[Glyph]] = {}
+        # (font id, font_size, character) -> Glyph scaled to font_size
+        self._glyphs: OrderedDict[tuple, Optional[Glyph]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Number of cached glyph outlines"""
+        return len(self._outlines)
+
+    def clear(self):
+        """Remove all of the cached fonts and glyphs from memory"""
+        with self._lock:
+            self._fonts.clear()
+            self._outlines.clear()
+            self._glyphs.clear()
+
+    def font(
+        self,
+        font: str = "Arial",
+        font_path: Optional[str] = None,
+        font_style: FontStyle = FontStyle.REGULAR,
+    ) -> tuple[StdPrs_BRepFont, str]:
+        """font
+
+        Find, load and cache a font at FONT_REFERENCE_SIZE.
+
+        Args:
+            font (str, optional): font name. Defaults to "Arial".
+            font_path (str, optional): path to font file. Defaults to None.
+            font_style (FontStyle, optional): text style. Defaults to FontStyle.REGULAR.
+
+        Returns:
+            tuple[StdPrs_BRepFont, str]: the font and a string identifying it
+        """
+        with self._lock:
+            return self._font(font, font_path, font_style)
+
+    def _font(
+        self,
+        font: str,
+        font_path: Optional[str],
+        font_style: FontStyle,
+    ) -> tuple[StdPrs_BRepFont, str]:
+        """Find, load and cache a font while holding the lock"""
+        key = (font, font_path, font_style)
+        if key in self._fonts:
+            return self._fonts[key]
+
+        font_kind = {
+            FontStyle.REGULAR: Font_FA_Regular,
+            FontStyle.BOLD: Font_FA_Bold,
+            FontStyle.ITALIC: Font_FA_Italic,
+        }[font_style]
+
+        mgr = Font_FontMgr.GetInstance_s()
+
+        if font_path and mgr.CheckFont(TCollection_AsciiString(font_path).ToCString()):
+            font_t = Font_SystemFont(TCollection_AsciiString(font_path))
+            font_t.SetFontPath(font_kind, TCollection_AsciiString(font_path))
+            mgr.RegisterFont(font_t, True)
+
+        else:
+            font_t = mgr.FindFont(TCollection_AsciiString(font), font_kind)
+
+        logger.info(
+            "Creating text with font %s located at %s",
+            font_t.FontName().ToCString(),
+            font_t.FontPath(font_kind).ToCString(),
+        )
+
+        brep_font = StdPrs_BRepFont(
+            NCollection_Utf8String(font_t.FontName().ToCString()),
+            font_kind,
+            FONT_REFERENCE_SIZE,
+        )
+        font_id = f"{font_t.FontPath(font_kind).ToCString()}|{font_style.name}"
+        self._fonts[key] = (brep_font, font_id)
+        return self._fonts[key]
+
+    def _glyph_file(self, font_id: str, char: str) -> str:
+        """The on disk location of a glyph outline"""
+        digest = hashlib.sha256(
+            f"{font_id}|{FONT_REFERENCE_SIZE!r}|{ord(char)}".encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self.cache_dir, digest + ".bin")
+
+    def _read_outline(self, font_id: str, char: str) -> Optional[TopoDS_Shape]:
+        """Read a glyph outline from disk, None if missing or unreadable"""
+        glyph_file = self._glyph_file(font_id, char)
+        if not os.path.exists(glyph_file):
+            return None
+        shape = TopoDS_Shape()
+        try:
+            BinTools.Read_s(shape, glyph_file)
+        except (Standard_Failure, Storage_StreamReadError):
+            logger.warning("Ignoring corrupt glyph cache file %s", glyph_file)
+            return None
+        return None if shape.IsNull() else shape
+
+    def _write_outline(self, font_id: str, char: str, shape: TopoDS_Shape):
+        """Store a glyph outline on disk"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write to a temporary file first such that readers never see a partial glyph
+        handle, temp_file = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+        os.close(handle)
+        try:
+            BinTools.Write_s(shape, temp_file)
+            os.replace(temp_file, self._glyph_file(font_id, char))
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+    def _outline(
+        self, brep_font: StdPrs_BRepFont, font_id: str, char: str
+    ) -> Optional[Glyph]:
+        """Return the (cached) outline of a character at the reference size"""
+        key = (font_id, char)
+        if key in self._outlines:
+            return self._outlines[key]
+
+        shape = None
+        if self.cache_dir is not None:
+            shape = self._read_outline(font_id, char)
+
+        if shape is None:
+            shape = brep_font.RenderGlyph(char)
+            if not shape.IsNull() and self.cache_dir is not None:
+                self._write_outline(font_id, char, shape)
+
+        if shape.IsNull():
+            glyph = None
+        else:
+            bounding_box = Bnd_Box()
+            faces = []
+            explorer = TopExp_Explorer(shape, TopAbs_ShapeEnum.TopAbs_FACE)
+            while explorer.More():
+                face_box = Bnd_Box()
+                BRepBndLib.AddOptimal_s(explorer.Current(), face_box, False, False)
+                faces.append((TopoDS.Face_s(explorer.Current()), face_box))
+                bounding_box.Add(face_box)
+                explorer.Next()
+            glyph = Glyph(shape, bounding_box, tuple(faces))
+        self._outlines[key] = glyph
+        return glyph
+
+    def glyph(
+        self, brep_font: StdPrs_BRepFont, font_id: str, font_size: float, char: str
+    ) -> Optional[Glyph]:
+        """glyph
+
+        Return the (cached) outline of a character scaled to font_size.
+
+        Args:
+            brep_font (StdPrs_BRepFont): font used to render the glyph
+            font_id (str): string identifying the font as returned by `font`
+            font_size (float): size of the font in model units
+            char (str): character to render
+
+        Returns:
+            Optional[Glyph]: the glyph or None for invisible characters
+        """
+        with self._lock:
+            return self._glyph(brep_font, font_id, font_size, char)
+
+    def _glyph(
+        self, brep_font: StdPrs_BRepFont, font_id: str, font_size: float, char: str
+    ) -> Optional[Glyph]:
+        """Return the (cached) outline of a character while holding the lock"""
+        key = (font_id, float(font_size), char)
+        if key in self._glyphs:
+            self._glyphs.move_to_end(key)
+            return self._glyphs[key]
+
+        outline = self._outline(brep_font, font_id, char)
+        if outline is None or font_size == FONT_REFERENCE_SIZE:
+            glyph = outline
+        else:
+            # Scaling the outline is much cheaper than rendering the glyph again
+            scale = gp_Trsf()
+            scale.SetScale(gp_Pnt(0, 0, 0), font_size / FONT_REFERENCE_SIZE)
+            shape = BRepBuilderAPI_Transform(outline.shape, scale, True).Shape()
+            faces = []
+            explorer = TopExp_Explorer(shape, TopAbs_ShapeEnum.TopAbs_FACE)
+            for _face, face_box in outline.faces:
+                faces.append(
+                    (TopoDS.Face_s(explorer.Current()), face_box.Transformed(scale))
+                )
+                explorer.Next()
+            glyph = Glyph(shape, outline.bounding_box.Transformed(scale), tuple(faces))
+        self._glyphs[key] = glyph
+        while len(self._glyphs) > self.max_size:
+            self._glyphs.popitem(last=False)
+        return glyph
+
+    def layout(
+        self,
+        txt: str,
+        font_size: float,
+        font: str = "Arial",
+        font_path: Optional[str] = None,
+        font_style: FontStyle = FontStyle.REGULAR,
+    ) -> tuple[list[PlacedGlyph], Bnd_Box]:
+        """layout
+
+        Position the glyphs of a (multi-line) string with kerning.
+
+        Args:
+            txt (str): text to be rendered
+            font_size (float): size of the font in model units
+            font (str, optional): font name. Defaults to "Arial".
+            font_path (str, optional): path to font file. Defaults to None.
+            font_style (FontStyle, optional): text style. Defaults to FontStyle.REGULAR.
+
+        Returns:
+            tuple[list[PlacedGlyph], Bnd_Box]: the visible glyphs and the bounding box
+                of the text
+        """
+        with self._lock:
+            return self._layout(txt, font_size, font, font_path, font_style)
+
+    def _layout(
+        self,
+        txt: str,
+        font_size: float,
+        font: str,
+        font_path: Optional[str],
+        font_style: FontStyle,
+    ) -> tuple[list[PlacedGlyph], Bnd_Box]:
+        """Position the glyphs of a string while holding the lock"""
+        brep_font, font_id = self.font(font, font_path, font_style)
+        scale = brep_font.Scale() * font_size / FONT_REFERENCE_SIZE
+
+        formatter = Font_TextFormatter()
+        formatter.SetupAlignment(Graphic3d_HTA_LEFT, Graphic3d_VTA_BOTTOM)
+        formatter.Append(NCollection_Utf8String(txt), brep_font.FTFont())
+        formatter.Format()
+
+        placed_glyphs = []
+        bounding_box = Bnd_Box()
+        for i, char in enumerate(txt):
+            if Font_TextFormatter.IsCommandSymbol_s(
+                char
+            ) or Font_TextFormatter.IsSeparatorSymbol_s(char):
+                continue
+            glyph = self.glyph(brep_font, font_id, font_size, char)
+            if glyph is None:
+                continue
+            pen = formatter.BottomLeft(i)
+            position = gp_Trsf()
+            position.SetTranslation(gp_Vec(pen.x() * scale, pen.y() * scale, 0))
+            placed_glyphs.append(PlacedGlyph(glyph, position))
+            bounding_box.Add(glyph.bounding_box.Transformed(position))
+
+        return placed_glyphs, bounding_box
+
+
+glyph_cache = GlyphCache()
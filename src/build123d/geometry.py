@@ -55,7 +55,6 @@ from OCP.BRepBndLib import BRepBndLib
 from OCP.BRepBuilderAPI import BRepBuilderAPI_MakeFace
 from OCP.BRepGProp import BRepGProp, BRepGProp_Face  # used for mass calculation
 from OCP.BRepMesh import BRepMesh_IncrementalMesh
-from OCP.BRepTools import BRepTools
 from OCP.Geom import Geom_Line, Geom_Plane
 from OCP.GeomAPI import GeomAPI_ProjectPointOnSurf, GeomAPI_IntCS
 from OCP.gp import (
@@ -81,6 +80,8 @@ from OCP.TopLoc import TopLoc_Location
 from OCP.TopoDS import TopoDS_Face, TopoDS_Shape
 
 from build123d.build_enums import Align, Intrinsic, Extrinsic
+from build123d.parallel import occt_parallel
+from build123d.tessellation import mesh_lock
 
 # Create a build123d logger to distinguish these logs from application logs.
 # If the user doesn't configure logging, all build123d logs will be discarded.
@@ -801,26 +802,28 @@ class BoundBox:
         Returns:
 
         """
-        BRepTools.Clean_s(shape)  # Remove mesh which may impact bbox
-
         tolerance = TOL if tolerance is None else tolerance  # tol = TOL (by default)
         bbox = Bnd_Box()
         bbox_obb = Bnd_OBB()
 
         if optimal:
-            # this is 'exact' but expensive
+            # this is 'exact' but expensive - any existing mesh is ignored (not removed)
             if oriented:
                 BRepBndLib.AddOBB_s(shape, bbox_obb, False, True, False)
             else:
-                BRepBndLib.AddOptimal_s(shape, bbox)
+                BRepBndLib.AddOptimal_s(shape, bbox, False, False)
         else:
-            mesh = BRepMesh_IncrementalMesh(shape, tolerance, True)
-            mesh.Perform()
-            # this is adds +margin but is faster
-            if oriented:
-                BRepBndLib.AddOBB_s(shape, bbox_obb)
-            else:
-                BRepBndLib.Add_s(shape, bbox, True)
+            with mesh_lock:
+                with occt_parallel("mesh") as parallel:
+                    mesh = BRepMesh_IncrementalMesh(
+                        shape, tolerance, True, 0.5, parallel
+                    )
+                    mesh.Perform()
+                # this is adds +margin but is faster
+                if oriented:
+                    BRepBndLib.AddOBB_s(shape, bbox_obb)
+                else:
+                    BRepBndLib.Add_s(shape, bbox, True)
 
         return cls(bbox_obb) if oriented else cls(bbox)
 
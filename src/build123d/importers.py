@@ -28,22 +28,49 @@ license:
 # pylint has trouble with the OCP imports
 # pylint: disable=no-name-in-module, import-error
 
+import hashlib
+import io
+import logging
+import lzma
+import mmap
 import os
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from math import degrees
 from pathlib import Path
-from typing import TextIO, Union
+from typing import BinaryIO, Iterator, Optional, TextIO, Union
 
 import OCP.IFSelect
+from OCP.BinTools import BinTools
 from OCP.BRep import BRep_Builder
 from OCP.BRepTools import BRepTools
+from OCP.Interface import Interface_Static
 from OCP.RWStl import RWStl
+from OCP.Standard import Standard_Failure
 from OCP.STEPControl import STEPControl_Reader
-from OCP.TopoDS import TopoDS_Face, TopoDS_Shape, TopoDS_Wire
+from OCP.Storage import Storage_StreamReadError
+from OCP.TopoDS import (
+    TopoDS_Compound,
+    TopoDS_Face,
+    TopoDS_Iterator,
+    TopoDS_Shape,
+    TopoDS_Wire,
+)
 from ocpsvg import ColorAndLabel, import_svg_document
 from svgpathtools import svg2paths
 
 from build123d.geometry import Color
-from build123d.topology import Compound, Face, Shape, ShapeList, Wire
+from build123d.topology import (
+    Compound,
+    Face,
+    Shape,
+    ShapeList,
+    Wire,
+    bin_brep_format,
+)
+
+logger = logging.getLogger("build123d")
 
 def import_brep(file_name: str) -> Shape:
     """Import shape from a BREP file
@@ -51,12 +78,18 @@ def import_brep(file_name: str) -> Shape:
     Args:
         file_name (str): brep file
 
+    Files with a binary BRep extension (e.g. ``.bin`` or ``.bbrep.xz``) are
+    read with `import_bin_brep`.
+
     Raises:
         ValueError: file not found
 
     Returns:
         Shape: build123d object
     """
+    if bin_brep_format(file_name)[0]:
+        return import_bin_brep(file_name)
+
     shape = TopoDS_Shape()
     builder = BRep_Builder()
 
@@ -68,39 +101,261 @@ def import_brep(file_name: str) -> Shape:
     return Shape.cast(shape)
 
 
-def import_step(file_name: str) -> Compound:
-    """import_step
+def _decompress_bin_brep(data: Union[bytes, bytearray, memoryview, mmap.mmap]):
+    """Decompress zlib or lzma compressed data, otherwise return it unchanged"""
+    if data[:6] == b"\xfd7zXZ\x00":
+        return lzma.decompress(data)
+    # Uncompressed files start with a new line and "Open CASCADE Topology"
+    if data[:1] == b"\x78":
+        return zlib.decompress(data)
+    return data
 
-    Extract shapes from a STEP file and return them as a Compound object.
+
+def import_bin_brep(
+    source: Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap, BinaryIO]
+) -> Shape:
+    """import_bin_brep
+
+    Import a shape from a binary BREP file as written by `Shape.export_bin_brep`.
+    The source may be a file, the content of a file (e.g. a memory-mapped file)
+    or a binary stream. Compressed (zlib or lzma) files are detected automatically.
 
     Args:
-        file_name (str): file path of STEP file to import
+        source (Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap,
+            BinaryIO]): binary brep file name, content or stream
 
     Raises:
-        ValueError: can't open file
+        ValueError: Could not import file
 
     Returns:
-        Compound: contents of STEP file
+        Shape: build123d object
     """
-    # Now read and return the shape
+    if isinstance(source, (str, os.PathLike)):
+        if not os.path.isfile(source):
+            raise ValueError(f"Could not import {source}")
+        with open(source, "rb") as bin_brep_file, mmap.mmap(
+            bin_brep_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as memory_map:
+            return import_bin_brep(memory_map)
+
+    if not isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        source = source.read()
+    data = _decompress_bin_brep(source)
+    if isinstance(data, mmap.mmap):
+        # OCCT reads directly from the memory map
+        data.seek(0)
+    else:
+        data = io.BytesIO(data)
+
+    shape = TopoDS_Shape()
+    try:
+        BinTools.Read_s(shape, data)
+    except (Standard_Failure, Storage_StreamReadError) as error:
+        raise ValueError("Could not import binary BREP") from error
+    if shape.IsNull():
+        raise ValueError("Could not import binary BREP")
+
+    return Shape.cast(shape)
+
+
+# Reader parameters that change the result of a STEP transfer
+_STEP_READER_OPTIONS = (
+    "read.precision.mode",
+    "read.precision.val",
+    "read.maxprecision.mode",
+    "read.maxprecision.val",
+    "read.surfacecurve.mode",
+    "read.step.product.mode",
+    "read.step.assembly.level",
+    "read.step.shape.repr",
+    "read.step.nonmanifold",
+    "read.step.root.transformation",
+    "xstep.cascade.unit",
+)
+
+
+def _read_step_file(file_name: str) -> STEPControl_Reader:
+    """Parse a STEP file ready for the transfer of its roots"""
     reader = STEPControl_Reader()
-    read_status = reader.ReadFile(file_name)
+    read_status = reader.ReadFile(str(file_name))
     # pylint fails to understand OCP's module here, so suppress on the next line.
-    if read_status != OCP.IFSelect.IFSelect_RetDone: # pylint: disable=no-member
+    if read_status != OCP.IFSelect.IFSelect_RetDone:  # pylint: disable=no-member
+        raise ValueError(f"STEP File {file_name} could not be loaded")
+    return reader
+
+
+def _transfer_step_roots(
+    reader: STEPControl_Reader, roots: range
+) -> Iterator[TopoDS_Shape]:
+    """Transfer the given (one based) roots, yielding the shapes as they are created"""
+    for root in roots:
+        shape_count = reader.NbShapes()
+        reader.TransferRoot(root)
+        for i in range(shape_count, reader.NbShapes()):
+            yield reader.Shape(i + 1)
+
+
+def _transfer_step_chunk(file_name: str, roots: range) -> list[TopoDS_Shape]:
+    """Parse a STEP file and transfer some of its roots in a worker process"""
+    return list(_transfer_step_roots(_read_step_file(file_name), roots))
+
+
+def _step_cache_file(file_name: str, cache: Union[bool, str]) -> str:
+    """The location of the binary BRep cache of a STEP file
+
+    The key combines the content of the file and the reader options such that
+    a changed file or different reader settings never load a stale result.
+    """
+    STEPControl_Reader()  # registers the reader parameters
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as step_file:
+        for block in iter(lambda: step_file.read(1 << 20), b""):
+            digest.update(block)
+    for option in _STEP_READER_OPTIONS:
+        if Interface_Static.IsPresent_s(option):
+            digest.update(f"|{option}={Interface_Static.CVal_s(option)}".encode())
+    key = digest.hexdigest()
+
+    if cache is True:
+        return f"{file_name}.{key[:16]}.bin"
+    return os.path.join(cache, key + ".bin")
+
+
+def _read_step_cache(cache_file: str) -> Optional[TopoDS_Shape]:
+    """Read the cache of a STEP file, None if missing or unreadable
+
+    A corrupt cache is removed such that the STEP file is parsed (and the cache
+    rewritten) instead.
+    """
+    if not os.path.exists(cache_file):
+        return None
+    compound = TopoDS_Shape()
+    try:
+        BinTools.Read_s(compound, cache_file)
+    except (Standard_Failure, Storage_StreamReadError):
+        compound = TopoDS_Shape()
+    if compound.IsNull():
+        logger.warning("Removing corrupt STEP cache file %s", cache_file)
+        try:
+            os.remove(cache_file)
+        except OSError:
+            pass
+        return None
+    return compound
+
+
+def import_step_roots(
+    file_name: str, cache: Union[bool, str] = False, max_workers: Optional[int] = 1
+) -> Iterator[Shape]:
+    """import_step_roots
+
+    Lazily extract the shapes from a STEP file, yielding each shape as soon as
+    the root it belongs to has been transferred.
+
+    The transferred shapes can be cached as a binary BRep file such that
+    subsequent imports of the same file skip the (slow) STEP translation. The
+    cache is keyed by the content of the STEP file and the reader options and
+    is written once all of the shapes have been consumed. The
+    roots of a large STEP file are independent and may be transferred in
+    parallel; as OCCT's STEP reader isn't thread safe, each worker process
+    parses the file itself so this only pays off for files with many roots.
+
+    Args:
+        file_name (str): file path of STEP file to import
+        cache (Union[bool, str], optional): True to store the cache next to the
+            STEP file or the path of a cache directory. Defaults to False.
+        max_workers (int, optional): number of processes used to transfer the
+            roots, None for one per CPU. Defaults to 1.
+
+    Raises:
+        ValueError: can't open file
+
+    Yields:
+        Iterator[Shape]: the shapes of the STEP file
+    """
+    file_name = os.fspath(file_name)
+    if not os.path.isfile(file_name):
         raise ValueError(f"STEP File {file_name} could not be loaded")
-    for i in range(reader.NbRootsForTransfer()):
-        reader.TransferRoot(i + 1)
+
+    cache_file = _step_cache_file(file_name, cache) if cache else None
+    compound = _read_step_cache(cache_file) if cache_file is not None else None
+    if compound is not None:
+        iterator = TopoDS_Iterator(compound)
+        while iterator.More():
+            yield Shape.cast(iterator.Value())
+            iterator.Next()
+        return
+
+    reader = _read_step_file(file_name)
+    root_count = reader.NbRootsForTransfer()
+    workers = max(1, min(max_workers or os.cpu_count() or 1, root_count))
+    chunk_size = -(-root_count // workers)
+    chunks = [
+        range(first, min(first + chunk_size, root_count + 1))
+        for first in range(1, root_count + 1, max(chunk_size, 1))
+    ]
 
     occ_shapes = []
-    for i in range(reader.NbShapes()):
-        occ_shapes.append(reader.Shape(i + 1))
+    if len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=len(chunks) - 1) as executor:
+            futures = [
+                executor.submit(_transfer_step_chunk, file_name, roots)
+                for roots in chunks[1:]
+            ]
+            # The first chunk is transferred while the workers parse the file
+            for occ_shape in _transfer_step_roots(reader, chunks[0]):
+                occ_shapes.append(occ_shape)
+                yield Shape.cast(occ_shape)
+            for future in futures:
+                for occ_shape in future.result():
+                    occ_shapes.append(occ_shape)
+                    yield Shape.cast(occ_shape)
+    else:
+        for occ_shape in _transfer_step_roots(reader, range(1, root_count + 1)):
+            occ_shapes.append(occ_shape)
+            yield Shape.cast(occ_shape)
+
+    if cache_file is not None:
+        compound = TopoDS_Compound()
+        builder = BRep_Builder()
+        builder.MakeCompound(compound)
+        for occ_shape in occ_shapes:
+            builder.Add(compound, occ_shape)
+        cache_dir = os.path.dirname(os.path.abspath(cache_file))
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary file first such that readers never see a partial cache
+        handle, temp_file = tempfile.mkstemp(suffix=".bin", dir=cache_dir)
+        os.close(handle)
+        try:
+            BinTools.Write_s(compound, temp_file)
+            os.replace(temp_file, cache_file)
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+
+def import_step(
+    file_name: str, cache: Union[bool, str] = False, max_workers: Optional[int] = 1
+) -> Compound:
+    """import_step
+
+    Extract shapes from a STEP file and return them as a Compound object.
+
+    Args:
+        file_name (str): file path of STEP file to import
+        cache (Union[bool, str], optional): True to cache the translated shapes
+            as a binary BRep file next to the STEP file or the path of a cache
+            directory. Defaults to False.
+        max_workers (int, optional): number of processes used to transfer the
+            roots of the STEP file, None for one per CPU. Defaults to 1.
 
-    # Make sure that we extract all the solids
-    solids = []
-    for shape in occ_shapes:
-        solids.append(Shape.cast(shape))
+    Raises:
+        ValueError: can't open file
 
-    return Compound.make_compound(solids)
+    Returns:
+        Compound: contents of STEP file
+    """
+    return Compound.make_compound(list(import_step_roots(file_name, cache, max_workers)))
 
 
 def import_stl(file_name: str) -> Face:
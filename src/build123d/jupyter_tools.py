@@ -23,15 +23,53 @@ license:
 
 """
 # pylint: disable=no-name-in-module
+import threading
+from base64 import b64encode
+from collections import OrderedDict
 from json import dumps
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 from IPython.display import Javascript
+from OCP.TopAbs import TopAbs_ShapeEnum
+from OCP.TopLoc import TopLoc_Location
+from OCP.TopoDS import TopoDS_Iterator, TopoDS_Shape
+from vtkmodules.util.numpy_support import (
+    numpy_to_vtk,
+    numpy_to_vtkIdTypeArray,
+    vtk_to_numpy,
+)
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkPolyData
+from vtkmodules.vtkFiltersCore import vtkCleanPolyData, vtkQuadricDecimation
 from vtkmodules.vtkIOXML import vtkXMLPolyDataWriter
 
+from build123d.tessellation import (
+    HASH_CODE_MAX,
+    Tessellation,
+    tessellation_cache,
+    vertex_normals,
+)
+
 DEFAULT_COLOR = [1, 0.8, 0, 1]
+MAX_TRIANGLES = 200_000  # triangle budget of a single display before decimation
+CACHE_SIZE = 128  # number of decimated tessellations retained between displays
+
+# (hash code, tolerance, angular_tolerance, max_triangles) ->
+#   [(unlocated TopoDS_Shape, Tessellation)]
+_decimation_cache: OrderedDict[tuple, list[tuple[TopoDS_Shape, Tessellation]]] = (
+    OrderedDict()
+)
+_decimation_lock = threading.RLock()
 
 TEMPLATE_RENDER = """
 
+function decode(data, array_type){{
+    // base64 string to typed array
+    const bytes = Uint8Array.from(atob(data), c => c.charCodeAt(0));
+    return new array_type(bytes.buffer);
+}};
+
 function render(data, parent_element, ratio){{
 
     // Initial setup
@@ -44,16 +82,28 @@ function render(data, parent_element, ratio){{
         var trans = el.position;
         var rot = el.orientation;
         var rgba = el.color;
-        var shape = el.shape;
 
-        // load the inline data
-        var reader = vtk.IO.XML.vtkXMLPolyDataReader.newInstance();
-        const textEncoder = new TextEncoder();
-        reader.parseAsArrayBuffer(textEncoder.encode(shape));
+        // build the polydata from the binary typed arrays
+        const polydata = vtk.Common.DataModel.vtkPolyData.newInstance();
+        polydata.getPoints().setData(decode(el.positions, Float32Array), 3);
+        const indices = decode(el.indices, Uint32Array);
+        const polys = new Uint32Array(indices.length / 3 * 4);
+        for (let i = 0, j = 0; i < indices.length; i += 3, j += 4){{
+            polys[j] = 3;
+            polys[j + 1] = indices[i];
+            polys[j + 2] = indices[i + 1];
+            polys[j + 3] = indices[i + 2];
+        }};
+        polydata.getPolys().setData(polys);
+        polydata.getPointData().setNormals(vtk.Common.Core.vtkDataArray.newInstance({{
+            name: "Normals",
+            numberOfComponents: 3,
+            values: decode(el.normals, Float32Array),
+        }}));
 
         // setup actor,mapper and add
         const mapper = vtk.Rendering.Core.vtkMapper.newInstance();
-        mapper.setInputConnection(reader.getOutputPort());
+        mapper.setInputData(polydata);
         mapper.setResolveCoincidentTopologyToPolygonOffset();
         mapper.setResolveCoincidentTopologyPolygonOffsetParameters(0.5,100);
 
@@ -203,11 +253,106 @@ def to_vtkpoly_string(
     return writer.GetOutputString()
 
 
-def display(shape: Any) -> Javascript:
+def _decimate(
+    positions: np.ndarray, indices: np.ndarray, max_triangles: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce a triangle mesh to approximately max_triangles with quadric decimation"""
+    points = vtkPoints()
+    points.SetData(numpy_to_vtk(positions, deep=True))
+    cells = vtkCellArray()
+    cells.SetData(
+        numpy_to_vtkIdTypeArray(np.arange(0, 3 * len(indices) + 1, 3), deep=True),
+        numpy_to_vtkIdTypeArray(indices.astype(np.int64).ravel(), deep=True),
+    )
+    poly_data = vtkPolyData()
+    poly_data.SetPoints(points)
+    poly_data.SetPolys(cells)
+
+    # Faces are meshed independently so merge their coincident boundary nodes first
+    cleaner = vtkCleanPolyData()
+    cleaner.SetInputData(poly_data)
+
+    decimator = vtkQuadricDecimation()
+    decimator.SetInputConnection(cleaner.GetOutputPort())
+    decimator.SetTargetReduction(1 - max_triangles / len(indices))
+    decimator.Update()
+    output = decimator.GetOutput()
+
+    new_positions = vtk_to_numpy(output.GetPoints().GetData()).astype(np.float64)
+    new_indices = (
+        vtk_to_numpy(output.GetPolys().GetConnectivityArray())
+        .astype(np.uint32)
+        .reshape(-1, 3)
+    )
+    return new_positions, new_indices
+
+
+def _tessellate(
+    obj: TopoDS_Shape,
+    tolerance: float,
+    angular_tolerance: float,
+    max_triangles: Optional[int],
+) -> Tessellation:
+    """Tessellate an unlocated OCCT shape, decimating (with caching) if over budget"""
+    tessellation = tessellation_cache.tessellate(obj, tolerance, angular_tolerance)
+    if max_triangles is None or tessellation.triangle_count <= max_triangles:
+        return tessellation
+
+    key = (obj.HashCode(HASH_CODE_MAX), tolerance, angular_tolerance, max_triangles)
+    with _decimation_lock:
+        for other, decimated in _decimation_cache.get(key, []):
+            if other.IsEqual(obj):
+                _decimation_cache.move_to_end(key)
+                return decimated
+
+    positions, indices = _decimate(
+        tessellation.positions, tessellation.indices, max_triangles
+    )
+    decimated = Tessellation(positions, vertex_normals(positions, indices), indices)
+    with _decimation_lock:
+        _decimation_cache.setdefault(key, []).append((obj, decimated))
+        _decimation_cache.move_to_end(key)
+        while len(_decimation_cache) > CACHE_SIZE:
+            _decimation_cache.popitem(last=False)
+    return decimated
+
+
+def _leaves(shape: Any) -> list[tuple[TopoDS_Shape, Any]]:
+    """Find the shapes to display with their colors and global locations"""
+    children = getattr(shape, "children", None)
+    if children:
+        leaves = []
+        for child in children:
+            for obj, color in _leaves(child):
+                leaves.append(
+                    (
+                        obj.Moved(shape.wrapped.Location()),
+                        color if color is not None else shape.color,
+                    )
+                )
+        return leaves
+    return [(shape.wrapped, shape.color)]
+
+
+def display(
+    shape: Any,
+    tolerance: float = 1e-3,
+    angular_tolerance: float = 0.1,
+    max_triangles: Optional[int] = MAX_TRIANGLES,
+) -> Javascript:
     """display
 
+    Shapes are sent to the browser as base64 encoded float32 positions & normals and
+    uint32 triangle indices. Tessellations are drawn from the shared tessellation
+    cache so repeated displays don't re-mesh and shapes with more than `max_triangles`
+    triangles are decimated to reduce the size of the payload.
+
     Args:
         shape (Shape): object to display
+        tolerance (float, optional): relative linear deflection. Defaults to 1e-3.
+        angular_tolerance (float, optional): angular deflection. Defaults to 0.1.
+        max_triangles (int, optional): triangle budget for the whole shape, None
+            to disable decimation. Defaults to MAX_TRIANGLES.
 
     Raises:
         ValueError: not a valid Shape
@@ -220,12 +365,40 @@ def display(shape: Any) -> Javascript:
     if not hasattr(shape, "wrapped"):  # Is a "Shape"
         raise ValueError(f"Type {type(shape)} is not supported")
 
-    payload.append({
-        "shape": to_vtkpoly_string(shape),
-        "color": DEFAULT_COLOR,
-        "position": [0, 0, 0],
-        "orientation": [0, 0, 0],
-    })
+    # Split assemblies and compounds into their (located) components
+    parts: list[tuple[TopoDS_Shape, Any]] = []
+    for obj, color in _leaves(shape):
+        if obj.ShapeType() == TopAbs_ShapeEnum.TopAbs_COMPOUND:
+            iterator = TopoDS_Iterator(obj)
+            while iterator.More():
+                parts.append((iterator.Value(), color))
+                iterator.Next()
+        else:
+            parts.append((obj, color))
+
+    part_budget = (
+        None
+        if max_triangles is None or not parts
+        else max(max_triangles // len(parts), 1)
+    )
+    for obj, color in parts:
+        positions, normals, indices = _tessellate(
+            obj.Located(TopLoc_Location()), tolerance, angular_tolerance, part_budget
+        ).transformed(obj)
+        if len(indices) == 0:
+            continue
+        positions = positions.astype(np.float32)
+
+        payload.append(
+            {
+                "positions": b64encode(positions.tobytes()).decode("ascii"),
+                "normals": b64encode(normals.tobytes()).decode("ascii"),
+                "indices": b64encode(indices.tobytes()).decode("ascii"),
+                "color": DEFAULT_COLOR if color is None else list(color.to_tuple()),
+                "position": [0, 0, 0],
+                "orientation": [0, 0, 0],
+            }
+        )
     code = TEMPLATE.format(data=dumps(payload), element="element", ratio=0.5)
 
     return Javascript(code)
@@ -80,7 +80,6 @@ license:
 """
 # pylint has trouble with the OCP imports
 # pylint: disable=no-name-in-module, import-error
-import copy
 import ctypes
 import os
 import sys
@@ -88,22 +87,20 @@ import uuid
 import warnings
 from typing import Iterable, Union
 
-from OCP.BRep import BRep_Tool
 from OCP.BRepBuilderAPI import (
     BRepBuilderAPI_MakeFace,
     BRepBuilderAPI_MakePolygon,
     BRepBuilderAPI_MakeSolid,
     BRepBuilderAPI_Sewing,
 )
-from OCP.BRepMesh import BRepMesh_IncrementalMesh
 from OCP.gp import gp_Pnt
-import OCP.TopAbs as ta
-from OCP.TopLoc import TopLoc_Location
 
+import numpy as np
 from py_lib3mf import Lib3MF
 from scipy.spatial import cKDTree
 from build123d.build_enums import MeshType, Unit
 from build123d.geometry import Color, Vector
+from build123d.tessellation import tessellation_cache
 from build123d.topology import Compound, Shape, Shell, Solid, downcast
 
 
@@ -256,45 +253,29 @@ class Mesher:
         return properties
 
     @staticmethod
-    def _mesh_shape(ocp_mesh: Shape, linear_deflection: float, angular_deflection: float):
+    def _mesh_shape(
+        ocp_mesh: Shape,
+        linear_deflection: float,
+        angular_deflection: float,
+        target_triangles: int = None,
+        chordal_error: float = None,
+    ):
         """Mesh the shape into vertices and triangles"""
-        loc = TopLoc_Location()  # Face locations
-        BRepMesh_IncrementalMesh(
-            theShape=ocp_mesh.wrapped,
-            theLinDeflection=linear_deflection,
-            isRelative=True,
-            theAngDeflection=angular_deflection,
-            isInParallel=False,
+        positions, _normals, indices = tessellation_cache.tessellate(
+            ocp_mesh.wrapped,
+            linear_deflection,
+            angular_deflection,
+            target_triangles=target_triangles,
+            chordal_error=chordal_error,
         )
 
-        # helper function
-        def round_vertex(vertex, precision=5):
-            return tuple(round(coord, precision) for coord in vertex)
-
         tolerance = 1e-5
-        raw_vertices = []
-        triangles = []
-        offset = 0
-        for facet in ocp_mesh.faces():
-            # Triangulate the face
-            poly_triangulation = BRep_Tool.Triangulation_s(facet.wrapped, loc)
-            trsf = loc.Transformation()
-
-            # Store raw vertices
-            node_count = poly_triangulation.NbNodes()
-            for i in range(1, node_count + 1):
-                gp_pnt = poly_triangulation.Node(i).Transformed(trsf)
-                # precision factor 
-                rounded_vertex = round_vertex((gp_pnt.X(), gp_pnt.Y(), gp_pnt.Z()))
-                raw_vertices.append(rounded_vertex)
-
-            # Store the triangles
-            facet_reversed = facet.wrapped.Orientation() == ta.TopAbs_REVERSED
-            order = [1, 3, 2] if facet_reversed else [1, 2, 3]
-            for tri in poly_triangulation.Triangles():
-                triangles.append([tri.Value(i) + offset - 1 for i in order])
-            offset += node_count
+        # precision factor
+        raw_vertices = [tuple(v) for v in np.round(positions, 5).tolist()]
+        triangles = indices.tolist()
 
+        if not raw_vertices:
+            return [], []
         kd_tree = cKDTree(raw_vertices)
         unique_vertex_indices = kd_tree.query_ball_tree(kd_tree, r=tolerance) # merge vertices using tolerance
 
@@ -372,10 +353,14 @@ class Mesher:
         mesh_type: MeshType = MeshType.MODEL,
         part_number: str = None,
         uuid_value: uuid = None,
+        target_triangles: int = None,
+        chordal_error: float = None,
     ):
         """add_shape
 
-        Add a shape to the 3MF/STL file.
+        Add a shape to the 3MF/STL file. Instead of the deflections, the level of
+        detail of each shape may be given as a triangle budget or as a chordal error
+        relative to the size of the shape.
 
         Args:
             shape (Union[Shape, Iterable[Shape]]): build123d object
@@ -385,6 +370,11 @@ class Mesher:
             mesh_type (MeshType, optional): 3D printing use of mesh. Defaults to MeshType.MODEL.
             part_number (str, optional): part #. Defaults to None.
             uuid_value (uuid, optional): value from uuid package. Defaults to None.
+            target_triangles (int, optional): approximate number of triangles per
+                shape, overrides the deflections. Defaults to None.
+            chordal_error (float, optional): maximum distance between the mesh and
+                the shape as a fraction of the shape's bounding box diagonal,
+                overrides linear_deflection. Defaults to None.
 
         Raises:
             RuntimeError: 3mf mesh is invalid
@@ -404,9 +394,11 @@ class Mesher:
 
             # Mesh the shape
             ocp_mesh_vertices, triangles = Mesher._mesh_shape(
-                copy.deepcopy(b3d_shape),
+                b3d_shape,
                 linear_deflection,
                 angular_deflection,
+                target_triangles,
+                chordal_error,
             )
 
             # Skip invalid meshes
@@ -28,14 +28,16 @@ license:
 from __future__ import annotations
 
 import copy
-from math import copysign, cos, radians, sin, sqrt
+from math import copysign, cos, pi, radians, sin, sqrt
 from typing import Iterable, Union
 
+import numpy as np
+
 from build123d.build_common import WorkplaneList, flatten_sequence, validate_inputs
-from build123d.build_enums import AngularDirection, GeomType, LengthMode, Mode
+from build123d.build_enums import AngularDirection, LengthMode, Mode
 from build123d.build_line import BuildLine
-from build123d.geometry import Axis, Plane, Vector, VectorLike
-from build123d.topology import Edge, Face, Wire, Curve
+from build123d.geometry import TOLERANCE, Axis, Plane, Vector, VectorLike
+from build123d.topology import Edge, Wire, Curve
 
 
 class BaseLineObject(Wire):
@@ -384,64 +386,63 @@ class FilletPolyline(BaseLineObject):
             raise ValueError("radius must be positive")
 
         lines_pts = WorkplaneList.localize(*pts)
+        if close and (lines_pts[0] - lines_pts[-1]).length <= 1e-5:
+            lines_pts = lines_pts[:-1]
+        points = np.array([pnt.to_tuple() for pnt in lines_pts])
 
-        # Create the polyline
-        new_edges = [
-            Edge.make_line(lines_pts[i], lines_pts[i + 1])
-            for i in range(len(lines_pts) - 1)
-        ]
-        if close and (new_edges[0] @ 0 - new_edges[-1] @ 1).length > 1e-5:
-            new_edges.append(Edge.make_line(new_edges[-1] @ 1, new_edges[0] @ 0))
-        wire_of_lines = Wire.make_wire(new_edges)
-
-        # Create a list of vertices from wire_of_lines in the same order as
-        # the original points so the resulting fillet edges are ordered
-        ordered_vertices = []
-        for pnts in lines_pts:
-            distance = {
-                v: (Vector(pnts) - Vector(*v)).length for v in wire_of_lines.vertices()
-            }
-            ordered_vertices.append(sorted(distance.items(), key=lambda x: x[1])[0][0])
-
-        # Fillet the corners
-
-        # Create a map of vertices to edges containing that vertex
-        vertex_to_edges = {
-            v: [e for e in wire_of_lines.edges() if v in e.vertices()]
-            for v in ordered_vertices
-        }
-
-        # For each corner vertex create a new fillet Edge
-        fillets = []
-        for vertex, edges in vertex_to_edges.items():
-            if len(edges) != 2:
-                continue
-            other_vertices = set(
-                ve for e in edges for ve in e.vertices() if ve != vertex
-            )
-            third_edge = Edge.make_line(*[v.to_tuple() for v in other_vertices])
-            fillet_face = Face.make_from_wires(
-                Wire.make_wire(edges + [third_edge])
-            ).fillet_2d(radius, [vertex])
-            fillets.append(fillet_face.edges().filter_by(GeomType.CIRCLE)[0])
-
-        # Create the Edges that join the fillets
+        # The corners to fillet and their neighbouring points
         if close:
-            interior_edges = [
-                Edge.make_line(fillets[i - 1] @ 1, fillets[i] @ 0)
-                for i in range(len(fillets))
-            ]
-            end_edges = []
+            corners, previous, following = (
+                points,
+                np.roll(points, 1, axis=0),
+                np.roll(points, -1, axis=0),
+            )
         else:
-            interior_edges = [
-                Edge.make_line(fillets[i] @ 1, f @ 0) for i, f in enumerate(fillets[1:])
-            ]
-            end_edges = [
-                Edge.make_line(wire_of_lines @ 0, fillets[0] @ 0),
-                Edge.make_line(fillets[-1] @ 1, wire_of_lines @ 1),
-            ]
-
-        new_wire = Wire.make_wire(end_edges + interior_edges + fillets)
+            corners, previous, following = points[1:-1], points[:-2], points[2:]
+        to_previous, to_following = previous - corners, following - corners
+        previous_lengths = np.linalg.norm(to_previous, axis=1)
+        following_lengths = np.linalg.norm(to_following, axis=1)
+        if (previous_lengths < TOLERANCE).any() or (
+            following_lengths < TOLERANCE
+        ).any():
+            raise ValueError("filletpolyline requires distinct successive pts")
+        to_previous /= previous_lengths[:, np.newaxis]
+        to_following /= following_lengths[:, np.newaxis]
+
+        # Each fillet is tangent to both lines at the same distance from the corner
+        half_angles = (
+            np.arccos(np.clip(np.sum(to_previous * to_following, axis=1), -1, 1)) / 2
+        )
+        straight = np.isclose(half_angles, pi / 2, rtol=0, atol=TOLERANCE)
+        with np.errstate(divide="ignore"):
+            setbacks = np.where(straight, 0.0, radius / np.tan(half_angles))
+        next_setbacks = np.roll(setbacks, -1) if close else np.append(setbacks[1:], 0)
+        if (setbacks + next_setbacks > following_lengths + TOLERANCE).any() or (
+            not close and setbacks[0] > previous_lengths[0] + TOLERANCE
+        ):
+            raise ValueError("radius is too large for the given pts")
+        fillet_starts = corners + to_previous * setbacks[:, np.newaxis]
+        fillet_ends = corners + to_following * setbacks[:, np.newaxis]
+
+        # Join the fillets with lines
+        new_edges = []
+        line_start = fillet_ends[-1] if close else points[0]
+        for fillet_start, fillet_end, tangent, is_straight in zip(
+            fillet_starts, fillet_ends, -to_previous, straight
+        ):
+            if np.linalg.norm(fillet_start - line_start) > TOLERANCE:
+                new_edges.append(Edge.make_line(tuple(line_start), tuple(fillet_start)))
+            if not is_straight:
+                new_edges.append(
+                    Edge.make_tangent_arc(
+                        tuple(fillet_start), tuple(tangent), tuple(fillet_end)
+                    )
+                )
+            line_start = fillet_end
+        if not close and np.linalg.norm(points[-1] - line_start) > TOLERANCE:
+            new_edges.append(Edge.make_line(tuple(line_start), tuple(points[-1])))
+
+        new_wire = Wire.make_chain(new_edges)
 
         super().__init__(new_wire, mode=mode)
 
@@ -667,15 +668,10 @@ class Polyline(BaseLineObject):
             raise ValueError("polyline requires three or more pts")
 
         lines_pts = WorkplaneList.localize(*pts)
+        if close and (lines_pts[0] - lines_pts[-1]).length <= 1e-5:
+            lines_pts = lines_pts[:-1]
 
-        new_edges = [
-            Edge.make_line(lines_pts[i], lines_pts[i + 1])
-            for i in range(len(lines_pts) - 1)
-        ]
-        if close and (new_edges[0] @ 0 - new_edges[-1] @ 1).length > 1e-5:
-            new_edges.append(Edge.make_line(new_edges[-1] @ 1, new_edges[0] @ 0))
-
-        super().__init__(Wire.combine(new_edges)[0], mode=mode)
+        super().__init__(Wire.make_polygon(lines_pts, close=close), mode=mode)
 
 
 class RadiusArc(BaseLineObject):
@@ -29,7 +29,17 @@ license:
 from __future__ import annotations
 from typing import Iterable, Union
 from build123d.build_enums import Mode
-from build123d.topology import Compound, Curve, Edge, Face, ShapeList, Wire, Sketch
+from build123d.topology import (
+    Compound,
+    Curve,
+    Edge,
+    Face,
+    ShapeList,
+    Wire,
+    Sketch,
+    _fuse_touching,
+    _trace_faces,
+)
 from build123d.build_common import flatten_sequence, validate_inputs
 from build123d.build_sketch import BuildSketch
 
@@ -111,16 +121,22 @@ def trace(
     lines: Union[Curve, Edge, Wire, Iterable[Union[Curve, Edge, Wire]]] = None,
     line_width: float = 1,
     mode: Mode = Mode.ADD,
+    max_workers: int = 1,
 ) -> Sketch:
     """Sketch Operation: trace
 
     Convert edges, wires or pending edges into faces by sweeping a perpendicular line along them.
 
+    Straight and circular edges are offset directly instead of being swept. Traced
+    edges that touch are fused in small groups before being combined with the sketch.
+
     Args:
         lines (Union[Curve, Edge, Wire, Iterable[Union[Curve, Edge, Wire]]], optional): lines to
             trace. Defaults to sketch pending edges.
         line_width (float, optional): Defaults to 1.
         mode (Mode, optional): combination mode. Defaults to Mode.ADD.
+        max_workers (int, optional): maximum number of processes used to fuse independent
+            groups of traces, None uses the number set by Parallelism. Defaults to 1.
 
     Raises:
         ValueError: No objects to trace
@@ -138,10 +154,14 @@ def trace(
     else:
         raise ValueError("No objects to trace")
 
-    new_faces = []
-    for edge in trace_edges:
-        trace_pen = edge.perpendicular_line(line_width, 0)
-        new_faces.extend(Face.sweep(trace_pen, edge).faces())
+    new_faces = [
+        face
+        for fused in _fuse_touching(
+            [f for edge in trace_edges for f in _trace_faces(edge, line_width)],
+            max_workers,
+        )
+        for face in fused.faces()
+    ]
     if context is not None:
         context._add_to_context(*new_faces, mode=mode)
         context.pending_edges = ShapeList()
@@ -12,9 +12,15 @@ desc:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Collection, Optional, cast
+from math import sqrt
+from typing import Callable, Collection, Literal, Optional
+
+import numpy as np
 
 from build123d import Location, Shape
+from build123d.topology import overlapping_pairs
+
+TOLERANCE = 1e-9
 
 def _pack2d(objects: Collection[object],
             width_fn: Callable[[object], float],
@@ -98,28 +104,140 @@ def _pack2d(objects: Collection[object],
         translations.append((o[0], node.x, node.y))
     return [(t[1], t[2]) for t in sorted(translations, key=lambda t: t[0])]
 
-def pack(objects: Collection[Shape], padding: float) -> Collection[Shape]:
-    """Pack objects in a squarish area in Plane.XY."""
-    bounding_boxes = {o: o.bounding_box().size + (padding, padding) for o in objects}
-    translations = _pack2d(
-        objects,
-        width_fn=lambda o: bounding_boxes[cast(Shape, o)].X,
-        length_fn=lambda o: bounding_boxes[cast(Shape, o)].Y)
+def _pack2d_skyline(sizes: np.ndarray,
+                    allow_rotation: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """Pack rectangles with the skyline bottom-left heuristic.
+
+    The rectangles are sorted by size and placed one by one at the lowest
+    position of a skyline - the upper outline of the rectangles placed so far -
+    within a strip whose width is chosen to make the result square(ish). The
+    skyline only has as many segments as the packing is wide which keeps the
+    packer fast for tens of thousands of rectangles. When rotation is allowed
+    both orientations of each rectangle are tried.
+
+    Args:
+        sizes (np.ndarray): (n, 2) array of rectangle widths and lengths
+        allow_rotation (bool, optional): allow rectangles to be rotated by 90°.
+            Defaults to False.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (n, 2) array of the (x, y) locations of the
+            rectangles and an (n,) array of whether they are rotated
+    """
+    assert len(sizes) > 0
+    rotated = np.zeros(len(sizes), dtype=bool)
+    if allow_rotation:
+        min_width = sizes.min(axis=1).max()
+    else:
+        min_width = sizes[:, 0].max()
+    width = max(min_width, sqrt(float(np.prod(sizes, axis=1).sum())))
+
+    # The skyline as segments starting at x with a height y
+    seg_x = np.array([0.0, width])
+    seg_y = np.array([0.0, np.inf])
+
+    def best_fit(w: float, h: float) -> tuple[float, float, float, int, int]:
+        """The lowest (top, x, y, first, last segment) placement of a w x h rectangle"""
+        starts = np.nonzero(seg_x[:-1] + w <= width + TOLERANCE)[0]
+        if len(starts) == 0:
+            return (np.inf, np.inf, np.inf, -1, -1)
+        # The segments after the last one covered by a rectangle at each start
+        ends = np.searchsorted(seg_x, seg_x[starts] + w - TOLERANCE)
+        bounds = np.empty(2 * len(starts), dtype=np.intp)
+        bounds[0::2] = starts
+        bounds[1::2] = np.maximum(ends, starts + 1)
+        heights = np.maximum.reduceat(seg_y, bounds)[0::2]
+        best = np.lexsort((seg_x[starts], heights + h))[0]
+        return (heights[best] + h, seg_x[starts[best]], heights[best],
+                starts[best], max(ends[best], starts[best] + 1) - 1)
+
+    if allow_rotation:
+        order = np.lexsort((-sizes.min(axis=1), -sizes.max(axis=1)))
+    else:
+        order = np.lexsort((-sizes[:, 0], -sizes[:, 1]))
+    locations = np.empty_like(sizes)
+    for i in order:
+        w, h = sizes[i]
+        top, x, y, first, last = best_fit(w, h)
+        if allow_rotation:
+            rotated_fit = best_fit(h, w)
+            if rotated_fit[:2] < (top, x):
+                top, x, y, first, last = rotated_fit
+                w, h = h, w
+                rotated[i] = True
+        locations[i] = (x, y)
+
+        # Replace the covered part of the skyline with the top of the rectangle
+        if seg_x[last + 1] > x + w + TOLERANCE:
+            new_x, new_y = [x, x + w], [top, seg_y[last]]
+        else:
+            new_x, new_y = [x], [top]
+        seg_x = np.concatenate((seg_x[:first], new_x, seg_x[last + 1:]))
+        seg_y = np.concatenate((seg_y[:first], new_y, seg_y[last + 1:]))
+        # Merge neighbouring segments of the same height
+        distinct = np.ones(len(seg_y), dtype=bool)
+        distinct[1:] = seg_y[1:] != seg_y[:-1]
+        seg_x, seg_y = seg_x[distinct], seg_y[distinct]
+
+    return locations, rotated
+
+
+def pack(objects: Collection[Shape], padding: float,
+         packer: Literal["tree", "skyline"] = "tree",
+         allow_rotation: bool = False, optimal: bool = True) -> Collection[Shape]:
+    """Pack objects in a squarish area in Plane.XY.
+
+    Args:
+        objects (Collection[Shape]): objects to pack
+        padding (float): space between the objects
+        packer (Literal["tree", "skyline"], optional): the "tree" packer grows the
+            packing around the largest objects while the "skyline" packer is much
+            faster for large numbers of objects. Defaults to "tree".
+        allow_rotation (bool, optional): allow the "skyline" packer to rotate
+            objects by 90° about the Z axis. Defaults to False.
+        optimal (bool, optional): use the precise bounding boxes of the objects
+            rather than the faster boxes of their meshes, which include a margin.
+            Defaults to True.
+
+    Raises:
+        ValueError: rotation is only supported by the skyline packer
+
+    Returns:
+        Collection[Shape]: the translated (and rotated) objects
+    """
+    if allow_rotation and packer != "skyline":
+        raise ValueError("allow_rotation requires the skyline packer")
+
+    objects = list(objects)
+    boxes = [o.bounding_box(optimal=optimal) for o in objects]
+    box_min = np.array([(bb.min.X, bb.min.Y) for bb in boxes])
+    box_max = np.array([(bb.max.X, bb.max.Y) for bb in boxes])
+    extents = box_max - box_min
+    sizes = extents + padding
+
+    if packer == "skyline":
+        translations, rotated = _pack2d_skyline(sizes, allow_rotation)
+    else:
+        translations = np.array(_pack2d(
+            range(len(objects)),
+            width_fn=lambda i: sizes[i, 0],
+            length_fn=lambda i: sizes[i, 1]))
+        rotated = np.zeros(len(objects), dtype=bool)
+
+    # A rotation by 90° maps the box (min, max) to (-max.Y, min.X)...(-min.Y, max.X)
+    placed_min = np.where(rotated[:, None],
+                          np.column_stack((-box_max[:, 1], box_min[:, 0])), box_min)
+    offsets = translations - placed_min
     translated = [
-        Location((t[0]-o.bounding_box().min.X, t[1]-o.bounding_box().min.Y, 0)) * o
-        for (o,t) in zip(objects, translations)
+        Location((dx, dy, 0), (0, 0, 90 if turn else 0)) * o
+        for (o, (dx, dy), turn) in zip(objects, offsets, rotated)
     ]
 
-    # Assert the packing didn't cause any overlaps.
-    def _overlapping(bb1, bb2):
-        # Boundaries of the intersection of the two bounding boxes.
-        min_x = max(bb1.min.X, bb2.min.X)
-        min_y = max(bb1.min.Y, bb2.min.Y)
-        max_x = min(bb1.max.X, bb2.max.X)
-        max_y = min(bb1.max.Y, bb2.max.Y)
-        return max_x > min_x and max_y > min_y
-    bb = [t.bounding_box() for t in translated]
-    for (i, bb_i) in enumerate(bb):
-        for (j, bb_j) in enumerate(bb[i+1:]):
-            assert not _overlapping(bb_i, bb_j), f"Objects at indexes {i} and {j} overlap!"
+    # Assert the packing didn't cause any overlaps. The packed boxes start at the
+    # translations and have the (possibly rotated) extents of the original boxes.
+    packed_min = translations
+    packed_max = translations + np.where(rotated[:, None], extents[:, ::-1], extents)
+    # Touching boxes of rotated objects may overlap by rounding errors
+    overlaps = overlapping_pairs(packed_min + TOLERANCE, packed_max - TOLERANCE)
+    assert not overlaps, "Objects at indexes {} and {} overlap!".format(*overlaps[0])
     return translated
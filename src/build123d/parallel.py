@@ -0,0 +1,244 @@
+"""
+build123d parallel
+
+name: parallel.py
+by:   Gumyr
+date: Oct 19th 2026
+
+desc:
+    This module configures the parallelism used by build123d and OCCT.
+
+    Boolean operations, meshing and shape analysis are multi-threaded within
+    OCCT with a process wide thread pool while hidden line removal of multiple
+    views is spread over worker processes. When several build processes share a
+    host each of them would otherwise use every core. The number of threads (or
+    processes) of each category of operation is taken from, in order of
+    precedence, an active Parallelism context, the process wide defaults set with
+    Parallelism.set_defaults, the BUILD123D_<CATEGORY>_THREADS and
+    BUILD123D_THREADS environment variables and finally the number of logical
+    processors.
+
+license:
+
+    Copyright 2026 Gumyr
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint has trouble with the OCP imports
+# pylint: disable=no-name-in-module, import-error
+import contextvars
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from OCP.OSD import OSD_ThreadPool
+
+# Categories of operations that can run in parallel
+CATEGORIES = ("boolean", "mesh", "hlr", "analysis")
+
+THREADS_ENV = "BUILD123D_THREADS"
+
+# Guards the configuration of the process wide OCCT thread pool. The thread
+# counts of the operations that are running and the number of threads the pool
+# launched by default before the first of them started.
+_pool_lock = threading.Lock()
+_pool_requests: list[int] = []
+_pool_default: Optional[int] = None
+
+
+def _env_threads(category: str) -> Optional[int]:
+    """The number of threads given by the environment for a category"""
+    for name in (f"BUILD123D_{category.upper()}_THREADS", THREADS_ENV):
+        value = os.environ.get(name)
+        if value:
+            try:
+                return max(1, int(value))
+            except ValueError as exc:
+                raise ValueError(f"{name} must be an integer not {value!r}") from exc
+    return None
+
+
+class Parallelism:
+    """Parallelism
+
+    The number of threads used by each category of operation, set for a block of
+    code by using Parallelism as a context manager or for the whole process with
+    `Parallelism.set_defaults`. The categories are:
+
+    - boolean: boolean operations (fuse, cut, intersect, split)
+    - mesh: meshing for tessellation, export and bounding boxes
+    - hlr: the processes used to project a shape onto multiple viewports
+    - analysis: validity checks and distance calculations
+
+    Example:
+
+    .. code-block:: python
+
+        with Parallelism(1):
+            part = base - holes  # single threaded
+
+    Args:
+        threads (int, optional): threads of the categories that aren't given.
+            Defaults to None (unchanged).
+        boolean (int, optional): boolean operation threads. Defaults to None.
+        mesh (int, optional): meshing threads. Defaults to None.
+        hlr (int, optional): hidden line removal processes. Defaults to None.
+        analysis (int, optional): shape analysis threads. Defaults to None.
+
+    Raises:
+        ValueError: thread count less than one
+    """
+
+    _defaults: dict[str, int] = {}
+    _current: contextvars.ContextVar[dict[str, int]] = contextvars.ContextVar(
+        "Parallelism._current", default={}
+    )
+
+    def __init__(
+        self,
+        threads: Optional[int] = None,
+        *,
+        boolean: Optional[int] = None,
+        mesh: Optional[int] = None,
+        hlr: Optional[int] = None,
+        analysis: Optional[int] = None,
+    ):
+        self.settings = Parallelism._settings(
+            threads, boolean=boolean, mesh=mesh, hlr=hlr, analysis=analysis
+        )
+        self._reset_tok = None
+
+    def __enter__(self):
+        self._reset_tok = Parallelism._current.set(
+            {**Parallelism._current.get(), **self.settings}
+        )
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        Parallelism._current.reset(self._reset_tok)
+
+    @staticmethod
+    def _settings(threads: Optional[int], **categories: Optional[int]) -> dict[str, int]:
+        """Map each given category to its number of threads"""
+        settings = {
+            category: count if count is not None else threads
+            for category, count in categories.items()
+        }
+        if any(count is not None and count < 1 for count in settings.values()):
+            raise ValueError("The number of threads must be at least one")
+        return {k: v for k, v in settings.items() if v is not None}
+
+    @staticmethod
+    def set_defaults(
+        threads: Optional[int] = None,
+        *,
+        boolean: Optional[int] = None,
+        mesh: Optional[int] = None,
+        hlr: Optional[int] = None,
+        analysis: Optional[int] = None,
+    ):
+        """set_defaults
+
+        Set the process wide number of threads of categories of operations.
+
+        Args:
+            threads (int, optional): threads of the categories that aren't given.
+                Defaults to None (unchanged).
+            boolean (int, optional): boolean operation threads. Defaults to None.
+            mesh (int, optional): meshing threads. Defaults to None.
+            hlr (int, optional): hidden line removal processes. Defaults to None.
+            analysis (int, optional): shape analysis threads. Defaults to None.
+        """
+        Parallelism._defaults.update(
+            Parallelism._settings(
+                threads, boolean=boolean, mesh=mesh, hlr=hlr, analysis=analysis
+            )
+        )
+
+    @staticmethod
+    def reset_defaults():
+        """Remove the process wide settings"""
+        Parallelism._defaults.clear()
+
+    @staticmethod
+    def threads(category: str) -> int:
+        """threads
+
+        The number of threads to be used by a category of operations.
+
+        Args:
+            category (str): one of "boolean", "mesh", "hlr" or "analysis"
+
+        Raises:
+            ValueError: unknown category
+
+        Returns:
+            int: number of threads
+        """
+        if category not in CATEGORIES:
+            raise ValueError(f"Unknown category {category}, must be one of {CATEGORIES}")
+        for settings in (Parallelism._current.get(), Parallelism._defaults):
+            if category in settings:
+                return settings[category]
+        threads = _env_threads(category)
+        return threads if threads is not None else os.cpu_count() or 1
+
+
+@contextmanager
+def occt_parallel(category: str) -> Iterator[bool]:
+    """occt_parallel
+
+    Context manager that sizes the process wide OCCT thread pool for an operation
+    of the given category. The operation must be executed within the context as
+    the previous size of the pool is restored once the last operation using it
+    exits. Operations running concurrently in multiple threads share the pool
+    which then launches the largest of their thread counts. The pool is only
+    locked while it's being configured, not while the operation runs.
+
+    Example:
+
+    .. code-block:: python
+
+        with occt_parallel("boolean") as parallel:
+            operation.SetRunParallel(parallel)
+            operation.Build()
+
+    Args:
+        category (str): category of the operation
+
+    Yields:
+        Iterator[bool]: the operation should run in parallel
+    """
+    global _pool_default  # pylint: disable=global-statement
+
+    threads = Parallelism.threads(category)
+    if threads == 1:
+        yield False
+        return
+    pool = OSD_ThreadPool.DefaultPool_s()
+    with _pool_lock:
+        if not _pool_requests:
+            _pool_default = pool.NbDefaultThreadsToLaunch()
+        if pool.NbThreads() < threads and not pool.IsInUse():
+            pool.Init(threads)
+        _pool_requests.append(threads)
+        pool.SetNbDefaultThreadsToLaunch(max(_pool_requests))
+    try:
+        yield True
+    finally:
+        with _pool_lock:
+            _pool_requests.remove(threads)
+            pool.SetNbDefaultThreadsToLaunch(
+                max(_pool_requests) if _pool_requests else _pool_default
+            )
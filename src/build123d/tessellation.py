@@ -0,0 +1,486 @@
+"""
+build123d tessellation
+
+name: tessellation.py
+by:   Gumyr
+date: Oct 19th 2026
+
+desc:
+    This module converts the faces of OCCT shapes into triangle meshes held in
+    numpy arrays and caches the results.
+
+    OCCT stores the triangulation of a face within the face's TShape so only a
+    single level of detail is available at any time and any operation that
+    cleans the shape discards it. The TessellationCache instead meshes a private
+    copy of each shape, leaving any triangulation of the shape itself untouched,
+    and keeps several levels of detail (keyed by linear and angular deflection)
+    outside of the TShape such that viewers and exporters that repeatedly
+    request the same tessellation don't re-mesh the shape. Tessellations are
+    stored in the shape's local coordinate system so all of the located
+    instances of a shape share the same cache entries.
+
+    As an alternative to an explicit deflection, the level of detail can be
+    specified as a chordal error relative to the size of the shape or as a
+    target number of triangles. The latter estimates the required deflection
+    from the area and curvature of each face and then refines the estimate
+    from the actual triangle count such that parts of any size result in
+    meshes of a predictable size.
+
+license:
+
+    Copyright 2026 Gumyr
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+# pylint has trouble with the OCP imports
+# pylint: disable=no-name-in-module, import-error
+import threading
+from collections import OrderedDict
+from math import sqrt
+from typing import NamedTuple, Optional
+
+import numpy as np
+from OCP.Bnd import Bnd_Box
+from OCP.BRep import BRep_Tool
+from OCP.BRepAdaptor import BRepAdaptor_Surface
+from OCP.BRepBndLib import BRepBndLib
+from OCP.BRepBuilderAPI import BRepBuilderAPI_Copy
+from OCP.BRepGProp import BRepGProp
+from OCP.BRepLProp import BRepLProp_SLProps
+from OCP.BRepMesh import BRepMesh_IncrementalMesh
+from OCP.BRepTools import BRepTools
+from OCP.GeomAbs import GeomAbs_Plane
+from OCP.GProp import GProp_GProps
+from OCP.TopAbs import TopAbs_Orientation, TopAbs_ShapeEnum
+from OCP.TopExp import TopExp_Explorer
+from OCP.TopLoc import TopLoc_Location
+from OCP.TopoDS import TopoDS, TopoDS_Shape
+
+from build123d.parallel import occt_parallel
+
+HASH_CODE_MAX = 2147483647  # max 32bit signed int, required by OCC.Core.HashCode
+
+# Serializes meshing as triangulations are stored in TShapes that may be shared
+# by shapes in multiple threads
+mesh_lock = threading.RLock()
+
+
+class Tessellation(NamedTuple):
+    """A triangle mesh
+
+    Attributes:
+        positions (np.ndarray): float64 (n,3) vertex positions
+        normals (np.ndarray): float32 (n,3) unit vertex normals
+        indices (np.ndarray): uint32 (m,3) vertex indices of each triangle
+    """
+
+    positions: np.ndarray
+    normals: np.ndarray
+    indices: np.ndarray
+
+    @property
+    def triangle_count(self) -> int:
+        """Number of triangles"""
+        return len(self.indices)
+
+    def transformed(self, obj: TopoDS_Shape) -> "Tessellation":
+        """This tessellation moved to the Location of obj"""
+        location = obj.Location()
+        if location.IsIdentity():
+            return self
+        trsf = location.Transformation()
+        matrix = np.array(
+            [[trsf.Value(r, c) for c in range(1, 5)] for r in range(1, 4)]
+        )
+        rotation = matrix[:, :3] / trsf.ScaleFactor()
+        indices = self.indices[:, [0, 2, 1]] if trsf.IsNegative() else self.indices
+        return Tessellation(
+            self.positions @ matrix[:, :3].T + matrix[:, 3],
+            (self.normals @ rotation.T).astype(np.float32),
+            indices,
+        )
+
+
+def vertex_normals(positions: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Area weighted unit vertex normals of a triangle mesh as float32 (n,3)"""
+    positions = positions.astype(np.float64)
+    corners = positions[indices]
+    face_normals = np.cross(
+        corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]
+    )
+    normals = np.zeros_like(positions)
+    for i in range(3):
+        np.add.at(normals, indices[:, i], face_normals)
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+    return normals.astype(np.float32)
+
+
+def triangulate(obj: TopoDS_Shape) -> Tessellation:
+    """Extract the existing triangulation of the faces of an OCCT shape
+
+    Args:
+        obj (TopoDS_Shape): meshed shape
+
+    Returns:
+        Tessellation: mesh in the coordinate system of obj's parent
+    """
+    positions: list[np.ndarray] = []
+    triangles: list[np.ndarray] = []
+    offset = 0
+    explorer = TopExp_Explorer(obj, TopAbs_ShapeEnum.TopAbs_FACE)
+    while explorer.More():
+        face = TopoDS.Face_s(explorer.Current())
+        explorer.Next()
+        loc = TopLoc_Location()
+        poly = BRep_Tool.Triangulation_s(face, loc)
+        if poly is None:
+            continue
+        trsf = loc.Transformation()
+        nodes = np.array(
+            [
+                poly.Node(i).Transformed(trsf).Coord()
+                for i in range(1, poly.NbNodes() + 1)
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        tris = (
+            np.array(
+                [poly.Triangle(i).Get() for i in range(1, poly.NbTriangles() + 1)],
+                dtype=np.int64,
+            ).reshape(-1, 3)
+            - 1
+        )
+        if face.Orientation() == TopAbs_Orientation.TopAbs_REVERSED:
+            tris = tris[:, [0, 2, 1]]
+        positions.append(nodes)
+        triangles.append(tris + offset)
+        offset += len(nodes)
+
+    if not positions:
+        return Tessellation(
+            np.empty((0, 3), dtype=np.float64),
+            np.empty((0, 3), dtype=np.float32),
+            np.empty((0, 3), dtype=np.uint32),
+        )
+
+    vertices = np.concatenate(positions)
+    indices = np.concatenate(triangles)
+
+    # Face nodes aren't shared so the normals stay sharp across edges
+    return Tessellation(
+        vertices, vertex_normals(vertices, indices), indices.astype(np.uint32)
+    )
+
+
+def _diagonal(obj: TopoDS_Shape) -> float:
+    """Length of the diagonal of the bounding box of obj"""
+    bbox = Bnd_Box()
+    BRepBndLib.Add_s(obj, bbox, False)
+    if bbox.IsVoid():
+        return 0.0
+    x_min, y_min, z_min, x_max, y_max, z_max = bbox.Get()
+    return sqrt((x_max - x_min) ** 2 + (y_max - y_min) ** 2 + (z_max - z_min) ** 2)
+
+
+def _curvature_area(obj: TopoDS_Shape) -> tuple[float, int]:
+    """Sum of face area times mean principal curvature and the planar face count
+
+    A surface with curvature k meshed with a chordal deflection d has triangle
+    edges of about sqrt(8 d / k) and therefore about k A / (4 d) triangles.
+    """
+    curvature_area = 0.0
+    planar_faces = 0
+    explorer = TopExp_Explorer(obj, TopAbs_ShapeEnum.TopAbs_FACE)
+    while explorer.More():
+        face = TopoDS.Face_s(explorer.Current())
+        explorer.Next()
+        surface = BRepAdaptor_Surface(face)
+        if surface.GetType() == GeomAbs_Plane:
+            planar_faces += 1
+            continue
+        properties = GProp_GProps()
+        BRepGProp.SurfaceProperties_s(face, properties)
+
+        # Sample the curvature on a 3x3 grid within the face's parameter range
+        u_min, u_max, v_min, v_max = BRepTools.UVBounds_s(face)
+        curvatures = []
+        for u_ratio in (1 / 6, 1 / 2, 5 / 6):
+            for v_ratio in (1 / 6, 1 / 2, 5 / 6):
+                props = BRepLProp_SLProps(
+                    surface,
+                    u_min + u_ratio * (u_max - u_min),
+                    v_min + v_ratio * (v_max - v_min),
+                    2,
+                    1e-9,
+                )
+                if props.IsCurvatureDefined():
+                    curvatures.append(
+                        max(abs(props.MaxCurvature()), abs(props.MinCurvature()))
+                    )
+        if curvatures:
+            curvature_area += properties.Mass() * sum(curvatures) / len(curvatures)
+    return curvature_area, planar_faces
+
+
+class TessellationCache:
+    """Tessellation Cache
+
+    A least recently used cache of shape tessellations at multiple levels of
+    detail and of the deflections found for triangle budgets. Entries are keyed
+    by the unlocated shape (i.e. the TShape and orientation) and the meshing
+    parameters. Shapes are meshed as private copies so only the triangle arrays
+    are retained and the triangulation of the cached shapes is never modified.
+
+    Args:
+        max_size (int, optional): maximum number of tessellations, and of
+            deflections, retained. Defaults to 256.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        # (hash code, linear, angular, relative) -> [(TopoDS_Shape, Tessellation)]
+        self._entries: OrderedDict[tuple, list[tuple[TopoDS_Shape, Tessellation]]] = (
+            OrderedDict()
+        )
+        # (hash code, target triangles, angular) -> [(TopoDS_Shape, deflection)]
+        self._deflections: OrderedDict[tuple, list[tuple[TopoDS_Shape, float]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def clear(self):
+        """Remove all of the cached tessellations"""
+        with self._lock:
+            self._entries.clear()
+            self._deflections.clear()
+
+    def levels(self, obj: TopoDS_Shape) -> list[tuple[float, float, bool]]:
+        """The (linear, angular, relative) deflections cached for obj"""
+        unlocated = obj.Located(TopLoc_Location())
+        hash_code = unlocated.HashCode(HASH_CODE_MAX)
+        with self._lock:
+            return [
+                key[1:]
+                for key, entries in self._entries.items()
+                if key[0] == hash_code and any(o.IsEqual(unlocated) for o, _ in entries)
+            ]
+
+    def deflection(
+        self,
+        obj: TopoDS_Shape,
+        target_triangles: Optional[int] = None,
+        chordal_error: Optional[float] = None,
+        angular_deflection: float = 0.5,
+    ) -> float:
+        """deflection
+
+        Find the absolute linear deflection that meshes obj with approximately
+        target_triangles triangles or with a chordal_error relative to the size of
+        obj. When targeting a triangle count the deflection is first estimated from
+        the area and curvature of the faces and then corrected (at most twice) from
+        the triangle count of the resulting mesh. These meshes are cached so a
+        following call to `tessellate` with the result is free.
+
+        Note that the angular deflection also limits the size of the triangles on
+        curved surfaces so small budgets are best combined with a large
+        angular_deflection.
+
+        Args:
+            obj (TopoDS_Shape): shape to tessellate
+            target_triangles (int, optional): desired triangle count. Defaults to None.
+            chordal_error (float, optional): deflection as a fraction of the
+                bounding box diagonal of obj. Defaults to None.
+            angular_deflection (float, optional): maximum angle between adjacent
+                triangles in radians. Defaults to 0.5.
+
+        Raises:
+            ValueError: exactly one of target_triangles and chordal_error required
+
+        Returns:
+            float: absolute linear deflection
+        """
+        if (target_triangles is None) == (chordal_error is None):
+            raise ValueError("Provide either target_triangles or chordal_error")
+
+        unlocated = obj.Located(TopLoc_Location())
+        diagonal = _diagonal(unlocated)
+        if chordal_error is not None:
+            return chordal_error * diagonal
+
+        key = (
+            unlocated.HashCode(HASH_CODE_MAX),
+            target_triangles,
+            angular_deflection,
+        )
+        with self._lock:
+            if key in self._deflections:
+                self._deflections.move_to_end(key)
+                for other, deflection in self._deflections[key]:
+                    if other.IsEqual(unlocated):
+                        return deflection
+
+        # Estimate: planar faces need a few triangles, curved faces ~ k A / (4 d)
+        curvature_area, planar_faces = _curvature_area(unlocated)
+        curved_budget = max(target_triangles - 2 * planar_faces, target_triangles / 10)
+        deflection = curvature_area / (4 * curved_budget)
+        deflection = min(max(deflection, 1e-6 * diagonal), 0.1 * diagonal)
+
+        # Correct the estimate with the actual triangle counts
+        if curvature_area > 0:
+            for attempt in range(3):
+                count = self.tessellate(
+                    unlocated, deflection, angular_deflection, False
+                ).triangle_count
+                if attempt == 2 or not count or abs(count / target_triangles - 1) < 0.2:
+                    break
+                deflection = min(
+                    max(deflection * count / target_triangles, 1e-6 * diagonal),
+                    0.1 * diagonal,
+                )
+
+        with self._lock:
+            # Another thread may have found the deflection in the meantime
+            entries = self._deflections.setdefault(key, [])
+            for other, found in entries:
+                if other.IsEqual(unlocated):
+                    return found
+            entries.append((unlocated, deflection))
+            self._deflections.move_to_end(key)
+            while len(self._deflections) > self.max_size:
+                self._deflections.popitem(last=False)
+        return deflection
+
+    @staticmethod
+    def triangulated_copy(
+        obj: TopoDS_Shape,
+        linear_deflection: float,
+        angular_deflection: float = 0.5,
+        relative: bool = False,
+    ) -> TopoDS_Shape:
+        """triangulated_copy
+
+        Mesh a copy of obj, which shares no TShapes with obj, such that the
+        triangulation of obj itself isn't replaced.
+
+        Args:
+            obj (TopoDS_Shape): shape to mesh
+            linear_deflection (float): maximum distance between the mesh and the
+                surface
+            angular_deflection (float, optional): maximum angle between adjacent
+                triangles in radians. Defaults to 0.5.
+            relative (bool, optional): linear_deflection is relative to the size
+                of each edge. Defaults to False.
+
+        Returns:
+            TopoDS_Shape: meshed copy of obj with the same Location
+        """
+        with mesh_lock:
+            # Copy the geometry but not the existing triangulation
+            meshed = BRepBuilderAPI_Copy(obj, True, False).Shape()
+        # The copy is private to this thread so it's meshed without the lock
+        with occt_parallel("mesh") as parallel:
+            BRepMesh_IncrementalMesh(
+                meshed, linear_deflection, relative, angular_deflection, parallel
+            )
+        return meshed
+
+    def tessellate(
+        self,
+        obj: TopoDS_Shape,
+        linear_deflection: Optional[float] = None,
+        angular_deflection: float = 0.5,
+        relative: bool = True,
+        target_triangles: Optional[int] = None,
+        chordal_error: Optional[float] = None,
+    ) -> Tessellation:
+        """tessellate
+
+        Return the tessellation of obj, meshing the shape only if this level of
+        detail isn't already in the cache. The level of detail is either given by
+        linear_deflection or derived from target_triangles or chordal_error (see
+        `deflection`).
+
+        Args:
+            obj (TopoDS_Shape): shape to tessellate
+            linear_deflection (float, optional): maximum distance between the mesh
+                and the surface. Defaults to None.
+            angular_deflection (float, optional): maximum angle between adjacent
+                triangles in radians. Defaults to 0.5.
+            relative (bool, optional): linear_deflection is relative to the size
+                of each edge. Defaults to True.
+            target_triangles (int, optional): desired triangle count. Defaults to None.
+            chordal_error (float, optional): deflection as a fraction of the
+                bounding box diagonal of obj. Defaults to None.
+
+        Raises:
+            ValueError: no level of detail provided
+
+        Returns:
+            Tessellation: mesh in the coordinate system of obj's parent
+        """
+        if target_triangles is not None or chordal_error is not None:
+            linear_deflection = self.deflection(
+                obj, target_triangles, chordal_error, angular_deflection
+            )
+            relative = False
+        elif linear_deflection is None:
+            raise ValueError(
+                "Provide one of linear_deflection, target_triangles or chordal_error"
+            )
+
+        unlocated = obj.Located(TopLoc_Location())
+        key = (
+            unlocated.HashCode(HASH_CODE_MAX),
+            linear_deflection,
+            angular_deflection,
+            relative,
+        )
+        cached = self._lookup(key, unlocated)
+        if cached is not None:
+            return cached.transformed(obj)
+
+        # Mesh without holding the lock so other threads can use the cache
+        tessellation = triangulate(
+            self.triangulated_copy(
+                unlocated, linear_deflection, angular_deflection, relative
+            )
+        )
+        with self._lock:
+            # Another thread may have meshed the same shape in the meantime
+            cached = self._lookup(key, unlocated)
+            if cached is not None:
+                return cached.transformed(obj)
+            self._entries.setdefault(key, []).append((unlocated, tessellation))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return tessellation.transformed(obj)
+
+    def _lookup(self, key: tuple, unlocated: TopoDS_Shape) -> Optional[Tessellation]:
+        """The cached tessellation of unlocated, marking it as recently used"""
+        with self._lock:
+            entries = self._entries.get(key)
+            if entries is None:
+                return None
+            self._entries.move_to_end(key)
+            for other, tessellation in entries:
+                if other.IsEqual(unlocated):
+                    return tessellation
+            return None
+
+tessellation_cache = TessellationCache()
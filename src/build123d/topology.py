@@ -34,24 +34,34 @@ from __future__ import annotations
 # other pylint warning to temp remove:
 #   too-many-arguments, too-many-locals, too-many-public-methods,
 #   too-many-statements, too-many-instance-attributes, too-many-branches
+import contextvars
 import copy
 import itertools
+import lzma
 import os
 import platform
-import sys
+import threading
 import warnings
+import zlib
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
 from io import BytesIO
 from itertools import combinations
 from math import radians, inf, pi, sin, cos, tan, copysign, ceil, floor
+from pathlib import Path
 from typing import (
     Any,
+    BinaryIO,
     Callable,
     Dict,
     Iterable,
     Iterator,
+    NamedTuple,
     Optional,
     Protocol,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -61,17 +71,18 @@ from typing import (
 from typing import cast as tcast
 from typing_extensions import Self, Literal
 
+import numpy as np
 from anytree import NodeMixin, PreOrderIter, RenderTree
-from scipy.spatial import ConvexHull
+from scipy.spatial import ConvexHull, cKDTree
 from vtkmodules.vtkCommonDataModel import vtkPolyData
 from vtkmodules.vtkFiltersCore import vtkPolyDataNormals, vtkTriangleFilter
 
 import OCP.GeomAbs as ga  # Geometry type enum
 import OCP.TopAbs as ta  # Topology type enum
-from OCP.Aspect import Aspect_TOL_SOLID
+from OCP.Aspect import Aspect_TOD_ABSOLUTE, Aspect_TOL_SOLID
 from OCP.BOPAlgo import BOPAlgo_GlueEnum
 
-from OCP.BRep import BRep_Tool
+from OCP.BRep import BRep_Builder, BRep_Tool
 from OCP.BRepAdaptor import (
     BRepAdaptor_CompCurve,
     BRepAdaptor_Curve,
@@ -137,14 +148,10 @@ from OCP.BRepPrimAPI import (
     BRepPrimAPI_MakeWedge,
 )
 from OCP.BRepProj import BRepProj_Projection
-from OCP.BRepTools import BRepTools
-from OCP.Font import (
-    Font_FA_Bold,
-    Font_FA_Italic,
-    Font_FA_Regular,
-    Font_FontMgr,
-    Font_SystemFont,
-)
+from OCP.BinTools import BinTools, BinTools_FormatVersion
+from OCP.Bnd import Bnd_Box2d
+from OCP.BndLib import BndLib_Add2dCurve
+from OCP.BRepTools import BRepTools, BRepTools_WireExplorer
 from OCP.GC import GC_MakeArcOfCircle, GC_MakeArcOfEllipse  # geometry construction
 from OCP.gce import gce_MakeLin
 from OCP.GCPnts import GCPnts_AbscissaPoint
@@ -158,7 +165,9 @@ from OCP.Geom import (
     Geom_Line,
 )
 from OCP.Geom2d import Geom2d_Curve, Geom2d_Line, Geom2d_TrimmedCurve
+from OCP.Geom2dAdaptor import Geom2dAdaptor_Curve
 from OCP.Geom2dAPI import Geom2dAPI_InterCurveCurve
+from OCP.Geom2dInt import Geom2dInt_GInter
 from OCP.GeomAbs import GeomAbs_C0, GeomAbs_Intersection, GeomAbs_JoinType
 from OCP.GeomAPI import (
     GeomAPI_Interpolate,
@@ -168,6 +177,7 @@ from OCP.GeomAPI import (
     GeomAPI_ProjectPointOnSurf,
     GeomAPI_ProjectPointOnCurve,
 )
+from OCP.GeomProjLib import GeomProjLib
 from OCP.GeomFill import (
     GeomFill_CorrectedFrenet,
     GeomFill_Frenet,
@@ -181,6 +191,7 @@ from OCP.gp import (
     gp_Dir,
     gp_Dir2d,
     gp_Elips,
+    gp_Pln,
     gp_Pnt,
     gp_Pnt2d,
     gp_Trsf,
@@ -190,13 +201,17 @@ from OCP.gp import (
 # properties used to store mass calculation result
 from OCP.GProp import GProp_GProps
 from OCP.HLRAlgo import HLRAlgo_Projector
-from OCP.HLRBRep import HLRBRep_Algo, HLRBRep_HLRToShape
+from OCP.HLRBRep import (
+    HLRBRep_Algo,
+    HLRBRep_HLRToShape,
+    HLRBRep_PolyAlgo,
+    HLRBRep_PolyHLRToShape,
+)
 from OCP.IFSelect import IFSelect_ReturnStatus
 from OCP.Interface import Interface_Static
 from OCP.IVtkOCC import IVtkOCC_Shape, IVtkOCC_ShapeMesher
 from OCP.IVtkVTK import IVtkVTK_ShapeData
 from OCP.LocOpe import LocOpe_DPrism
-from OCP.NCollection import NCollection_Utf8String
 from OCP.Precision import Precision
 from OCP.Prs3d import Prs3d_IsoAspect
 from OCP.Quantity import Quantity_Color
@@ -217,10 +232,7 @@ from OCP.Standard import (
     Standard_ConstructionError,
 )
 from OCP.StdFail import StdFail_NotDone
-from OCP.StdPrs import StdPrs_BRepFont
-from OCP.StdPrs import StdPrs_BRepTextBuilder as Font_BRepTextBuilder
 from OCP.STEPControl import STEPControl_AsIs, STEPControl_Writer
-from OCP.StlAPI import StlAPI_Writer
 
 # Array of vectors (used for B-spline interpolation):
 # Array of points (used for B-spline construction):
@@ -230,7 +242,6 @@ from OCP.TColgp import (
     TColgp_HArray1OfPnt,
     TColgp_HArray2OfPnt,
 )
-from OCP.TCollection import TCollection_AsciiString
 
 # Array of floats (used for B-spline interpolation):
 # Array of booleans (used for B-spline interpolation):
@@ -246,6 +257,7 @@ from OCP.TopoDS import (
     TopoDS,
     TopoDS_Builder,
     TopoDS_Compound,
+    TopoDS_Edge,
     TopoDS_Face,
     TopoDS_Iterator,
     TopoDS_Shape,
@@ -265,7 +277,9 @@ from build123d.build_enums import (
     CenterOf,
     FontStyle,
     FrameMethod,
+    FuseStrategy,
     GeomType,
+    GlueMode,
     Keep,
     Kind,
     PositionMode,
@@ -287,10 +301,45 @@ from build123d.geometry import (
     VectorLike,
     logger,
 )
+from build123d.fonts import glyph_cache
+from build123d.parallel import Parallelism, occt_parallel
+from build123d.tessellation import mesh_lock, tessellation_cache
 
 
 HASH_CODE_MAX = 2147483647  # max 32bit signed int, required by OCC.Core.HashCode
 
+# Binary BRep files are recognized by their extension, optionally compressed
+BIN_BREP_SUFFIXES = (".bin", ".bbrep")
+BIN_BREP_COMPRESSION_SUFFIXES = {
+    ".xz": "lzma",
+    ".lzma": "lzma",
+    ".z": "zlib",
+    ".zlib": "zlib",
+}
+
+# Hidden line removal results: (hash code, camera, exact, deflection) ->
+# [(TopoDS_Shape, (visible TopoDS_Edges, hidden TopoDS_Edges))]
+HLR_CACHE_SIZE = 64
+_hlr_cache: OrderedDict[tuple, list[tuple[TopoDS_Shape, tuple[list, list]]]] = (
+    OrderedDict()
+)
+
+# Arc length parameterizations of Edges and Wires: hash code ->
+# [(TopoDS_Shape, ArcLengthTable)]. The tables hold curve adaptors and frame laws
+# that keep state between evaluations so each thread has its own cache.
+ARC_LENGTH_CACHE_SIZE = 256
+_arc_length_caches = threading.local()
+
+# Guards the module level caches when shapes are built in multiple threads
+_cache_lock = threading.RLock()
+
+# FuseStrategy.AUTO reduces at least FUSE_TREE_MIN_OPERANDS operands in a tree
+# when the bounding box of each operand overlaps at most FUSE_TREE_MAX_OVERLAPS
+# others on average. The leaves of the tree fuse FUSE_TREE_LEAF_SIZE operands.
+FUSE_TREE_MIN_OPERANDS = 64
+FUSE_TREE_MAX_OVERLAPS = 12
+FUSE_TREE_LEAF_SIZE = 16
+
 shape_LUT = {
     ta.TopAbs_VERTEX: "Vertex",
     ta.TopAbs_EDGE: "Edge",
@@ -400,9 +449,147 @@ def tuplify(obj: Any, dim: int) -> tuple:
     return result
 
 
+class ArcLengthTable:
+    """ArcLengthTable
+
+    The arc length parameterization of an Edge or Wire. Converting a normalized
+    distance along a curve into a curve parameter requires the length of the
+    curve and an integration along it. The table stores the curve adaptor, its
+    length and the cumulative length at a few parameters within each continuous
+    interval of the curve such that a parameter is found by a table lookup
+    followed by a short Newton refinement within a single segment. Lines and
+    circles are parameterized by arc length so they don't need a table.
+
+    Args:
+        adaptor (Union[BRepAdaptor_Curve, BRepAdaptor_CompCurve]): curve adaptor
+    """
+
+    segments_per_interval = 4
+
+    def __init__(self, adaptor: Union[BRepAdaptor_Curve, BRepAdaptor_CompCurve]):
+        self.adaptor = adaptor
+        self.first = adaptor.FirstParameter()
+        self.last = adaptor.LastParameter()
+        self.length = GCPnts_AbscissaPoint.Length_s(adaptor)
+        self.linear = adaptor.GetType() in [ga.GeomAbs_Line, ga.GeomAbs_Circle]
+        self._laws: dict[FrameMethod, GeomFill_TrihedronLaw] = {}
+
+    @cached_property
+    def table(self) -> tuple[np.ndarray, np.ndarray]:
+        """Curve parameters and the cumulative lengths at these parameters"""
+        intervals = TColStd_Array1OfReal(
+            1, self.adaptor.NbIntervals(ga.GeomAbs_C2) + 1
+        )
+        self.adaptor.Intervals(intervals, ga.GeomAbs_C2)
+        knots = [intervals.Value(i) for i in range(1, intervals.Length() + 1)]
+        params = np.unique(
+            np.concatenate(
+                [
+                    np.linspace(u0, u1, self.segments_per_interval + 1)
+                    for u0, u1 in zip(knots[:-1], knots[1:])
+                ]
+            )
+        )
+        lengths = np.zeros(len(params))
+        lengths[1:] = np.cumsum(
+            [
+                GCPnts_AbscissaPoint.Length_s(self.adaptor, u0, u1)
+                for u0, u1 in zip(params[:-1], params[1:])
+            ]
+        )
+        return params, lengths
+
+    def params(self, distances: Iterable[float]) -> np.ndarray:
+        """Curve parameters at normalized distances along the curve
+
+        Args:
+            distances (Iterable[float]): normalized distances, values outside of
+                0.0 to 1.0 are extrapolated
+
+        Returns:
+            np.ndarray: curve parameters
+        """
+        distances = np.asarray(distances, dtype=float).reshape(-1)
+        if self.linear:
+            return self.first + distances * (self.last - self.first)
+
+        params, lengths = self.table
+        # The table is more accurate than the length so is used to scale distances
+        targets = distances * lengths[-1]
+        segments = np.clip(
+            np.searchsorted(lengths, targets, side="right") - 1, 0, len(params) - 2
+        )
+        # Linear interpolation within the segment is the initial guess for Newton
+        spans = lengths[segments + 1] - lengths[segments]
+        fractions = np.divide(
+            targets - lengths[segments],
+            spans,
+            out=np.zeros_like(targets),
+            where=spans > 0,
+        )
+        guesses = params[segments] + fractions * (
+            params[segments + 1] - params[segments]
+        )
+        result = np.empty_like(targets)
+        for i, (distance, segment) in enumerate(zip(distances, segments)):
+            if distance in (0.0, 1.0):
+                result[i] = params[-1] if distance else params[0]
+            elif 0.0 < distance < 1.0:
+                result[i] = GCPnts_AbscissaPoint(
+                    self.adaptor,
+                    targets[i] - lengths[segment],
+                    params[segment],
+                    guesses[i],
+                ).Parameter()
+            else:
+                result[i] = GCPnts_AbscissaPoint(
+                    self.adaptor, targets[i], self.first
+                ).Parameter()
+        return result
+
+    def law(self, frame_method: FrameMethod) -> GeomFill_TrihedronLaw:
+        """The (cached) moving frame law along the curve"""
+        if frame_method not in self._laws:
+            if frame_method == FrameMethod.FRENET:
+                law = GeomFill_Frenet()
+            else:
+                law = GeomFill_CorrectedFrenet()
+            law.SetCurve(self.adaptor)
+            self._laws[frame_method] = law
+        return self._laws[frame_method]
+
+
 class Mixin1D:
     """Methods to add to the Edge and Wire classes"""
 
+    def _arc_length_table(self) -> ArcLengthTable:
+        """The (cached) arc length parameterization of this Edge or Wire"""
+        cache = getattr(_arc_length_caches, "tables", None)
+        if cache is None:
+            cache = _arc_length_caches.tables = OrderedDict()
+        key = self.wrapped.HashCode(HASH_CODE_MAX)
+        for other, table in cache.get(key, []):
+            if other.IsEqual(self.wrapped):
+                cache.move_to_end(key)
+                return table
+
+        table = ArcLengthTable(self._geom_adaptor())
+        # Store a copy as the location of self.wrapped may be changed in place
+        snapshot = self.wrapped.Located(self.wrapped.Location())
+        cache.setdefault(key, []).append((snapshot, table))
+        cache.move_to_end(key)
+        while len(cache) > ARC_LENGTH_CACHE_SIZE:
+            cache.popitem(last=False)
+        return table
+
+    def _params(
+        self, distances: Iterable[float], position_mode: PositionMode
+    ) -> np.ndarray:
+        """Curve parameters from distances or parameters"""
+        if position_mode == PositionMode.LENGTH:
+            return self._arc_length_table().params(distances)
+        return np.asarray(distances, dtype=float).reshape(-1)
+
     def start_point(self) -> Vector:
         """The start point of this edge
 
@@ -434,12 +621,20 @@ class Mixin1D:
         Returns:
             float: parameter value
         """
-        curve = self._geom_adaptor()
+        return float(self._arc_length_table().params([distance])[0])
+
+    def params_at(self, distances: Iterable[float]) -> np.ndarray:
+        """Parameters along a curve
+
+        Compute the parameter values at many normalized distances at once.
+
+        Args:
+            distances (Iterable[float]): normalized distances (0.0 >= d >= 1.0)
 
-        length = GCPnts_AbscissaPoint.Length_s(curve)
-        return GCPnts_AbscissaPoint(
-            curve, length * distance, curve.FirstParameter()
-        ).Parameter()
+        Returns:
+            np.ndarray: parameter values
+        """
+        return self._arc_length_table().params(distances)
 
     def tangent_at(
         self,
@@ -458,19 +653,35 @@ class Mixin1D:
         Returns:
             Vector: Tangent
         """
-        curve = self._geom_adaptor()
+        return Vector(*self.tangents_array([location_param], position_mode)[0])
 
-        tmp = gp_Pnt()
-        res = gp_Vec()
+    def tangents_array(
+        self,
+        distances: Iterable[float],
+        position_mode: PositionMode = PositionMode.LENGTH,
+    ) -> np.ndarray:
+        """Tangents along curve
 
-        if position_mode == PositionMode.LENGTH:
-            param = self.param_at(location_param)
-        else:
-            param = location_param
+        Compute the unit tangent vectors at many locations at once.
+
+        Args:
+            distances (Iterable[float]): distance or parameter values
+            position_mode (PositionMode, optional): position calculation mode.
+                Defaults to PositionMode.LENGTH.
 
-        curve.D1(param, tmp, res)
+        Returns:
+            np.ndarray: (n, 3) array of tangents
+        """
+        curve = self._arc_length_table().adaptor
+
+        tmp = gp_Pnt()
+        res = gp_Vec()
+        tangents = []
+        for param in self._params(distances, position_mode):
+            curve.D1(param, tmp, res)
+            tangents.append(gp_Dir(res).Coord())
 
-        return Vector(gp_Dir(res))
+        return np.array(tangents, dtype=float).reshape(-1, 3)
 
     def tangent_angle_at(
         self,
@@ -623,7 +834,7 @@ class Mixin1D:
     @property
     def length(self) -> float:
         """Edge or Wire length"""
-        return GCPnts_AbscissaPoint.Length_s(self._geom_adaptor())
+        return self._arc_length_table().length
 
     @property
     def radius(self) -> float:
@@ -672,14 +883,7 @@ class Mixin1D:
         Returns:
             Vector: position on the underlying curve
         """
-        curve = self._geom_adaptor()
-
-        if position_mode == PositionMode.LENGTH:
-            param = self.param_at(distance)
-        else:
-            param = distance
-
-        return Vector(curve.Value(param))
+        return Vector(*self.positions_array([distance], position_mode)[0])
 
     def positions(
         self,
@@ -698,7 +902,27 @@ class Mixin1D:
         Returns:
             list[Vector]: positions along curve
         """
-        return [self.position_at(d, position_mode) for d in distances]
+        return [Vector(*p) for p in self.positions_array(distances, position_mode)]
+
+    def positions_array(
+        self,
+        distances: Iterable[float],
+        position_mode: PositionMode = PositionMode.LENGTH,
+    ) -> np.ndarray:
+        """Positions along curve
+
+        Compute the positions at many locations along the underlying curve at once.
+
+        Args:
+            distances (Iterable[float]): distance or parameter values
+            position_mode (PositionMode, optional): position calculation mode.
+                Defaults to PositionMode.LENGTH.
+
+        Returns:
+            np.ndarray: (n, 3) array of positions
+        """
+        curve = self._arc_length_table().adaptor
+        return _curve_points(curve, self._params(distances, position_mode))
 
     def location_at(
         self,
@@ -723,37 +947,13 @@ class Mixin1D:
             Location: A Location object representing local coordinate system
                 at the specified distance.
         """
-        curve = self._geom_adaptor()
-
-        if position_mode == PositionMode.LENGTH:
-            param = self.param_at(distance)
-        else:
-            param = distance
-
-        law: GeomFill_TrihedronLaw
-        if frame_method == FrameMethod.FRENET:
-            law = GeomFill_Frenet()
-        else:
-            law = GeomFill_CorrectedFrenet()
-
-        law.SetCurve(curve)
-
-        tangent, normal, binormal = gp_Vec(), gp_Vec(), gp_Vec()
-
-        law.D0(param, tangent, normal, binormal)
-        pnt = curve.Value(param)
-
-        transformation = gp_Trsf()
-        if planar:
-            transformation.SetTransformation(
-                gp_Ax3(pnt, gp_Dir(0, 0, 1), gp_Dir(normal.XYZ())), gp_Ax3()
+        return Location(
+            TopLoc_Location(
+                self._frame_transformations(
+                    [distance], position_mode, frame_method, planar
+                )[0]
             )
-        else:
-            transformation.SetTransformation(
-                gp_Ax3(pnt, gp_Dir(tangent.XYZ()), gp_Dir(normal.XYZ())), gp_Ax3()
-            )
-
-        return Location(TopLoc_Location(transformation))
+        )
 
     def locations(
         self,
@@ -779,8 +979,73 @@ class Mixin1D:
                 systems at the specified distances.
         """
         return [
-            self.location_at(d, position_mode, frame_method, planar) for d in distances
+            Location(TopLoc_Location(transformation))
+            for transformation in self._frame_transformations(
+                distances, position_mode, frame_method, planar
+            )
+        ]
+
+    def frames_array(
+        self,
+        distances: Iterable[float],
+        position_mode: PositionMode = PositionMode.LENGTH,
+        frame_method: FrameMethod = FrameMethod.FRENET,
+        planar: bool = False,
+    ) -> np.ndarray:
+        """Frames along curve
+
+        Compute the local coordinate systems at many locations along the curve
+        at once as used by `locations`.
+
+        Args:
+            distances (Iterable[float]): distance or parameter values
+            position_mode (PositionMode, optional): position calculation mode.
+                Defaults to PositionMode.LENGTH.
+            frame_method (FrameMethod, optional): moving frame calculation method.
+                Defaults to FrameMethod.FRENET.
+            planar (bool, optional): planar mode. Defaults to False.
+
+        Returns:
+            np.ndarray: (n, 4, 4) array of homogeneous transformation matrices
+        """
+        matrices = [
+            [[t.Value(row, col) for col in range(1, 5)] for row in range(1, 4)]
+            + [[0.0, 0.0, 0.0, 1.0]]
+            for t in self._frame_transformations(
+                distances, position_mode, frame_method, planar
+            )
         ]
+        return np.array(matrices, dtype=float).reshape(-1, 4, 4)
+
+    def _frame_transformations(
+        self,
+        distances: Iterable[float],
+        position_mode: PositionMode,
+        frame_method: FrameMethod,
+        planar: bool,
+    ) -> list[gp_Trsf]:
+        """The transformations of the moving frame at the given distances"""
+        table = self._arc_length_table()
+        curve = table.adaptor
+        law = table.law(frame_method)
+
+        tangent, normal, binormal = gp_Vec(), gp_Vec(), gp_Vec()
+        transformations = []
+        for param in self._params(distances, position_mode):
+            law.D0(param, tangent, normal, binormal)
+            pnt = curve.Value(param)
+
+            transformation = gp_Trsf()
+            if planar:
+                transformation.SetTransformation(
+                    gp_Ax3(pnt, gp_Dir(0, 0, 1), gp_Dir(normal.XYZ())), gp_Ax3()
+                )
+            else:
+                transformation.SetTransformation(
+                    gp_Ax3(pnt, gp_Dir(tangent.XYZ()), gp_Dir(normal.XYZ())), gp_Ax3()
+                )
+            transformations.append(transformation)
+        return transformations
 
     def __matmul__(self: Union[Edge, Wire], position: float) -> Vector:
         """Position on wire operator @"""
@@ -948,7 +1213,9 @@ class Mixin1D:
 
             for shape in shapes:
                 dist_calc.LoadS2(shape.wrapped)
-                dist_calc.Perform()
+                with occt_parallel("analysis") as parallel:
+                    dist_calc.SetMultiThread(parallel)
+                    dist_calc.Perform()
                 dist = dist_calc.Value()
 
                 if dist < min_dist:
@@ -1808,10 +2075,14 @@ class Shape(NodeMixin):
         tolerance: float = 1e-3,
         angular_tolerance: float = 0.1,
         ascii_format: bool = False,
+        target_triangles: int = None,
+        chordal_error: float = None,
     ) -> bool:
         """Export STL
 
-        Exports a shape to a specified STL file.
+        Exports a shape to a specified STL file. The tessellation is drawn from (and
+        added to) the shared tessellation cache. Instead of a tolerance, the level of
+        detail may be given as a triangle budget or a size relative chordal error.
 
         Args:
             file_name (str): The path and file name to write the STL output to.
@@ -1824,23 +2095,64 @@ class Shape(NodeMixin):
                 between subsequent segments in a polyline. Defaults to 0.1.
             ascii_format (bool, optional): Export the file as ASCII (True) or binary (False)
                 STL format. Defaults to False (binary).
+            target_triangles (int, optional): approximate number of triangles in the
+                mesh, overrides tolerance. Defaults to None.
+            chordal_error (float, optional): maximum distance between the mesh and the
+                shape as a fraction of the shape's bounding box diagonal, overrides
+                tolerance. Defaults to None.
 
         Returns:
             bool: Success
         """
-        mesh = BRepMesh_IncrementalMesh(
-            self.wrapped, tolerance, True, angular_tolerance
+        positions, _normals, indices = tessellation_cache.tessellate(
+            self.wrapped,
+            tolerance,
+            angular_tolerance,
+            target_triangles=target_triangles,
+            chordal_error=chordal_error,
+        )
+        corners = positions[indices].astype(np.float32)
+        facet_normals = np.cross(
+            corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]
+        )
+        lengths = np.linalg.norm(facet_normals, axis=1, keepdims=True)
+        facet_normals = np.divide(
+            facet_normals,
+            lengths,
+            out=np.zeros_like(facet_normals),
+            where=lengths > 0,
         )
-        mesh.Perform()
-
-        writer = StlAPI_Writer()
 
         if ascii_format:
-            writer.ASCIIMode = True
+            with open(file_name, "w", encoding="ascii") as stl_file:
+                stl_file.write("solid\n")
+                for normal, corner in zip(facet_normals, corners):
+                    stl_file.write(
+                        " facet normal {:e} {:e} {:e}\n".format(*normal)
+                        + "  outer loop\n"
+                        + "   vertex {:e} {:e} {:e}\n".format(*corner[0])
+                        + "   vertex {:e} {:e} {:e}\n".format(*corner[1])
+                        + "   vertex {:e} {:e} {:e}\n".format(*corner[2])
+                        + "  endloop\n endfacet\n"
+                    )
+                stl_file.write("endsolid\n")
         else:
-            writer.ASCIIMode = False
+            facets = np.zeros(
+                len(indices),
+                dtype=[
+                    ("normal", "<f4", (3,)),
+                    ("corners", "<f4", (3, 3)),
+                    ("attribute", "<u2"),
+                ],
+            )
+            facets["normal"] = facet_normals
+            facets["corners"] = corners
+            with open(file_name, "wb") as stl_file:
+                stl_file.write(b"build123d".ljust(80, b" "))
+                stl_file.write(np.uint32(len(indices)).tobytes())
+                stl_file.write(facets.tobytes())
 
-        return writer.Write(self.wrapped, file_name)
+        return True
 
     def export_step(self, file_name: str, **kwargs) -> IFSelect_ReturnStatus:
         """Export this shape to a STEP file.
@@ -1870,17 +2182,74 @@ class Shape(NodeMixin):
     def export_brep(self, file: Union[str, BytesIO]) -> bool:
         """Export this shape to a BREP file
 
+        Files with a binary BRep extension (e.g. ``.bin`` or ``.bbrep.xz``) are
+        written with `export_bin_brep`.
+
         Args:
             file: Union[str, BytesIO]:
 
         Returns:
 
         """
+        if isinstance(file, (str, os.PathLike)) and bin_brep_format(file)[0]:
+            return self.export_bin_brep(file)
 
         return_value = BRepTools.Write_s(self.wrapped, file)
 
         return True if return_value is None else return_value
 
+    def export_bin_brep(
+        self,
+        file: Union[str, os.PathLike, BinaryIO],
+        compression: Optional[Literal["zlib", "lzma"]] = None,
+        with_triangles: bool = True,
+    ) -> bool:
+        """Export this shape to a binary BREP file
+
+        OCCT's binary BRep format is both smaller and much faster to read than
+        the text format written by `export_brep`. The compression defaults to
+        that of the file extension, i.e. ``.xz`` or ``.lzma`` for lzma and ``.z``
+        or ``.zlib`` for zlib.
+
+        Args:
+            file (Union[str, os.PathLike, BinaryIO]): file path or binary stream
+            compression (Literal["zlib", "lzma"], optional): compression of the
+                file. Defaults to None.
+            with_triangles (bool, optional): include the triangulation of the
+                faces. Defaults to True.
+
+        Raises:
+            ValueError: Unknown compression
+
+        Returns:
+            bool: write successful
+        """
+        if compression is None and isinstance(file, (str, os.PathLike)):
+            compression = bin_brep_format(file)[1]
+        if compression not in [None, "zlib", "lzma"]:
+            raise ValueError(f"Unknown compression {compression}")
+
+        version = BinTools_FormatVersion.BinTools_FormatVersion_CURRENT
+        if compression is None and isinstance(file, (str, os.PathLike)):
+            return BinTools.Write_s(
+                self.wrapped, os.fspath(file), with_triangles, False, version
+            )
+
+        stream = BytesIO()
+        BinTools.Write_s(self.wrapped, stream, with_triangles, False, version)
+        data = stream.getvalue()
+        if compression == "zlib":
+            data = zlib.compress(data)
+        elif compression == "lzma":
+            data = lzma.compress(data)
+
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "wb") as bin_brep_file:
+                bin_brep_file.write(data)
+        else:
+            file.write(data)
+        return True
+
     def geom_type(self) -> Geoms:
         """Gets the underlying geometry type.
 
@@ -1978,18 +2347,24 @@ class Shape(NodeMixin):
         Returns:
 
         """
-        return BRepCheck_Analyzer(self.wrapped).IsValid()
+        with occt_parallel("analysis") as parallel:
+            return BRepCheck_Analyzer(self.wrapped, True, parallel).IsValid()
 
-    def bounding_box(self, tolerance: float = None) -> BoundBox:
+    def bounding_box(self, tolerance: float = None, optimal: bool = True) -> BoundBox:
         """Create a bounding box for this Shape.
 
         Args:
             tolerance (float, optional): Defaults to None.
+            optimal (bool, optional): compute the precise box of the geometry
+                rather than the faster box of a mesh of the shape, which includes
+                a margin. Defaults to True.
 
         Returns:
             BoundBox: A box sized to contain this Shape
         """
-        return BoundBox._from_topo_ds(self.wrapped, tolerance=tolerance)
+        return BoundBox._from_topo_ds(
+            self.wrapped, tolerance=tolerance, optimal=optimal
+        )
 
     def mirror(self, mirror_plane: Plane = None) -> Self:
         """
@@ -2476,7 +2851,9 @@ class Shape(NodeMixin):
         dist_calc = BRepExtrema_DistShapeShape()
         dist_calc.LoadS1(self.wrapped)
         dist_calc.LoadS2(other.wrapped)
-        dist_calc.Perform()
+        with occt_parallel("analysis") as parallel:
+            dist_calc.SetMultiThread(parallel)
+            dist_calc.Perform()
         return (
             dist_calc.Value(),
             Vector(dist_calc.PointOnShape1(1)),
@@ -2524,8 +2901,9 @@ class Shape(NodeMixin):
         operation.SetArguments(arg)
         operation.SetTools(tool)
 
-        operation.SetRunParallel(True)
-        operation.Build()
+        with occt_parallel("boolean") as parallel:
+            operation.SetRunParallel(parallel)
+            operation.Build()
 
         return Shape.cast(operation.Shape())
 
@@ -2543,19 +2921,41 @@ class Shape(NodeMixin):
 
         return self._bool_op((self,), to_cut, cut_op)
 
-    def fuse(self, *to_fuse: Shape, glue: bool = False, tol: float = None) -> Self:
+    def fuse(
+        self,
+        *to_fuse: Shape,
+        glue: Optional[bool] = None,
+        tol: float = None,
+        strategy: FuseStrategy = FuseStrategy.AUTO,
+        max_workers: int = 1,
+    ) -> Self:
         """fuse
 
         Fuse a sequence of shapes into a single shape.
 
+        Large numbers of shapes can be fused by reducing them in a balanced tree of
+        spatially clustered operands instead of with a single boolean operation,
+        which limits the size of each operation and allows independent subtrees to
+        be fused in separate processes.
+
         Args:
             to_fuse (sequence Shape): shapes to fuse
-            glue (bool, optional): performance improvement for some shapes. Defaults to False.
+            glue (bool, optional): skip the intersection of faces, which is much
+                faster for shapes that only touch. Defaults to None, which uses
+                `DefaultGlue.mode` to select glue automatically.
             tol (float, optional): tolerance. Defaults to None.
+            strategy (FuseStrategy, optional): fuse all of the shapes at once, in a
+                tree or select automatically by operand count and bounding box
+                overlaps. Defaults to FuseStrategy.AUTO.
+            max_workers (int, optional): maximum number of processes used by the
+                tree strategy, None uses the number set by Parallelism. Defaults to 1.
 
         Returns:
             Shape: fused shape
         """
+        glue = _select_glue((self, *to_fuse), glue, tol)
+        if _select_fuse_strategy((self, *to_fuse), strategy) == FuseStrategy.TREE:
+            return _fuse_tree((self, *to_fuse), glue, tol, max_workers)
 
         fuse_op = BRepAlgoAPI_Fuse()
         if glue:
@@ -2732,7 +3132,9 @@ class Shape(NodeMixin):
         splitter.SetTools(tool_list)
 
         # Perform the splitting operation
-        splitter.Build()
+        with occt_parallel("boolean") as parallel:
+            splitter.SetRunParallel(parallel)
+            splitter.Build()
 
         if keep == Keep.BOTH:
             result = Compound(downcast(splitter.Shape()))
@@ -2767,7 +3169,13 @@ class Shape(NodeMixin):
 
         """
 
-        return BRepExtrema_DistShapeShape(self.wrapped, other.wrapped).Value()
+        dist_calc = BRepExtrema_DistShapeShape()
+        dist_calc.LoadS1(self.wrapped)
+        dist_calc.LoadS2(other.wrapped)
+        with occt_parallel("analysis") as parallel:
+            dist_calc.SetMultiThread(parallel)
+            dist_calc.Perform()
+        return dist_calc.Value()
 
     def distances(self, *others: Shape) -> Iterator[float]:
         """Minimal distances to between self and other shapes
@@ -2784,7 +3192,9 @@ class Shape(NodeMixin):
 
         for other_shape in others:
             dist_calc.LoadS2(other_shape.wrapped)
-            dist_calc.Perform()
+            with occt_parallel("analysis") as parallel:
+                dist_calc.SetMultiThread(parallel)
+                dist_calc.Perform()
 
             yield dist_calc.Value()
 
@@ -2799,49 +3209,51 @@ class Shape(NodeMixin):
 
         """
 
-        if not BRepTools.Triangulation_s(self.wrapped, tolerance):
-            BRepMesh_IncrementalMesh(self.wrapped, tolerance, True, angular_tolerance)
+        with mesh_lock:
+            if not BRepTools.Triangulation_s(self.wrapped, tolerance):
+                with occt_parallel("mesh") as parallel:
+                    BRepMesh_IncrementalMesh(
+                        self.wrapped, tolerance, True, angular_tolerance, parallel
+                    )
 
     def tessellate(
-        self, tolerance: float, angular_tolerance: float = 0.1
+        self,
+        tolerance: float = None,
+        angular_tolerance: float = 0.1,
+        target_triangles: int = None,
+        chordal_error: float = None,
     ) -> Tuple[list[Vector], list[Tuple[int, int, int]]]:
-        """General triangulated approximation"""
-        self.mesh(tolerance, angular_tolerance)
-
-        vertices: list[Vector] = []
-        triangles: list[Tuple[int, int, int]] = []
-        offset = 0
-
-        for face in self.faces():
-            loc = TopLoc_Location()
-            poly = BRep_Tool.Triangulation_s(face.wrapped, loc)
-            trsf = loc.Transformation()
-            reverse = face.wrapped.Orientation() == TopAbs_Orientation.TopAbs_REVERSED
-
-            # add vertices
-            vertices += [
-                Vector(v.X(), v.Y(), v.Z())
-                for v in (
-                    poly.Node(i).Transformed(trsf) for i in range(1, poly.NbNodes() + 1)
-                )
-            ]
-            # add triangles
-            triangles += [
-                (
-                    t.Value(1) + offset - 1,
-                    t.Value(3) + offset - 1,
-                    t.Value(2) + offset - 1,
-                )
-                if reverse
-                else (
-                    t.Value(1) + offset - 1,
-                    t.Value(2) + offset - 1,
-                    t.Value(3) + offset - 1,
-                )
-                for t in poly.Triangles()
-            ]
+        """General triangulated approximation
+
+        The tessellation is drawn from (and added to) the shared tessellation cache.
+        The level of detail is given by one of tolerance, target_triangles or
+        chordal_error.
 
-            offset += poly.NbNodes()
+        Args:
+            tolerance (float, optional): linear deflection relative to the size of
+                each edge. Defaults to None.
+            angular_tolerance (float, optional): angular deflection. Defaults to 0.1.
+            target_triangles (int, optional): approximate number of triangles.
+                Defaults to None.
+            chordal_error (float, optional): maximum distance between the mesh and
+                the shape as a fraction of the shape's bounding box diagonal.
+                Defaults to None.
+
+        Raises:
+            ValueError: no level of detail provided
+
+        Returns:
+            Tuple[list[Vector], list[Tuple[int, int, int]]]: vertices and triangles
+        """
+        positions, _normals, indices = tessellation_cache.tessellate(
+            self.wrapped,
+            tolerance,
+            angular_tolerance,
+            target_triangles=target_triangles,
+            chordal_error=chordal_error,
+        )
+        vertices = [Vector(*v) for v in positions.tolist()]
+        triangles = [tuple(t) for t in indices.tolist()]
 
         return vertices, triangles
 
@@ -2882,6 +3294,8 @@ class Shape(NodeMixin):
         tolerance: float = None,
         angular_tolerance: float = None,
         normals: bool = False,
+        target_triangles: int = None,
+        chordal_error: float = None,
     ) -> vtkPolyData:
         """Convert shape to vtkPolyData
 
@@ -2889,6 +3303,9 @@ class Shape(NodeMixin):
           tolerance: float:
           angular_tolerance: float:  (Default value = 0.1)
           normals: bool:  (Default value = True)
+          target_triangles: int: approximate number of triangles (Default value = None)
+          chordal_error: float: deflection as a fraction of the bounding box
+            diagonal (Default value = None)
 
         Returns: data object in VTK consisting of points, vertices, lines, and polygons
         """
@@ -2900,7 +3317,17 @@ class Shape(NodeMixin):
         drawer.SetUIsoAspect(Prs3d_IsoAspect(Quantity_Color(), Aspect_TOL_SOLID, 1, 0))
         drawer.SetVIsoAspect(Prs3d_IsoAspect(Quantity_Color(), Aspect_TOL_SOLID, 1, 0))
 
-        if tolerance:
+        if target_triangles is not None or chordal_error is not None:
+            drawer.SetTypeOfDeflection(Aspect_TOD_ABSOLUTE)
+            drawer.SetMaximalChordialDeviation(
+                tessellation_cache.deflection(
+                    self.wrapped,
+                    target_triangles,
+                    chordal_error,
+                    0.5 if angular_tolerance is None else angular_tolerance,
+                )
+            )
+        elif tolerance:
             drawer.SetDeviationCoefficient(tolerance)
 
         if angular_tolerance:
@@ -3155,95 +3582,151 @@ class Shape(NodeMixin):
         """
         return obj._extrude(direction)
 
+    def _hlr_key(
+        self,
+        viewport_origin: VectorLike,
+        viewport_up: VectorLike,
+        look_at: Optional[VectorLike],
+        exact: bool,
+        deflection: float,
+    ) -> tuple:
+        """The hidden line removal cache key of a view of this shape"""
+        camera = (
+            Vector(viewport_origin).to_tuple(),
+            Vector(viewport_up).to_tuple(),
+            Vector(look_at).to_tuple() if look_at else self.center().to_tuple(),
+        )
+        return (self.wrapped.HashCode(HASH_CODE_MAX), camera, exact, deflection)
+
+    def _hlr_cached(self, key: tuple) -> Optional[tuple[list, list]]:
+        """Find the hidden line removal result of key in the cache"""
+        with _cache_lock:
+            for other, result in _hlr_cache.get(key, []):
+                if other.IsEqual(self.wrapped):
+                    _hlr_cache.move_to_end(key)
+                    return result
+        return None
+
+    def _hlr_store(self, key: tuple, result: tuple[list, list]):
+        """Add a hidden line removal result to the cache"""
+        with _cache_lock:
+            _hlr_cache.setdefault(key, []).append((self.wrapped, result))
+            _hlr_cache.move_to_end(key)
+            while len(_hlr_cache) > HLR_CACHE_SIZE:
+                _hlr_cache.popitem(last=False)
+
     def project_to_viewport(
         self,
         viewport_origin: VectorLike,
         viewport_up: VectorLike = (0, 0, 1),
         look_at: VectorLike = None,
+        exact: bool = True,
+        deflection: float = 1e-3,
     ) -> tuple[ShapeList[Edge], ShapeList[Edge]]:
         """project_to_viewport
 
         Project a shape onto a viewport returning visible and hidden Edges.
 
+        The exact hidden line removal algorithm works on the boundary representation
+        of the shape and generates precise curves but can be slow for complex
+        shapes. With exact=False the (much faster) polygonal algorithm is used
+        instead which works on a tessellation of the shape and generates line
+        segments whose accuracy is controlled by deflection. Results are cached
+        by shape and camera so repeated projections are free.
+
         Args:
             viewport_origin (VectorLike): location of viewport
             viewport_up (VectorLike, optional): direction of the viewport y axis.
                 Defaults to (0, 0, 1).
             look_at (VectorLike, optional): point to look at.
                 Defaults to None (center of shape).
+            exact (bool, optional): use exact (True) or polygonal (False) hidden
+                line removal. Defaults to True.
+            deflection (float, optional): maximum distance between the shape and
+                the tessellation used by polygonal hidden line removal.
+                Defaults to 1e-3.
 
         Returns:
             tuple[ShapeList[Edge],ShapeList[Edge]]: visible & hidden Edges
         """
+        key = self._hlr_key(viewport_origin, viewport_up, look_at, exact, deflection)
+        result = self._hlr_cached(key)
+        if result is None:
+            result = _hidden_line_removal(self.wrapped, *key[1], exact, deflection)
+            self._hlr_store(key, result)
 
-        def extract_edges(compound):
-            edges = []  # List to store the extracted edges
-
-            # Create a TopExp_Explorer to traverse the sub-shapes of the compound
-            explorer = TopExp_Explorer(compound, TopAbs_ShapeEnum.TopAbs_EDGE)
-
-            # Loop through the sub-shapes and extract edges
-            while explorer.More():
-                edge = downcast(explorer.Current())
-                edges.append(edge)
-                explorer.Next()
-
-            return edges
-
-        # Setup the projector
-        hidden_line_removal = HLRBRep_Algo()
-        hidden_line_removal.Add(self.wrapped)
-
-        viewport_origin = Vector(viewport_origin)
-        look_at = Vector(look_at) if look_at else self.center()
-        projection_dir: Vector = (viewport_origin - look_at).normalized()
-        viewport_up = Vector(viewport_up).normalized()
-        camera_coordinate_system = gp_Ax2()
-        camera_coordinate_system.SetAxis(
-            gp_Ax1(viewport_origin.to_pnt(), projection_dir.to_dir())
-        )
-        camera_coordinate_system.SetYDirection(viewport_up.to_dir())
-        projector = HLRAlgo_Projector(camera_coordinate_system)
-
-        hidden_line_removal.Projector(projector)
-        hidden_line_removal.Update()
-        hidden_line_removal.Hide()
-
-        hlr_shapes = HLRBRep_HLRToShape(hidden_line_removal)
+        visible_edges, hidden_edges = result
+        return (ShapeList(map(Edge, visible_edges)), ShapeList(map(Edge, hidden_edges)))
 
-        # Create the visible edges
-        visible_edges = []
-        for edges in [
-            hlr_shapes.VCompound(),
-            hlr_shapes.Rg1LineVCompound(),
-            hlr_shapes.OutLineVCompound(),
-        ]:
-            if not edges.IsNull():
-                visible_edges.extend(extract_edges(downcast(edges)))
-
-        # Create the hidden edges
-        hidden_edges = []
-        for edges in [
-            hlr_shapes.HCompound(),
-            hlr_shapes.OutLineHCompound(),
-            hlr_shapes.Rg1LineHCompound(),
-        ]:
-            if not edges.IsNull():
-                hidden_edges.extend(extract_edges(downcast(edges)))
-
-        # Fix the underlying geometry - otherwise we will get segfaults
-        for edge in visible_edges:
-            BRepLib.BuildCurves3d_s(edge, TOLERANCE)
-        for edge in hidden_edges:
-            BRepLib.BuildCurves3d_s(edge, TOLERANCE)
+    def project_to_viewports(
+        self,
+        viewports: Iterable[Sequence[VectorLike]],
+        exact: bool = True,
+        deflection: float = 1e-3,
+        max_workers: int = None,
+    ) -> list[tuple[ShapeList[Edge], ShapeList[Edge]]]:
+        """project_to_viewports
+
+        Project a shape onto multiple viewports - e.g. the views of a drawing -
+        returning visible and hidden Edges for each. Views that are not already in
+        the cache are computed in parallel in separate processes.
+
+        Args:
+            viewports (Iterable[Sequence[VectorLike]]): for each view the
+                viewport_origin and optionally viewport_up and look_at as described
+                in `project_to_viewport`
+            exact (bool, optional): use exact (True) or polygonal (False) hidden
+                line removal. Defaults to True.
+            deflection (float, optional): maximum distance between the shape and
+                the tessellation used by polygonal hidden line removal.
+                Defaults to 1e-3.
+            max_workers (int, optional): maximum number of processes, 1 disables
+                multiprocessing. Defaults to None (the number of "hlr" threads set
+                by Parallelism).
 
-        # convert to native shape objects
-        # visible_edges = ShapeList(map(Shape, visible_edges))
-        # hidden_edges = ShapeList(map(Shape, hidden_edges))
-        visible_edges = ShapeList(map(Edge, visible_edges))
-        hidden_edges = ShapeList(map(Edge, hidden_edges))
+        Returns:
+            list[tuple[ShapeList[Edge], ShapeList[Edge]]]: visible & hidden Edges
+                of each view
+        """
+        keys = []
+        for viewport in viewports:
+            viewport_origin, viewport_up, look_at = (
+                tuple(viewport) + ((0, 0, 1), None)[len(viewport) - 1 :]
+            )
+            keys.append(
+                self._hlr_key(viewport_origin, viewport_up, look_at, exact, deflection)
+            )
+        results = [self._hlr_cached(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+
+        if max_workers is None:
+            max_workers = Parallelism.threads("hlr")
+        if len(missing) > 1 and max_workers != 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        _hidden_line_removal,
+                        self.wrapped,
+                        *keys[i][1],
+                        exact,
+                        deflection,
+                    )
+                    for i in missing
+                ]
+                for i, future in zip(missing, futures):
+                    results[i] = future.result()
+        else:
+            for i in missing:
+                results[i] = _hidden_line_removal(
+                    self.wrapped, *keys[i][1], exact, deflection
+                )
+        for i in missing:
+            self._hlr_store(keys[i], results[i])
 
-        return (visible_edges, hidden_edges)
+        return [
+            (ShapeList(map(Edge, visible)), ShapeList(map(Edge, hidden)))
+            for visible, hidden in results
+        ]
 
 
 # This TypeVar allows IDEs to see the type of objects within the ShapeList
@@ -3987,74 +4470,72 @@ class Compound(Mixin3D, Shape):
         """
         # pylint: disable=too-many-locals
 
-        def position_face(orig_face: "Face") -> "Face":
-            """
-            Reposition a face to the provided path
-
-            Local coordinates are used to calculate the position of the face
-            relative to the path. Global coordinates to position the face.
-            """
-            bbox = orig_face.bounding_box()
-            face_bottom_center = Vector((bbox.min.X + bbox.max.X) / 2, 0, 0)
-            relative_position_on_wire = (
-                position_on_path + face_bottom_center.X / path_length
-            )
-            wire_tangent = text_path.tangent_at(relative_position_on_wire)
-            wire_angle = Vector(1, 0, 0).get_signed_angle(wire_tangent)
-            wire_position = text_path.position_at(relative_position_on_wire)
-
-            return orig_face.translate(wire_position - face_bottom_center).rotate(
-                Axis(wire_position, (0, 0, 1)),
-                -wire_angle,
-            )
-
-        if sys.platform.startswith("linux"):
-            os.environ["FONTCONFIG_FILE"] = "/etc/fonts/fonts.conf"
-            os.environ["FONTCONFIG_PATH"] = "/etc/fonts/"
-
-        font_kind = {
-            FontStyle.REGULAR: Font_FA_Regular,
-            FontStyle.BOLD: Font_FA_Bold,
-            FontStyle.ITALIC: Font_FA_Italic,
-        }[font_style]
-
-        mgr = Font_FontMgr.GetInstance_s()
-
-        if font_path and mgr.CheckFont(TCollection_AsciiString(font_path).ToCString()):
-            font_t = Font_SystemFont(TCollection_AsciiString(font_path))
-            font_t.SetFontPath(font_kind, TCollection_AsciiString(font_path))
-            mgr.RegisterFont(font_t, True)
-
-        else:
-            font_t = mgr.FindFont(TCollection_AsciiString(font), font_kind)
-
-        logger.info(
-            "Creating text with font %s located at %s",
-            font_t.FontName().ToCString(),
-            font_t.FontPath(font_kind).ToCString(),
-        )
-
-        builder = Font_BRepTextBuilder()
-        font_i = StdPrs_BRepFont(
-            NCollection_Utf8String(font_t.FontName().ToCString()),
-            font_kind,
-            float(font_size),
+        # Assemble the text from cached glyphs, aligned by the text's bounding box
+        placed_glyphs, bounding_box = glyph_cache.layout(
+            txt, font_size, font, font_path, font_style
         )
-        text_flat = Compound(builder.Perform(font_i, NCollection_Utf8String(txt)))
-
-        # Align the text from the bounding box
         align = tuplify(align, 2)
-        text_flat = text_flat.translate(
-            Vector(*text_flat.bounding_box().to_align_offset(align))
+        offset = (
+            Vector()
+            if bounding_box.IsVoid()
+            else Vector(*BoundBox(bounding_box).to_align_offset(align))
         )
+        alignment = gp_Trsf()
+        alignment.SetTranslation(offset.wrapped)
+        placements = [(glyph, alignment * position) for glyph, position in placed_glyphs]
+
+        text_compound = TopoDS_Compound()
+        builder = TopoDS_Builder()
+        builder.MakeCompound(text_compound)
+        if text_path is None:
+            for glyph, placement in placements:
+                builder.Add(text_compound, glyph.shape.Moved(TopLoc_Location(placement)))
+        else:
+            # Each face is positioned by the center of its base on the path
+            faces, centers = [], []
+            for glyph, placement in placements:
+                for face, face_box in glyph.faces:
+                    x_min, _, _, x_max, _, _ = face_box.Get()
+                    faces.append((face, placement))
+                    centers.append((x_min + x_max) / 2 + placement.TranslationPart().X())
+
+            # Find all of the path parameters in a single pass along the path,
+            # positions beyond the ends of the path are extrapolated from the start
+            curve = text_path._geom_adaptor()
+            path_length = GCPnts_AbscissaPoint.Length_s(curve)
+            params = [0.0] * len(centers)
+            param, distance = curve.FirstParameter(), 0.0
+            for i in sorted(range(len(centers)), key=centers.__getitem__):
+                target = position_on_path * path_length + centers[i]
+                if 0.0 <= target <= path_length:
+                    param = GCPnts_AbscissaPoint(
+                        curve, target - distance, param
+                    ).Parameter()
+                    params[i], distance = param, target
+                else:
+                    params[i] = GCPnts_AbscissaPoint(
+                        curve, target, curve.FirstParameter()
+                    ).Parameter()
+
+            # Move each face onto the path and rotate it to follow the tangent
+            for (face, placement), center, param in zip(faces, centers, params):
+                wire_position, wire_tangent = gp_Pnt(), gp_Vec()
+                curve.D1(param, wire_position, wire_tangent)
+                wire_angle = Vector(1, 0, 0).get_signed_angle(
+                    Vector(gp_Dir(wire_tangent))
+                )
+                to_path = gp_Trsf()
+                to_path.SetTranslation(gp_Vec(gp_Pnt(center, 0, 0), wire_position))
+                rotation = gp_Trsf()
+                rotation.SetRotation(
+                    gp_Ax1(wire_position, gp_Dir(0, 0, 1)), -wire_angle * DEG2RAD
+                )
+                builder.Add(
+                    text_compound,
+                    face.Moved(TopLoc_Location(rotation * to_path * placement)),
+                )
 
-        if text_path is not None:
-            path_length = text_path.length
-            text_flat = Compound.make_compound(
-                [position_face(f) for f in text_flat.faces()]
-            )
-
-        return text_flat
+        return Compound(text_compound)
 
     @classmethod
     def make_triad(cls, axes_scale: float) -> Compound:
@@ -4137,28 +4618,40 @@ class Compound(Mixin3D, Shape):
 
         return tcast(Compound, self._bool_op(self, to_cut, cut_op))
 
-    def fuse(self, *to_fuse: Shape, glue: bool = False, tol: float = None) -> Compound:
+    def fuse(
+        self,
+        *to_fuse: Shape,
+        glue: Optional[bool] = None,
+        tol: float = None,
+        strategy: FuseStrategy = FuseStrategy.AUTO,
+        max_workers: int = 1,
+    ) -> Compound:
         """Fuse shapes together
 
         Args:
           *to_fuse: Shape:
-          glue: bool:  (Default value = False)
+          glue: bool:  (Default value = None)
           tol: float:  (Default value = None)
+          strategy: FuseStrategy:  (Default value = FuseStrategy.AUTO)
+          max_workers: int:  (Default value = 1)
 
         Returns:
 
         """
 
+        args = tuple(self) + to_fuse
+        glue = len(args) > 1 and _select_glue(args, glue, tol)
+
         fuse_op = BRepAlgoAPI_Fuse()
         if glue:
             fuse_op.SetGlue(BOPAlgo_GlueEnum.BOPAlgo_GlueShift)
         if tol:
             fuse_op.SetFuzzyValue(tol)
 
-        args = tuple(self) + to_fuse
-
         if len(args) <= 1:
             return_value: Shape = args[0]
+        elif _select_fuse_strategy(args, strategy) == FuseStrategy.TREE:
+            return_value = _fuse_tree(args, glue, tol, max_workers)
         else:
             return_value = self._bool_op(args[:1], args[1:], fuse_op)
 
@@ -4246,6 +4739,36 @@ class Curve(Compound):
         """A list of wires created from the edges"""
         return Wire.combine(self.edges())
 
+    def intersections(
+        self,
+        tolerance: float = TOLERANCE,
+        self_intersections: bool = False,
+        max_workers: int = 1,
+    ) -> list[EdgeIntersection]:
+        """intersections
+
+        Find all of the points where the coplanar edges of this Curve cross or
+        touch each other - see `edge_intersections`.
+
+        Args:
+            tolerance (float, optional): the precision of computing the intersection
+                points. Defaults to TOLERANCE.
+            self_intersections (bool, optional): also find the points where each
+                edge crosses itself. Defaults to False.
+            max_workers (int, optional): maximum number of processes, None uses
+                the number set by Parallelism. Defaults to 1.
+
+        Returns:
+            list[EdgeIntersection]: intersections with the indices of the edges in
+                `edges()` and the normalized parameters along them
+        """
+        return edge_intersections(
+            self.edges(),
+            tolerance,
+            self_intersections=self_intersections,
+            max_workers=max_workers,
+        )
+
 
 class Edge(Mixin1D, Shape):
     """A trimmed curve that represents the border of a face"""
@@ -6206,10 +6729,11 @@ class Solid(Mixin3D, Shape):
         ]
 
         # combine the inner solids into compound
-        inner_comp = Compound.make_compound(inner_solids).wrapped
+        inner_comp = Compound.make_compound(inner_solids)
 
         # subtract from the outer solid
-        return Solid(BRepAlgoAPI_Cut(outer_solid, inner_comp).Shape())
+        outer = Shape(outer_solid)
+        return Solid(outer._bool_op((outer,), (inner_comp,), BRepAlgoAPI_Cut()).wrapped)
 
     @classmethod
     def extrude_until(
@@ -6857,9 +7381,14 @@ class Wire(Mixin1D, Shape):
 
     def order_edges(self) -> ShapeList[Edge]:
         """Return the edges in self ordered by wire direction and orientation"""
-        ordered_edges = [
-            e if e.is_forward else e.reversed() for e in self.edges().sort_by(self)
-        ]
+        # The wire explorer follows the connectivity of the wire in the same
+        # order as the parameterization of the wire
+        ordered_edges = []
+        explorer = BRepTools_WireExplorer(self.wrapped)
+        while explorer.More():
+            edge = Edge(explorer.Current())
+            ordered_edges.append(edge if edge.is_forward else edge.reversed())
+            explorer.Next()
         return ShapeList(ordered_edges)
 
     @classmethod
@@ -6868,8 +7397,7 @@ class Wire(Mixin1D, Shape):
 
         Build a Wire from the provided unsorted Edges. If sequenced is True the
         Edges are placed in such that the end of the nth Edge is coincident with
-        the n+1th Edge forming an unbroken sequence. Note that sequencing a list
-        is relatively slow.
+        the n+1th Edge forming an unbroken sequence.
 
         Args:
             edges (Iterable[Edge]): Edges to assemble
@@ -6883,30 +7411,9 @@ class Wire(Mixin1D, Shape):
             Wire: assembled edges
         """
 
-        def closest_to_end(current: Wire, unplaced_edges: list[Edge]) -> Edge:
-            """Return the Edge closest to the end of last_edge"""
-            target_point = current.position_at(1)
-
-            sorted_edges = sorted(
-                unplaced_edges,
-                key=lambda e: min(
-                    (target_point - e.position_at(0)).length,
-                    (target_point - e.position_at(1)).length,
-                ),
-            )
-            return sorted_edges[0]
-
         edges = list(edges)
         if sequenced:
-            placed_edges = [edges.pop(0)]
-            unplaced_edges = edges
-
-            while unplaced_edges:
-                next_edge = closest_to_end(Wire.make_wire(placed_edges), unplaced_edges)
-                next_edge_index = unplaced_edges.index(next_edge)
-                placed_edges.append(unplaced_edges.pop(next_edge_index))
-
-            edges = placed_edges
+            edges = [edges[i] for i in _sequence_edges(edges)]
 
         wire_builder = BRepBuilderAPI_MakeWire()
         combined_edges = TopTools_ListOfShape()
@@ -6925,6 +7432,64 @@ class Wire(Mixin1D, Shape):
 
         return cls(wire_builder.Wire())
 
+    @classmethod
+    def make_chain(cls, edges: Iterable[Edge]) -> Wire:
+        """make_chain
+
+        Build a Wire from Edges that are already in sequence - i.e. each Edge starts
+        where the previous one ends. Unlike `make_wire`, which searches for the
+        connections between the Edges, consecutive Edges simply share a Vertex so
+        long sequences are assembled in linear time. The Wire is closed if the last
+        Edge ends at the start of the first.
+
+        Args:
+            edges (Iterable[Edge]): Edges in sequence
+
+        Raises:
+            RuntimeError: Wire is empty
+            ValueError: Edges are disconnected
+
+        Returns:
+            Wire: assembled edges
+        """
+        edges = [edge.wrapped for edge in edges]
+        if not edges:
+            raise RuntimeError("Wire is empty")
+
+        # One vertex at the start of each edge and one at the end of the chain
+        starts = [BRep_Tool.Pnt_s(TopExp.FirstVertex_s(e, True)) for e in edges]
+        ends = [BRep_Tool.Pnt_s(TopExp.LastVertex_s(e, True)) for e in edges]
+        if any(end.Distance(start) > TOLERANCE for end, start in zip(ends, starts[1:])):
+            raise ValueError("Edges are disconnected")
+        vertex_builder = BRep_Builder()
+        junctions = []
+        for point in starts + ends[-1:]:
+            vertex = TopoDS_Vertex()
+            vertex_builder.MakeVertex(vertex, point, TOLERANCE)
+            junctions.append(vertex)
+        if ends[-1].Distance(starts[0]) <= TOLERANCE:
+            junctions[-1] = junctions[0]
+
+        wire = TopoDS_Wire()
+        vertex_builder.MakeWire(wire)
+        for edge, start, end in zip(edges, junctions, junctions[1:]):
+            first, last = BRep_Tool.Range_s(edge)
+            forward = edge.Orientation() != TopAbs_Orientation.TopAbs_REVERSED
+            edge_builder = BRepBuilderAPI_MakeEdge(
+                BRep_Tool.Curve_s(edge, first, last),
+                start if forward else end,
+                end if forward else start,
+                first,
+                last,
+            )
+            if not edge_builder.IsDone():
+                raise ValueError("Edges are disconnected")
+            new_edge = edge_builder.Edge()
+            vertex_builder.Add(wire, new_edge if forward else new_edge.Reversed())
+        wire.Closed(BRep_Tool.IsClosed_s(wire))
+
+        return cls(wire)
+
     @classmethod
     def make_circle(cls, radius: float, plane: Plane = Plane.XY) -> Wire:
         """make_circle
@@ -7111,19 +7676,16 @@ class Wire(Mixin1D, Shape):
         """
         # pylint: disable=too-many-branches, too-many-locals
         # Algorithm:
-        # 1) create a cloud of points along all edges
-        # 2) create a convex hull which returns facets/simplices as pairs of point indices
-        # 3) find facets that are within an edge but not adjacent and store trim and
-        #    new connecting edge data
-        # 4) find facets between edges and store trim and new connecting edge data
-        # 5) post process the trim data to remove duplicates and store in pairs
-        # 6) create  connecting edges
-        # 7) create trim edges from the original edges and the trim data
-        # 8) return a wire version of all the edges
-
-        # Possible enhancement: The accuracy of the result could be improved and the
-        # execution time reduced by adaptively placing more points around where the
-        # connecting edges contact the arc.
+        # 1) sample the edges coarsely - lines only at their ends, arcs every
+        #    few degrees - with analytic or batched evaluation
+        # 2) create a convex hull of the points, its vertices are counter clockwise
+        # 3) classify each pair of hull vertices as a step along an edge (adjacent
+        #    samples) or as a connecting line
+        # 4) refine the sampling of curved edges around the ends of connecting
+        #    lines, where the hull contacts the edge, and repeat from 2) until the
+        #    sample spacing there is within tolerance
+        # 5) create connecting lines and trim the original edges to the runs of
+        #    steps along them, all in hull order
 
         # if any(
         #     [
@@ -7133,80 +7695,125 @@ class Wire(Mixin1D, Shape):
         # ):
         #     raise ValueError("edges overlap")
 
-        fragments_per_edge = int(2 / tolerance)
-        points_lookup = {}  # lookup from point index to edge/position on edge
-        points = []  # convex hull point cloud
-
-        # Create points along each edge and the lookup structure
-        for edge_index, edge in enumerate(edges):
-            for i in range(fragments_per_edge):
-                param = i / (fragments_per_edge - 1)
-                points.append(edge.position_at(param).to_tuple()[:2])
-                points_lookup[edge_index * fragments_per_edge + i] = (edge_index, param)
-
-        convex_hull = ConvexHull(points)
-
-        # Filter the fragments
-        connecting_edge_data = []
-        trim_points = {}
-        for simplice in convex_hull.simplices:
-            edge0 = points_lookup[simplice[0]][0]
-            edge1 = points_lookup[simplice[1]][0]
-            # Look for connecting edges between edges
-            if edge0 != edge1:
-                if not edge0 in trim_points:
-                    trim_points[edge0] = [simplice[0]]
-                else:
-                    trim_points[edge0].append(simplice[0])
-                if not edge1 in trim_points:
-                    trim_points[edge1] = [simplice[1]]
-                else:
-                    trim_points[edge1].append(simplice[1])
-                connecting_edge_data.append(
+        edges = list(edges)
+        adaptors = [BRepAdaptor_Curve(edge.wrapped) for edge in edges]
+        curved = [adaptor.GetType() != ga.GeomAbs_Line for adaptor in adaptors]
+        params = [_hull_sample_params(adaptor) for adaptor in adaptors]
+        points = [_curve_points(a, p) for a, p in zip(adaptors, params)]
+        spacings = [
+            tolerance * 1e-2 * (a.LastParameter() - a.FirstParameter())
+            for a in adaptors
+        ]
+
+        def along_edge(edge_id: int, i: int, j: int) -> bool:
+            """Are samples i and j neighbours on the hull?"""
+            low, high = min(i, j), max(i, j)
+            if high - low == 1:
+                return True
+            # Qhull drops points that are almost on the hull
+            chord = points[edge_id][high, :2] - points[edge_id][low, :2]
+            offsets = points[edge_id][low + 1 : high, :2] - points[edge_id][low, :2]
+            deviation = np.abs(np.cross(chord, offsets))
+            return bool(np.all(deviation <= TOLERANCE * np.linalg.norm(chord)))
+
+        while True:
+            # Merge coincident points, e.g. the ends of adjoining edges
+            edge_ids = np.concatenate(
+                [np.full(len(p), i) for i, p in enumerate(params)]
+            )
+            sample_ids = np.concatenate([np.arange(len(p)) for p in params])
+            all_points = np.concatenate(points)
+            _unique, first_ids, inverse = np.unique(
+                np.round(all_points, 7), axis=0, return_index=True, return_inverse=True
+            )
+            unique_points = all_points[first_ids]
+            inverse = inverse.reshape(-1)
+            hull_vertices = ConvexHull(unique_points[:, :2]).vertices
+            on_hull = np.isin(inverse, hull_vertices)
+            members: dict[int, list[tuple[int, int]]] = {}
+            for point_id, edge_id, sample_id in zip(
+                inverse[on_hull], edge_ids[on_hull], sample_ids[on_hull]
+            ):
+                members.setdefault(point_id, []).append((edge_id, sample_id))
+
+            # Steps are either (edge, from sample, to sample) or (None, from, to)
+            steps = []
+            for start, end in zip(hull_vertices, np.roll(hull_vertices, -1)):
+                step = next(
                     (
-                        (edge0, points_lookup[simplice[0]][1], simplice[0]),
-                        (edge1, points_lookup[simplice[1]][1], simplice[1]),
-                    )
+                        (edge_id, i, j)
+                        for edge_id, i in members[start]
+                        for end_edge_id, j in members[end]
+                        if edge_id == end_edge_id and along_edge(edge_id, i, j)
+                    ),
+                    (None, start, end),
                 )
-            # Look for connecting edges within an edge
-            elif abs(simplice[0] - simplice[1]) != 1:
-                start_pnt = min(simplice.tolist())
-                end_pnt = max(simplice.tolist())
-                if not edge0 in trim_points:
-                    trim_points[edge0] = [start_pnt, end_pnt]
-                else:
-                    trim_points[edge0].extend([start_pnt, end_pnt])
-                connecting_edge_data.append(
-                    (
-                        (edge0, points_lookup[start_pnt][1], start_pnt),
-                        (edge0, points_lookup[end_pnt][1], end_pnt),
+                steps.append(step)
+
+            # Refine the curved edges where the hull contacts them
+            refinements: dict[int, list[np.ndarray]] = {}
+            for edge_id, start, end in steps:
+                if edge_id is not None:
+                    continue
+                for hull_point in (start, end):
+                    for contact_edge, i in members[hull_point]:
+                        if not curved[contact_edge]:
+                            continue
+                        edge_params = params[contact_edge]
+                        low = edge_params[max(i - 1, 0)]
+                        high = edge_params[min(i + 1, len(edge_params) - 1)]
+                        if high - low > spacings[contact_edge]:
+                            refinements.setdefault(contact_edge, []).append(
+                                np.linspace(low, high, 17)[1:-1]
+                            )
+            if not refinements:
+                break
+            for edge_id, new_params in refinements.items():
+                new_params = np.setdiff1d(np.concatenate(new_params), params[edge_id])
+                params[edge_id] = np.concatenate((params[edge_id], new_params))
+                order = np.argsort(params[edge_id], kind="stable")
+                params[edge_id] = params[edge_id][order]
+                points[edge_id] = np.concatenate(
+                    (points[edge_id], _curve_points(adaptors[edge_id], new_params))
+                )[order]
+
+        # Start with a step that doesn't continue the previous one
+        def continues(previous: tuple, step: tuple) -> bool:
+            return (
+                step[0] is not None
+                and previous[0] == step[0]
+                and previous[2] == step[1]
+                and (previous[2] > previous[1]) == (step[2] > step[1])
+            )
+
+        first = next(
+            (i for i in range(len(steps)) if not continues(steps[i - 1], steps[i])), 0
+        )
+        steps = steps[first:] + steps[:first]
+
+        hull_edges = []
+        run_start = None
+        for i, step in enumerate(steps):
+            edge_id, start, end = step
+            if edge_id is None:
+                hull_edges.append(
+                    Edge.make_line(
+                        Vector(*unique_points[start]), Vector(*unique_points[end])
                     )
                 )
-
-        trim_data = {}
-        for edge, points in trim_points.items():
-            s_points = sorted(points)
-            f_points = []
-            for i in range(0, len(s_points) - 1, 2):
-                if s_points[i] != s_points[i + 1]:
-                    f_points.append(tuple(s_points[i : i + 2]))
-            trim_data[edge] = f_points
-
-        connecting_edges = [
-            Edge.make_line(
-                edges[line[0][0]] @ line[0][1], edges[line[1][0]] @ line[1][1]
-            )
-            for line in connecting_edge_data
-        ]
-        trimmed_edges = [
-            edges[edge].trim(
-                points_lookup[trim_pair[0]][1], points_lookup[trim_pair[1]][1]
+                continue
+            if run_start is None:
+                run_start = start
+            if i + 1 < len(steps) and continues(step, steps[i + 1]):
+                continue
+            low, high = sorted((params[edge_id][run_start], params[edge_id][end]))
+            curve = BRep_Tool.Curve_s(edges[edge_id].wrapped, 0.0, 1.0)
+            hull_edges.append(
+                Edge(BRepBuilderAPI_MakeEdge(Geom_TrimmedCurve(curve, low, high)).Edge())
             )
-            for edge, trim_pairs in trim_data.items()
-            for trim_pair in trim_pairs
-        ]
-        hull_wire = Wire.make_wire(connecting_edges + trimmed_edges, sequenced=True)
-        return hull_wire
+            run_start = None
+
+        return Wire.make_wire(hull_edges)
 
     def project_to_shape(
         self,
@@ -7357,6 +7964,25 @@ class Joint(ABC):
         raise NotImplementedError
 
 
+def bin_brep_format(
+    file_name: Union[str, os.PathLike]
+) -> tuple[bool, Optional[Literal["zlib", "lzma"]]]:
+    """Determine the BREP format from the extension of a file name
+
+    Args:
+        file_name (Union[str, os.PathLike]): name of the BREP file
+
+    Returns:
+        tuple[bool, Optional[Literal["zlib", "lzma"]]]: binary format and compression
+    """
+    suffixes = [suffix.lower() for suffix in Path(file_name).suffixes]
+    compression = None
+    if suffixes and suffixes[-1] in BIN_BREP_COMPRESSION_SUFFIXES:
+        compression = BIN_BREP_COMPRESSION_SUFFIXES[suffixes.pop()]
+    is_binary = bool(suffixes) and suffixes[-1] in BIN_BREP_SUFFIXES
+    return is_binary, compression if is_binary else None
+
+
 def downcast(obj: TopoDS_Shape) -> TopoDS_Shape:
     """Downcasts a TopoDS object to suitable specialized type
 
@@ -7373,6 +7999,809 @@ def downcast(obj: TopoDS_Shape) -> TopoDS_Shape:
     return return_value
 
 
+def _hull_sample_params(adaptor: BRepAdaptor_Curve) -> np.ndarray:
+    """Initial curve parameters sampled by make_convex_hull"""
+    first, last = adaptor.FirstParameter(), adaptor.LastParameter()
+    curve_type = adaptor.GetType()
+    if curve_type == ga.GeomAbs_Line:
+        count = 2
+    elif curve_type in (ga.GeomAbs_Circle, ga.GeomAbs_Ellipse):
+        count = max(3, ceil((last - first) / (pi / 16)) + 1)
+    else:
+        count = max(33, 8 * adaptor.NbIntervals(ga.GeomAbs_C2) + 1)
+    return np.linspace(first, last, count)
+
+
+def _curve_points(adaptor: BRepAdaptor_Curve, params: np.ndarray) -> np.ndarray:
+    """Points along a curve at the given parameters
+
+    Lines, circles and ellipses are evaluated analytically for all of the
+    parameters at once.
+
+    Args:
+        adaptor (BRepAdaptor_Curve): curve to evaluate
+        params (np.ndarray): curve parameters
+
+    Returns:
+        np.ndarray: (n, 3) array of points
+    """
+    curve_type = adaptor.GetType()
+    if curve_type == ga.GeomAbs_Line:
+        line = adaptor.Line()
+        origin = np.array(line.Location().Coord())
+        direction = np.array(line.Direction().Coord())
+        return origin + params[:, None] * direction
+    if curve_type in (ga.GeomAbs_Circle, ga.GeomAbs_Ellipse):
+        if curve_type == ga.GeomAbs_Circle:
+            conic = adaptor.Circle()
+            radii = (conic.Radius(), conic.Radius())
+        else:
+            conic = adaptor.Ellipse()
+            radii = (conic.MajorRadius(), conic.MinorRadius())
+        position = conic.Position()
+        center = np.array(position.Location().Coord())
+        x_dir = np.array(position.XDirection().Coord())
+        y_dir = np.array(position.YDirection().Coord())
+        return (
+            center
+            + (radii[0] * np.cos(params))[:, None] * x_dir
+            + (radii[1] * np.sin(params))[:, None] * y_dir
+        )
+    return np.array([adaptor.Value(param).Coord() for param in params]).reshape(-1, 3)
+
+
+def _hidden_line_removal(
+    obj: TopoDS_Shape,
+    viewport_origin: tuple[float, float, float],
+    viewport_up: tuple[float, float, float],
+    look_at: tuple[float, float, float],
+    exact: bool,
+    deflection: float,
+) -> tuple[list[TopoDS_Edge], list[TopoDS_Edge]]:
+    """Visible and hidden edges of obj as seen from a viewport
+
+    A module level function of OCP objects and tuples such that it can be
+    executed in a separate process.
+    """
+
+    def extract_edges(compound):
+        edges = []  # List to store the extracted edges
+
+        # Create a TopExp_Explorer to traverse the sub-shapes of the compound
+        explorer = TopExp_Explorer(compound, TopAbs_ShapeEnum.TopAbs_EDGE)
+
+        # Loop through the sub-shapes and extract edges
+        while explorer.More():
+            edges.append(TopoDS.Edge_s(explorer.Current()))
+            explorer.Next()
+
+        return edges
+
+    # Setup the projector
+    viewport_origin = Vector(viewport_origin)
+    projection_dir: Vector = (viewport_origin - Vector(look_at)).normalized()
+    viewport_up = Vector(viewport_up).normalized()
+    camera_coordinate_system = gp_Ax2()
+    camera_coordinate_system.SetAxis(
+        gp_Ax1(viewport_origin.to_pnt(), projection_dir.to_dir())
+    )
+    camera_coordinate_system.SetYDirection(viewport_up.to_dir())
+    projector = HLRAlgo_Projector(camera_coordinate_system)
+
+    if exact:
+        hidden_line_removal = HLRBRep_Algo()
+        hidden_line_removal.Add(obj)
+        hidden_line_removal.Projector(projector)
+        hidden_line_removal.Update()
+        hidden_line_removal.Hide()
+        hlr_shapes = HLRBRep_HLRToShape(hidden_line_removal)
+    else:
+        # The polygonal algorithm works on the triangulation of the faces which
+        # is made on a copy such that any mesh of obj is left untouched
+        hidden_line_removal = HLRBRep_PolyAlgo()
+        hidden_line_removal.Load(
+            tessellation_cache.triangulated_copy(obj, deflection, 0.1)
+        )
+        hidden_line_removal.Projector(projector)
+        hidden_line_removal.Update()
+        hlr_shapes = HLRBRep_PolyHLRToShape()
+        hlr_shapes.Update(hidden_line_removal)
+
+    # Create the visible edges
+    visible_edges = []
+    for edges in [
+        hlr_shapes.VCompound(),
+        hlr_shapes.Rg1LineVCompound(),
+        hlr_shapes.OutLineVCompound(),
+    ]:
+        if not edges.IsNull():
+            visible_edges.extend(extract_edges(edges))
+
+    # Create the hidden edges
+    hidden_edges = []
+    for edges in [
+        hlr_shapes.HCompound(),
+        hlr_shapes.OutLineHCompound(),
+        hlr_shapes.Rg1LineHCompound(),
+    ]:
+        if not edges.IsNull():
+            hidden_edges.extend(extract_edges(edges))
+
+    # Fix the underlying geometry - otherwise we will get segfaults
+    if exact:
+        for edge in visible_edges:
+            BRepLib.BuildCurves3d_s(edge, TOLERANCE)
+        for edge in hidden_edges:
+            BRepLib.BuildCurves3d_s(edge, TOLERANCE)
+
+    return (visible_edges, hidden_edges)
+
+
+def _sequence_edges(edges: Sequence[Edge], tolerance: float = TOLERANCE) -> list[int]:
+    """Order edges such that each one starts where the previous one ends
+
+    The end points of the edges are stored in a KD-tree such that the edge
+    connected to the end of the sequence is found in O(log n). Starting with
+    the first edge, the sequence is extended forward and then backward from
+    its start. Edges that aren't connected within tolerance are appended by
+    distance to the end of the sequence.
+
+    Args:
+        edges (Sequence[Edge]): edges to sequence
+        tolerance (float, optional): maximum gap between connected end points.
+            Defaults to TOLERANCE.
+
+    Returns:
+        list[int]: the indices of the edges in sequence
+    """
+    if len(edges) < 2:
+        return list(range(len(edges)))
+
+    # End points 2i and 2i+1 are the vertices of edge i
+    end_points = np.array(
+        [
+            BRep_Tool.Pnt_s(vertex).Coord()
+            for edge in edges
+            for vertex in (
+                TopExp.FirstVertex_s(edge.wrapped),
+                TopExp.LastVertex_s(edge.wrapped),
+            )
+        ]
+    )
+    tree = cKDTree(end_points)
+    placed = np.zeros(len(edges), dtype=bool)
+
+    def connected(point_index: int, within_tolerance: bool = True) -> Optional[int]:
+        """The closest unplaced end point to an end point"""
+        point = end_points[point_index]
+        if within_tolerance:
+            candidates = [
+                i for i in tree.query_ball_point(point, tolerance) if not placed[i // 2]
+            ]
+            if not candidates:
+                return None
+            return min(candidates, key=lambda i: np.linalg.norm(end_points[i] - point))
+        count = 8
+        while True:
+            _distances, indices = tree.query(point, k=min(count, len(end_points)))
+            for i in np.atleast_1d(indices):
+                if not placed[i // 2]:
+                    return int(i)
+            count *= 2
+
+    placed[0] = True
+    sequence = deque([0])
+    head, tail = 0, 1  # free end points at the start and end of the sequence
+    for within_tolerance in [True, False]:
+        while len(sequence) < len(edges):
+            # Extend the sequence forward from its end
+            point = connected(tail, within_tolerance)
+            if point is not None:
+                placed[point // 2] = True
+                sequence.append(point // 2)
+                tail = point ^ 1
+                continue
+            # Extend the sequence backward from its start
+            point = connected(head)
+            if point is None:
+                break
+            placed[point // 2] = True
+            sequence.appendleft(point // 2)
+            head = point ^ 1
+
+    return list(sequence)
+
+
+def overlapping_pairs(box_min: np.ndarray, box_max: np.ndarray) -> list[tuple[int, int]]:
+    """overlapping_pairs
+
+    Find the pairs of axis aligned boxes that overlap with a sort and sweep along
+    the first axis. The boxes may have any number of dimensions (e.g. 2D boxes in
+    `pack` or 3D bounding boxes of fuse operands); boxes that only touch don't
+    overlap.
+
+    Args:
+        box_min (np.ndarray): (n, d) minimum corners of the boxes
+        box_max (np.ndarray): (n, d) maximum corners of the boxes
+
+    Returns:
+        list[tuple[int, int]]: indices of the overlapping boxes
+    """
+    order = np.argsort(box_min[:, 0], kind="stable")
+    sorted_min, sorted_max = box_min[order], box_max[order]
+    # The boxes starting before each box ends along X
+    ends = np.searchsorted(sorted_min[:, 0], sorted_max[:, 0], side="left")
+    pairs = []
+    for i in np.nonzero(ends > np.arange(1, len(order) + 1))[0]:
+        candidates = slice(i + 1, ends[i])
+        overlap = (
+            (
+                np.minimum(sorted_max[candidates], sorted_max[i])
+                - np.maximum(sorted_min[candidates], sorted_min[i])
+            )
+            > 0
+        ).all(axis=1)
+        pairs.extend((order[i], order[i + 1 + j]) for j in np.nonzero(overlap)[0])
+    return pairs
+
+
+def _fuse_operands(
+    shapes: Sequence[TopoDS_Shape], glue: bool, tol: Optional[float]
+) -> TopoDS_Shape:
+    """Fuse shapes with a single boolean operation"""
+    if len(shapes) == 1:
+        return shapes[0]
+    fuse_op = BRepAlgoAPI_Fuse()
+    if glue:
+        fuse_op.SetGlue(BOPAlgo_GlueEnum.BOPAlgo_GlueShift)
+    if tol:
+        fuse_op.SetFuzzyValue(tol)
+    first, *others = (Shape.cast(shape) for shape in shapes)
+    return first._bool_op((first,), others, fuse_op).wrapped
+
+
+def _split_clusters(centers: np.ndarray, depth: int) -> list[np.ndarray]:
+    """Split points into 2**depth spatial clusters of equal size by recursively
+    dividing them at the median of their longest extent. Clusters that are
+    adjacent in the returned list are siblings in the split tree."""
+    clusters = [np.arange(len(centers))]
+    for _ in range(depth):
+        halves = []
+        for cluster in clusters:
+            if len(cluster) < 2:
+                halves.append(cluster)
+                continue
+            points = centers[cluster]
+            axis = np.argmax(np.ptp(points, axis=0))
+            order = cluster[np.argsort(points[:, axis], kind="stable")]
+            halves.extend([order[: len(order) // 2], order[len(order) // 2 :]])
+        clusters = halves
+    return clusters
+
+
+def _fuse_subtree(
+    shapes: list[TopoDS_Shape],
+    centers: np.ndarray,
+    glue: bool,
+    tol: Optional[float],
+) -> TopoDS_Shape:
+    """Fuse spatially clustered halves of the shapes and then the two halves"""
+    if len(shapes) <= FUSE_TREE_LEAF_SIZE:
+        return _fuse_operands(shapes, glue, tol)
+    halves = [
+        _fuse_subtree([shapes[i] for i in half], centers[half], glue, tol)
+        for half in _split_clusters(centers, 1)
+    ]
+    return _fuse_operands(halves, glue, tol)
+
+
+def _fuse_tree(
+    shapes: Sequence[Shape],
+    glue: bool = False,
+    tol: Optional[float] = None,
+    max_workers: int = 1,
+) -> Shape:
+    """Fuse shapes in a balanced tree of spatial clusters
+
+    Each boolean operation fuses either a few neighbouring operands or the
+    results of two subtrees. With more than one worker, the subtrees below the
+    top levels of the tree are fused in separate processes.
+
+    Args:
+        shapes (Sequence[Shape]): shapes to fuse
+        glue (bool, optional): glue option of the boolean operations.
+            Defaults to False.
+        tol (float, optional): fuzzy value of the boolean operations.
+            Defaults to None.
+        max_workers (int, optional): maximum number of processes, None uses the
+            number set by Parallelism. Defaults to 1.
+
+    Returns:
+        Shape: fused shape
+    """
+    wrapped = [shape.wrapped for shape in shapes]
+    centers = np.array([shape.bounding_box().center().to_tuple() for shape in shapes])
+    workers = max_workers if max_workers is not None else Parallelism.threads("boolean")
+    depth = int(np.ceil(np.log2(workers))) if workers > 1 else 0
+    if depth == 0 or len(shapes) <= FUSE_TREE_LEAF_SIZE << depth:
+        return Shape.cast(_fuse_subtree(wrapped, centers, glue, tol))
+
+    clusters = _split_clusters(centers, depth)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        level = list(
+            executor.map(
+                _fuse_subtree,
+                [[wrapped[i] for i in cluster] for cluster in clusters],
+                [centers[cluster] for cluster in clusters],
+                [glue] * len(clusters),
+                [tol] * len(clusters),
+            )
+        )
+    # Combine the siblings of the top levels of the tree
+    while len(level) > 1:
+        level = [
+            _fuse_operands(level[i : i + 2], glue, tol) for i in range(0, len(level), 2)
+        ]
+    return Shape.cast(level[0])
+
+
+def _select_fuse_strategy(
+    shapes: Sequence[Shape], strategy: FuseStrategy
+) -> FuseStrategy:
+    """Resolve FuseStrategy.AUTO by the number of operands and the density of
+    their bounding box overlaps"""
+    if strategy != FuseStrategy.AUTO:
+        return strategy
+    if len(shapes) < FUSE_TREE_MIN_OPERANDS:
+        return FuseStrategy.SINGLE
+    boxes = [shape.bounding_box() for shape in shapes]
+    box_min = np.array([box.min.to_tuple() for box in boxes])
+    box_max = np.array([box.max.to_tuple() for box in boxes])
+    overlaps = 2 * len(overlapping_pairs(box_min, box_max)) / len(shapes)
+    selected = (
+        FuseStrategy.TREE
+        if overlaps <= FUSE_TREE_MAX_OVERLAPS
+        else FuseStrategy.SINGLE
+    )
+    logger.debug(
+        "fusing %d operands with %0.1f overlaps each using %s",
+        len(shapes),
+        overlaps,
+        selected,
+    )
+    return selected
+
+
+def _separated_along_axis(
+    min1: np.ndarray,
+    max1: np.ndarray,
+    min2: np.ndarray,
+    max2: np.ndarray,
+    tolerance: float,
+) -> bool:
+    """Are two bounding boxes on opposite sides of a plane normal to one of their
+    axes? Shapes within such boxes can touch on the plane but their interiors
+    can't intersect. Boxes that are both flat in the direction of the plane
+    normal are not separated as their shapes may overlap within the plane."""
+    adjacent = (np.abs(max1 - min2) <= tolerance) | (np.abs(max2 - min1) <= tolerance)
+    thick = np.maximum(max1 - min1, max2 - min2) > tolerance
+    return bool(np.any(adjacent & thick))
+
+
+def _separated_by_contact_face(
+    shape1: Shape, shape2: Shape, tolerance: float, max_face_pairs: int = 10_000
+) -> bool:
+    """Are two solids on opposite sides of the plane of a pair of coplanar
+    contact faces with opposing normals?"""
+    if not shape1.solids() or not shape2.solids():
+        return False
+    planes1 = [Plane(f) for f in shape1.faces() if f.geom_type() == "PLANE"]
+    planes2 = [Plane(f) for f in shape2.faces() if f.geom_type() == "PLANE"]
+    if len(planes1) * len(planes2) > max_face_pairs:
+        return False
+    checked = []
+    for plane1 in planes1:
+        if not any(
+            plane1.z_dir.dot(plane2.z_dir) < -1 + tolerance
+            and abs(plane1.z_dir.dot(plane2.origin - plane1.origin)) <= tolerance
+            for plane2 in planes2
+        ):
+            continue
+        if any(
+            abs(plane1.z_dir.dot(other.z_dir)) > 1 - tolerance
+            and abs(plane1.z_dir.dot(other.origin - plane1.origin)) <= tolerance
+            for other in checked
+        ):
+            continue
+        checked.append(plane1)
+        to_local = plane1.location.inverse()
+        box1 = shape1.moved(to_local).bounding_box()
+        box2 = shape2.moved(to_local).bounding_box()
+        if (box1.max.Z <= tolerance and box2.min.Z >= -tolerance) or (
+            box2.max.Z <= tolerance and box1.min.Z >= -tolerance
+        ):
+            return True
+    return False
+
+
+def _select_glue(
+    shapes: Sequence[Shape], glue: Optional[bool], tol: Optional[float] = None
+) -> bool:
+    """Select the glue option of a fuse
+
+    Unless glue is given or disabled by `DefaultGlue.mode`, glue is selected when
+    the interiors of the shapes can't intersect - that is, when the bounding boxes
+    of every pair of shapes are disjoint, adjacent along an axis or separated by
+    the plane of coplanar contact faces.
+    """
+    if glue is not None:
+        return glue
+    mode = DefaultGlue.active_mode()
+    if mode != GlueMode.AUTO:
+        return mode == GlueMode.SHIFT
+
+    tolerance = max(TOLERANCE, tol or 0.0)
+    boxes = [shape.bounding_box() for shape in shapes]
+    box_min = np.array([box.min.to_tuple() for box in boxes])
+    box_max = np.array([box.max.to_tuple() for box in boxes])
+    # Enlarge the boxes such that flat shapes in the same plane overlap
+    pairs = overlapping_pairs(box_min - tolerance, box_max + tolerance)
+    touching = 0
+    for i, j in pairs:
+        if not _separated_along_axis(
+            box_min[i], box_max[i], box_min[j], box_max[j], tolerance
+        ) and not _separated_by_contact_face(shapes[i], shapes[j], tolerance):
+            logger.info(
+                "fusing %d shapes without glue as shapes %d and %d overlap",
+                len(shapes),
+                i,
+                j,
+            )
+            return False
+        touching += 1
+    logger.info(
+        "fusing %d shapes with glue as they are %s",
+        len(shapes),
+        "touching" if touching else "disjoint",
+    )
+    return True
+
+
+def _touching_groups(
+    shapes: Sequence[Shape], tolerance: float = TOLERANCE
+) -> list[list[int]]:
+    """Group shapes whose bounding boxes overlap or touch, directly or through
+    other shapes of the group
+
+    Args:
+        shapes (Sequence[Shape]): shapes to group
+        tolerance (float, optional): gap between touching boxes. Defaults to TOLERANCE.
+
+    Returns:
+        list[list[int]]: indices of the shapes in each group
+    """
+    boxes = [shape.bounding_box() for shape in shapes]
+    box_min = np.array([box.min.to_tuple() for box in boxes]) - tolerance
+    box_max = np.array([box.max.to_tuple() for box in boxes]) + tolerance
+
+    parents = list(range(len(shapes)))
+
+    def root(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    for i, j in overlapping_pairs(box_min, box_max):
+        parents[root(i)] = root(j)
+
+    groups: dict[int, list[int]] = {}
+    for index in np.argsort(box_min[:, 0], kind="stable"):
+        groups.setdefault(root(index), []).append(int(index))
+    return list(groups.values())
+
+
+def _fuse_group(shapes: list[TopoDS_Shape]) -> TopoDS_Shape:
+    """Fuse shapes with a single boolean operation and clean the result"""
+    if len(shapes) == 1:
+        return shapes[0]
+    first, *others = (Shape.cast(shape) for shape in shapes)
+    return first.fuse(*others).clean().wrapped
+
+
+def _fuse_touching(shapes: Sequence[Shape], max_workers: int = 1) -> list[Shape]:
+    """Fuse groups of touching shapes
+
+    The shapes are grouped by their bounding boxes such that shapes that can't
+    touch are never operands of the same boolean operation. Groups are
+    independent and may be fused in parallel.
+
+    Args:
+        shapes (Sequence[Shape]): shapes to fuse
+        max_workers (int, optional): maximum number of processes, None uses the
+            number set by Parallelism. Defaults to 1.
+
+    Returns:
+        list[Shape]: one fused shape per group
+    """
+    groups = [[shapes[i].wrapped for i in group] for group in _touching_groups(shapes)]
+    workers = max_workers if max_workers is not None else Parallelism.threads("boolean")
+    if workers > 1 and sum(len(group) > 1 for group in groups) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_fuse_group, groups))
+    else:
+        results = [_fuse_group(group) for group in groups]
+    return [Shape.cast(result) for result in results]
+
+
+def _trace_faces(edge: Edge, line_width: float) -> ShapeList[Face]:
+    """The faces covered by a line of the given width drawn along an edge in Plane.XY
+
+    Straight and circular edges are offset analytically while other edges are
+    traced by sweeping a perpendicular line along them.
+
+    Args:
+        edge (Edge): edge to trace
+        line_width (float): width of the trace
+
+    Returns:
+        ShapeList[Face]: traced edge
+    """
+    half_width = line_width / 2
+    adaptor = BRepAdaptor_Curve(edge.wrapped)
+    first, last = adaptor.FirstParameter(), adaptor.LastParameter()
+    z_dir = gp_Dir(0, 0, 1)
+    face_builder = None
+
+    if adaptor.GetType() == ga.GeomAbs_Line:
+        direction = adaptor.Line().Direction()
+        if abs(direction.Z()) < TOLERANCE:
+            offset = gp_Vec(z_dir.Crossed(direction)) * half_width
+            start, end = adaptor.Value(first), adaptor.Value(last)
+            polygon = BRepBuilderAPI_MakePolygon(
+                start.Translated(offset.Reversed()),
+                end.Translated(offset.Reversed()),
+                end.Translated(offset),
+                start.Translated(offset),
+                True,
+            )
+            face_builder = BRepBuilderAPI_MakeFace(gp_Pln(start, z_dir), polygon.Wire())
+
+    elif adaptor.GetType() == ga.GeomAbs_Circle:
+        circle = adaptor.Circle()
+        if (
+            circle.Axis().Direction().IsParallel(z_dir, TOLERANCE)
+            and circle.Radius() > half_width
+        ):
+            outer = gp_Circ(circle.Position(), circle.Radius() + half_width)
+            inner = gp_Circ(circle.Position(), circle.Radius() - half_width)
+            plane = gp_Pln(circle.Location(), z_dir)
+            if BRep_Tool.IsClosed_s(edge.wrapped):
+                # Full rings are built counter-clockwise about +Z regardless of
+                # the direction of the traced circle so the hole is reversed
+                axis = gp_Ax2(circle.Location(), z_dir)
+                outer_wire, inner_wire = (
+                    BRepBuilderAPI_MakeWire(
+                        BRepBuilderAPI_MakeEdge(gp_Circ(axis, radius)).Edge()
+                    ).Wire()
+                    for radius in (
+                        circle.Radius() + half_width,
+                        circle.Radius() - half_width,
+                    )
+                )
+                face_builder = BRepBuilderAPI_MakeFace(plane, outer_wire)
+                face_builder.Add(TopoDS.Wire_s(inner_wire.Reversed()))
+            else:
+                outer_arc = BRepBuilderAPI_MakeEdge(outer, first, last).Edge()
+                inner_arc = BRepBuilderAPI_MakeEdge(inner, first, last).Edge()
+                ends = [
+                    BRep_Tool.Pnt_s(vertex)
+                    for arc in (outer_arc, inner_arc)
+                    for vertex in (TopExp.FirstVertex_s(arc), TopExp.LastVertex_s(arc))
+                ]
+                wire_builder = BRepBuilderAPI_MakeWire()
+                for wire_edge in (
+                    outer_arc,
+                    BRepBuilderAPI_MakeEdge(ends[1], ends[3]).Edge(),
+                    inner_arc,
+                    BRepBuilderAPI_MakeEdge(ends[2], ends[0]).Edge(),
+                ):
+                    wire_builder.Add(wire_edge)
+                face_builder = BRepBuilderAPI_MakeFace(plane, wire_builder.Wire())
+
+    if face_builder is not None and face_builder.IsDone():
+        return ShapeList([Face(face_builder.Face())])
+
+    trace_pen = edge.perpendicular_line(line_width, 0)
+    return Face.sweep(trace_pen, edge).faces()
+
+
+class EdgeIntersection(NamedTuple):
+    """A point where two edges (or an edge and itself) cross or touch
+
+    The parameters are the normalized positions along each edge as used by
+    `Edge.position_at`.
+    """
+
+    point: Vector
+    index1: int
+    index2: int
+    param1: float
+    param2: float
+
+
+def _curve_2d(edge: TopoDS_Edge, surface: Geom_Plane) -> Geom2d_TrimmedCurve:
+    """The trimmed curve of an edge in the parametric space of a plane"""
+    first, last = BRep_Tool.Range_s(edge)
+    curve = GeomProjLib.Curve2d_s(
+        BRep_Tool.Curve_s(edge, first, last), first, last, surface
+    )
+    return Geom2d_TrimmedCurve(curve, first, last)
+
+
+def _intersect_curves_2d(
+    edges: list[TopoDS_Edge],
+    plane: tuple[tuple[float, float, float], ...],
+    pairs: list[tuple[int, int]],
+    tolerance: float,
+) -> list[tuple[int, int, float, float, float, float]]:
+    """Intersect pairs of edges in a plane
+
+    Args:
+        edges (list[TopoDS_Edge]): edges to intersect
+        plane (tuple[tuple[float, float, float], ...]): origin, x_dir and z_dir
+            of the plane containing the edges
+        pairs (list[tuple[int, int]]): indices of the edges to intersect, equal
+            indices find the self intersections of an edge
+        tolerance (float): precision of the intersection points
+
+    Returns:
+        list[tuple[int, int, float, float, float, float]]: edge indices, curve
+            parameters and local coordinates of each intersection
+    """
+    surface = Geom_Plane(Plane(*plane).wrapped)
+    curves: dict[int, Geom2d_TrimmedCurve] = {}
+    intersections = []
+    for i, j in pairs:
+        for index in (i, j):
+            if index not in curves:
+                curves[index] = _curve_2d(edges[index], surface)
+        # The intersector used by Geom2dAPI_InterCurveCurve, which also provides
+        # the parameters of the intersection points
+        if i == j:
+            result = Geom2dInt_GInter(
+                Geom2dAdaptor_Curve(curves[i]), tolerance, tolerance
+            )
+        else:
+            result = Geom2dInt_GInter(
+                Geom2dAdaptor_Curve(curves[i]),
+                Geom2dAdaptor_Curve(curves[j]),
+                tolerance,
+                tolerance,
+            )
+        points = [result.Point(k) for k in range(1, result.NbPoints() + 1)]
+        # The ends of overlapping sections are also reported
+        for k in range(1, result.NbSegments() + 1):
+            segment = result.Segment(k)
+            if segment.HasFirstPoint():
+                points.append(segment.FirstPoint())
+            if segment.HasLastPoint():
+                points.append(segment.LastPoint())
+        for point in points:
+            intersections.append(
+                (
+                    i,
+                    j,
+                    point.ParamOnFirst(),
+                    point.ParamOnSecond(),
+                    point.Value().X(),
+                    point.Value().Y(),
+                )
+            )
+    return intersections
+
+
+def edge_intersections(
+    edges: Iterable[Edge],
+    tolerance: float = TOLERANCE,
+    plane: Plane = None,
+    self_intersections: bool = False,
+    max_workers: int = 1,
+) -> list[EdgeIntersection]:
+    """edge_intersections
+
+    Find all of the points where coplanar edges cross or touch each other.
+
+    Every edge is converted to a 2D curve once and only the pairs of edges whose
+    bounding boxes overlap are intersected, such that sketches with many edges
+    can be validated or split efficiently. Edges that share a vertex are
+    reported as intersecting at that vertex.
+
+    Args:
+        edges (Iterable[Edge]): coplanar edges
+        tolerance (float, optional): the precision of computing the intersection
+            points. Defaults to TOLERANCE.
+        plane (Plane, optional): plane containing the edges. Defaults to None
+            (found from the edges).
+        self_intersections (bool, optional): also find the points where each edge
+            crosses itself. Defaults to False.
+        max_workers (int, optional): maximum number of processes used to intersect
+            the edges, None uses the number set by Parallelism. Defaults to 1.
+
+    Raises:
+        ValueError: edges aren't coplanar
+
+    Returns:
+        list[EdgeIntersection]: intersections sorted by edge indices and parameters
+    """
+    edges = list(edges)
+    if not edges:
+        return []
+    if plane is None:
+        find_surface = BRepLib_FindSurface(
+            Compound.make_compound(edges).wrapped, tolerance, OnlyPlane=True
+        )
+        if find_surface.Found() and isinstance(find_surface.Surface(), Geom_Plane):
+            plane = Plane(find_surface.Surface().Pln())
+        else:
+            plane = edges[0].common_plane(*edges[1:])
+        if plane is None:
+            raise ValueError("All objects must be on the same plane")
+
+    # Broad phase: the overlapping boxes of the edges in the plane
+    surface = Geom_Plane(plane.wrapped)
+    box_min = np.empty((len(edges), 2))
+    box_max = np.empty((len(edges), 2))
+    for i, edge in enumerate(edges):
+        box = Bnd_Box2d()
+        BndLib_Add2dCurve.Add_s(_curve_2d(edge.wrapped, surface), tolerance, box)
+        x_min, y_min, x_max, y_max = box.Get()
+        box_min[i] = (x_min, y_min)
+        box_max[i] = (x_max, y_max)
+    pairs = sorted(
+        (min(i, j), max(i, j)) for i, j in overlapping_pairs(box_min, box_max)
+    )
+    if self_intersections:
+        pairs.extend((i, i) for i in range(len(edges)))
+
+    # Narrow phase: intersect the candidate pairs
+    wrapped = [edge.wrapped for edge in edges]
+    plane_def = tuple(v.to_tuple() for v in (plane.origin, plane.x_dir, plane.z_dir))
+    workers = max_workers if max_workers is not None else Parallelism.threads("analysis")
+    if workers > 1 and len(pairs) > 1:
+        chunks = [pairs[i::workers] for i in range(min(workers, len(pairs)))]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [
+                executor.submit(
+                    _intersect_curves_2d, wrapped, plane_def, chunk, tolerance
+                )
+                for chunk in chunks
+            ]
+            results = [item for future in futures for item in future.result()]
+    else:
+        results = _intersect_curves_2d(wrapped, plane_def, pairs, tolerance)
+
+    def normalized(index: int, param: float) -> float:
+        """Convert a curve parameter to a normalized position along the edge"""
+        table = edges[index]._arc_length_table()
+        if table.length == 0:
+            return 0.0
+        length = GCPnts_AbscissaPoint.Length_s(table.adaptor, table.first, param)
+        return length / table.length
+
+    intersections = [
+        EdgeIntersection(
+            plane.from_local_coords((x, y)),
+            i,
+            j,
+            normalized(i, param1),
+            normalized(j, param2),
+        )
+        for i, j, param1, param2, x, y in results
+    ]
+    return sorted(intersections, key=lambda x: (x.index1, x.index2, x.param1))
+
+
 def edges_to_wires(edges: Iterable[Edge], tol: float = 1e-6) -> list[Wire]:
     """Convert edges to a list of wires.
 
@@ -7519,8 +8948,9 @@ def new_edges(*objects: Shape, combined: Shape) -> ShapeList[Edge]:
     operation = BRepAlgoAPI_Cut()
     operation.SetArguments(combined_topo_edges)
     operation.SetTools(original_topo_edges)
-    operation.SetRunParallel(True)
-    operation.Build()
+    with occt_parallel("boolean") as parallel:
+        operation.SetRunParallel(parallel)
+        operation.Build()
 
     edges = Shape.cast(operation.Shape()).edges()
     for edge in edges:
@@ -7528,16 +8958,161 @@ def new_edges(*objects: Shape, combined: Shape) -> ShapeList[Edge]:
     return ShapeList(edges)
 
 
-class SkipClean:
-    """Skip clean context for use in operator driven code where clean=False wouldn't work"""
+class _SkipCleanMeta(type):
+    """Exposes the context local setting of SkipClean as the bool SkipClean.clean"""
+
+    @property
+    def clean(cls) -> bool:
+        """Shapes are cleaned in the current thread or task"""
+        return not cls._skip.get()
+
+    @clean.setter
+    def clean(cls, value: bool):
+        cls._skip.set(not value)
+
+
+class SkipClean(metaclass=_SkipCleanMeta):
+    """Skip clean context for use in operator driven code where clean=False wouldn't work
+
+    Within the context `SkipClean.clean` is False. The context, like setting
+    `SkipClean.clean` directly, is local to the current thread (or asyncio task)
+    so independent builds can run concurrently.
+    """
+
+    _skip: contextvars.ContextVar[bool] = contextvars.ContextVar(
+        "SkipClean._skip", default=False
+    )
 
-    clean = True
+    def __init__(self):
+        self._reset_tok = None
 
     def __enter__(self):
-        SkipClean.clean = False
+        self._reset_tok = SkipClean._skip.set(True)
 
     def __exit__(self, exception_type, exception_value, traceback):
-        SkipClean.clean = True
+        SkipClean._skip.reset(self._reset_tok)
+
+
+class DefaultGlue:
+    """DefaultGlue
+
+    The glue mode of fuse operations that don't set glue, including those of the
+    algebra operators and builders. With GlueMode.AUTO glue is used when the
+    shapes only touch or are disjoint, GlueMode.OFF always intersects all of the
+    shapes and GlueMode.SHIFT always uses glue. Set the mode globally with
+    `DefaultGlue.mode = GlueMode.OFF` or for a block of code, in the current
+    thread only, with `with DefaultGlue(GlueMode.OFF):`.
+
+    Args:
+        mode (GlueMode): glue mode within the context
+    """
+
+    mode = GlueMode.AUTO
+    _current: contextvars.ContextVar[Optional[GlueMode]] = contextvars.ContextVar(
+        "DefaultGlue._current", default=None
+    )
+
+    def __init__(self, mode: GlueMode):
+        self.context_mode = mode
+        self._reset_tok = None
+
+    def __enter__(self):
+        self._reset_tok = DefaultGlue._current.set(self.context_mode)
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        DefaultGlue._current.reset(self._reset_tok)
+
+    @staticmethod
+    def active_mode() -> GlueMode:
+        """The glue mode of the current context or else the global mode"""
+        mode = DefaultGlue._current.get()
+        return DefaultGlue.mode if mode is None else mode
+
+
+class BooleanSession:
+    """BooleanSession
+
+    Accumulate tools that are cut from a single base shape and apply them
+    together. Each boolean operation intersects all of the faces of the base with
+    the tools, so cutting many features one at a time re-processes the unchanged
+    base for every feature. A session defers the cuts until the result is needed
+    and then removes all of the tools with a single boolean operation, which gives
+    the same shape as cutting them sequentially.
+
+    Example:
+
+    .. code-block:: python
+
+        session = BooleanSession(plate)
+        for location in hole_locations:
+            session -= location * hole
+        plate = session.result
+
+    Args:
+        base (Shape): shape to cut the tools from
+        clean (bool, optional): clean the result. Defaults to True.
+    """
+
+    def __init__(self, base: Shape, clean: bool = True):
+        self.base = base
+        self.clean = clean
+        self._steps: list[tuple[Shape, ...]] = []
+
+    @property
+    def steps(self) -> int:
+        """Number of deferred cuts"""
+        return len(self._steps)
+
+    @property
+    def result(self) -> Shape:
+        """The base with all of the tools removed"""
+        base, tools = self.collapse()
+        if tools:
+            base = base.cut(*tools)
+            if self.clean:
+                base = base.clean()
+            self.base, self._steps = base, []
+        return self.base
+
+    def cut(self, *tools: Shape) -> Self:
+        """Defer cutting tools from the base
+
+        Args:
+            tools (Shape): shapes to remove
+
+        Returns:
+            BooleanSession: self
+        """
+        self._steps.append(tools)
+        return self
+
+    def __isub__(self, other: Union[Shape, Iterable[Shape]]) -> Self:
+        """Defer cutting operator -="""
+        return self.cut(*(other if isinstance(other, (list, tuple)) else [other]))
+
+    def collapse(self) -> tuple[Shape, tuple[Shape, ...]]:
+        """collapse
+
+        Cut the tools of all but the last deferred cut from the base with a single
+        boolean operation. Keeping the last cut separate allows the changes made by
+        just that cut to be determined.
+
+        Returns:
+            tuple[Shape, tuple[Shape, ...]]: the updated base and the tools of the
+                last cut
+        """
+        if not self._steps:
+            return self.base, ()
+        *earlier, last = self._steps
+        tools = [tool for step in earlier for tool in step]
+        if tools:
+            logger.debug("cutting %d deferred tool(s) at once", len(tools))
+            self.base = self.base.cut(*tools)
+            if self.clean:
+                self.base = self.base.clean()
+        self._steps = [last]
+        return self.base, last
 
 
 # Monkey-patched Axis and Plane methods that take Shapes as arguments
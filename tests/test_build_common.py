@@ -27,6 +27,9 @@ license:
 """
 import unittest
 from math import pi
+
+import numpy as np
+
 from build123d import *
 from build123d import WorkplaneList, flatten_sequence
 
@@ -89,6 +92,16 @@ class TestFlattenSequence(unittest.TestCase):
             ],
         )
 
+    def test_arrays(self):
+        self.assertListEqual(
+            flatten_sequence(np.array([[1, 2], [3, 4]]), np.array([5.0, 6.0])),
+            [(1, 2), (3, 4), (5.0, 6.0)],
+        )
+        box, sphere = Solid.make_box(1, 1, 1), Solid.make_sphere(1)
+        shapes = np.empty((2, 1), dtype=object)
+        shapes[:, 0] = [box, [sphere]]
+        self.assertListEqual(flatten_sequence(shapes), [box, sphere])
+
 
 class TestBuilder(unittest.TestCase):
     """Test the Builder base class"""
@@ -208,6 +221,31 @@ class TestBuilderExit(unittest.TestCase):
         self.assertAlmostEqual(a.part.volume, (a.part & b.part).volume, 4)
 
 
+class TestBuildInThreads(unittest.TestCase):
+    @staticmethod
+    def _build(size):
+        with BuildPart() as part:
+            Box(size, size, size)
+            with BuildSketch(part.faces().sort_by(Axis.Z)[-1]):
+                Text(str(size), 1)
+            extrude(amount=-0.1, mode=Mode.SUBTRACT)
+        return part.part, Parallelism.threads("boolean"), DefaultGlue.active_mode()
+
+    def test_builds(self):
+        with BuildPart() as outer:
+            Box(1, 1, 1)
+            with Parallelism(boolean=1), DefaultGlue(GlueMode.OFF):
+                results = build_in_threads(self._build, [2, 3, 4], max_workers=3)
+        # The builds don't add to the caller's builder
+        self.assertAlmostEqual(outer.part.volume, 1, 5)
+        for size, (part, threads, glue_mode) in zip([2, 3, 4], results):
+            self.assertLess(part.volume, size**3)
+            self.assertGreater(part.volume, size**3 - 1)
+            self.assertEqual(threads, 1)
+            self.assertEqual(glue_mode, GlueMode.OFF)
+        self.assertEqual(DefaultGlue.active_mode(), GlueMode.AUTO)
+
+
 class TestCommonOperations(unittest.TestCase):
     """Test custom operators"""
 
@@ -27,6 +27,8 @@ license:
 """
 import unittest
 from math import sqrt, pi
+
+import numpy as np
 from build123d import *
 
 
@@ -146,6 +148,8 @@ class BuildLineTests(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             FilletPolyline((0, 0), (1, 0), radius=0.1)
+        with self.assertRaises(ValueError):
+            FilletPolyline((0, 0), (1, 0), (1, 1), radius=2)
         with self.assertRaises(ValueError):
             FilletPolyline((0, 0), (1, 0), (1, 1), radius=-1)
 
@@ -290,6 +294,30 @@ class BuildLineTests(unittest.TestCase):
         self.assertEqual(len(test.edges()), 4)
         self.assertAlmostEqual(test.wires()[0].length, 4)
 
+    def test_polyline_with_array(self):
+        points = np.array([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 0)])
+        with BuildLine(Plane.XZ) as test:
+            Polyline(points, close=True)
+        self.assertEqual(len(test.edges()), 4)
+        self.assertTrue(test.wires()[0].is_closed)
+        self.assertAlmostEqual(test.wires()[0].length, 4, 5)
+        self.assertAlmostEqual(test.line.bounding_box().max.Z, 1, 5)
+
+    def test_filletpolyline_geometry(self):
+        square = FilletPolyline((0, 0), (4, 0), (4, 4), (0, 4), radius=1, close=True)
+        self.assertTrue(square.is_closed)
+        self.assertEqual(len(square.vertices()), 8)
+        self.assertAlmostEqual(square.length, 4 * 2 + 2 * pi, 5)
+        face = Face.make_from_wires(square)
+        self.assertAlmostEqual(face.area, 16 - 4 + pi, 5)
+        for edge, next_edge in zip(square.edges(), square.edges()[1:]):
+            self.assertTupleAlmostEquals(tuple(edge % 1), tuple(next_edge % 0), 5)
+
+        # Collinear points aren't filleted
+        line = FilletPolyline((0, 0), (1, 0), (2, 0), (2, 2), radius=0.5)
+        self.assertEqual(len(line.edges()), 4)
+        self.assertAlmostEqual(line.length, 4 - 1 + pi / 4, 5)
+
     def test_line_with_list(self):
         """Test line with a list of points"""
         l = Line([(0, 0), (10, 0)])
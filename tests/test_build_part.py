@@ -133,6 +133,35 @@ class TestBuildPart(unittest.TestCase):
         self.assertTrue(isinstance(test._obj, Compound))
         self.assertAlmostEqual(test.part.volume, 8000 - (4000 / 3) * pi, 5)
 
+    def test_batch_cuts(self):
+        last_faces = {}
+        for batch_cuts in [False, True]:
+            with BuildPart(batch_cuts=batch_cuts) as test:
+                Box(20, 20, 5)
+                for x in range(-8, 9, 4):
+                    with Locations((x, -5)):
+                        Hole(1)
+                if batch_cuts:
+                    self.assertEqual(test._cut_session.steps, 5)
+                last_faces[batch_cuts] = test.faces(Select.LAST)
+                self.assertIsNone(test._cut_session)
+                with Locations((0, 5)):
+                    Hole(1)
+                Box(2, 2, 10)
+            self.assertAlmostEqual(test.part.volume, 2000 - 6 * 5 * pi + 2 * 2 * 5, 5)
+        self.assertEqual(len(last_faces[True]), len(last_faces[False]))
+        hole = last_faces[True].filter_by(GeomType.CYLINDER)[0]
+        self.assertAlmostEqual(hole.bounding_box().center().X, 8, 5)
+
+    def test_boolean_session(self):
+        plate = Box(20, 20, 5)
+        session = BooleanSession(plate)
+        for x in range(-8, 9, 4):
+            session -= Pos(x, 0) * Cylinder(1, 5)
+        self.assertEqual(session.steps, 5)
+        self.assertAlmostEqual(session.result.volume, 2000 - 5 * 5 * pi, 5)
+        self.assertEqual(session.steps, 0)
+
     def test_mode_intersect(self):
         """Note that a negative volume is created"""
         with BuildPart() as test:
@@ -444,7 +444,7 @@ class TestBuildSketchObjects(unittest.TestCase):
             with Locations((10, 0)):
                 Circle(7)
             make_hull(test.edges())
-        self.assertAlmostEqual(test.sketch.area, 577.8808, 4)
+        self.assertAlmostEqual(test.sketch.area, 577.8809, 4)
         with self.assertRaises(ValueError):
             with BuildSketch():
                 make_hull()
@@ -462,6 +462,43 @@ class TestBuildSketchObjects(unittest.TestCase):
         with self.assertRaises(ValueError):
             trace()
 
+    def test_trace_analytic(self):
+        line = Edge.make_line((10, 20), (20, 20))
+        arc = Edge.make_circle(5, start_angle=0, end_angle=90).moved(Location((30, 0)))
+        traces = trace([line, Edge.make_circle(5), arc])
+        self.assertEqual(len(traces.faces()), 3)
+        self.assertAlmostEqual(traces.area, 10 + 10 * pi + 2.5 * pi, 5)
+        self.assertTrue(all(f.normal_at().Z > 0 for f in traces.faces()))
+
+        spline = Edge.make_spline([(0, 0), (5, 5), (10, 0)])
+        traced_spline = trace(spline, line_width=0.2)
+        self.assertAlmostEqual(traced_spline.area, spline.length * 0.2, 2)
+
+    def test_trace_reversed_circles(self):
+        flipped = Plane.XY.rotated((180, 0, 0))
+        for circle in [
+            Edge.make_circle(5, plane=flipped),
+            Edge.make_circle(5).reversed(),
+            Edge.make_circle(5, plane=flipped, start_angle=0, end_angle=90),
+            Edge.make_circle(5, start_angle=0, end_angle=90).reversed(),
+        ]:
+            expected = 10 * pi if circle.is_closed else 2.5 * pi
+            traced = trace(circle)
+            self.assertAlmostEqual(traced.area, expected, 5)
+            self.assertTrue(all(f.is_valid() for f in traced.faces()))
+            self.assertTrue(all(f.normal_at().Z > 0 for f in traced.faces()))
+
+    def test_trace_fused(self):
+        square = Wire.make_polygon([(0, 0), (10, 0), (10, 10), (0, 10)])
+        separate = Edge.make_line((20, 0), (30, 0))
+        for max_workers in [1, 2]:
+            with BuildSketch() as test:
+                traces = trace([square, separate], max_workers=max_workers)
+            self.assertEqual(len(traces.faces()), 2)
+            self.assertEqual(len(test.faces()), 2)
+            # The corners of the square overlap
+            self.assertAlmostEqual(test.sketch.area, 40 - 1 + 10, 5)
+
 
 if __name__ == "__main__":
     unittest.main(failfast=True)
@@ -1,4 +1,6 @@
 # system modules
+import base64
+import contextvars
 import copy
 import json
 import math
@@ -6,10 +8,13 @@ import os
 import platform
 import random
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import unittest
 from random import uniform
 
+import numpy as np
+from OCP.BRep import BRep_Tool
 from OCP.BRepBuilderAPI import BRepBuilderAPI_MakeEdge
 from OCP.gp import (
     gp,
@@ -32,7 +37,9 @@ from build123d.build_enums import (
     AngularDirection,
     CenterOf,
     Extrinsic,
+    FuseStrategy,
     GeomType,
+    GlueMode,
     Intrinsic,
     Keep,
     Kind,
@@ -70,6 +77,7 @@ from build123d.importers import import_brep, import_step, import_stl
 from build123d.mesher import Mesher
 from build123d.topology import (
     Compound,
+    Curve,
     Edge,
     Face,
     Plane,
@@ -79,12 +87,18 @@ from build123d.topology import (
     Solid,
     Vertex,
     Wire,
+    DefaultGlue,
+    SkipClean,
+    _select_fuse_strategy,
+    _select_glue,
+    edge_intersections,
     edges_to_wires,
     polar,
     new_edges,
     delta,
 )
 from build123d.jupyter_tools import display
+from build123d.tessellation import tessellation_cache
 
 DEG2RAD = math.pi / 180
 RAD2DEG = 180 / math.pi
@@ -994,6 +1008,50 @@ class TestEdge(DirectApiTestCase):
         self.assertAlmostEqual((e2 @ 0.1).X, -(e2r @ 0.1).X, 5)
 
 
+class TestEdgeIntersections(DirectApiTestCase):
+    def test_intersections(self):
+        square = Wire.make_polygon([(0, 0), (10, 0), (10, 10), (0, 10)]).edges()
+        circle = Edge.make_circle(5).moved(Location((5, 5)))
+        far_away = Edge.make_line((20, 20), (30, 30))
+        edges = square + [circle, far_away]
+        intersections = edge_intersections(edges)
+        # The square's corners and the four tangent points of the circle
+        self.assertEqual(len(intersections), 8)
+        self.assertFalse(any(5 in (x.index1, x.index2) for x in intersections))
+        for x in intersections:
+            self.assertVectorAlmostEquals(edges[x.index1] @ x.param1, x.point, 5)
+            self.assertVectorAlmostEquals(edges[x.index2] @ x.param2, x.point, 5)
+
+        self.assertEqual(Curve(Compound.make_compound(edges).wrapped).intersections(), intersections)
+
+        parallel = edge_intersections(edges, max_workers=2)
+        self.assertEqual([x[1:3] for x in parallel], [x[1:3] for x in intersections])
+
+    def test_self_intersections(self):
+        loop = Edge.make_spline([(0, 0), (4, 4), (4, 0), (0, 4)])
+        self.assertEqual(len(edge_intersections([loop])), 0)
+        intersections = edge_intersections([loop], self_intersections=True)
+        self.assertEqual(len(intersections), 1)
+        crossing = intersections[0]
+        self.assertVectorAlmostEquals(loop @ crossing.param1, loop @ crossing.param2, 5)
+
+    def test_plane(self):
+        plane = Plane.XZ.rotated((20, 10, 0))
+        edges = [
+            plane * Edge.make_line((0, 0), (2, 2)),
+            plane * Edge.make_line((0, 2), (2, 0)),
+        ]
+        intersections = edge_intersections(edges)
+        self.assertEqual(len(intersections), 1)
+        self.assertVectorAlmostEquals(
+            intersections[0].point, plane.from_local_coords((1, 1)), 5
+        )
+        self.assertAlmostEqual(intersections[0].param1, 0.5, 5)
+
+        with self.assertRaises(ValueError):
+            edge_intersections(edges + [Edge.make_line((0, 0, 5), (1, 1, 7))])
+
+
 class TestFace(DirectApiTestCase):
     def test_make_surface_from_curves(self):
         bottom_edge = Edge.make_circle(radius=1, end_angle=90)
@@ -1372,6 +1430,11 @@ class TestImportExport(DirectApiTestCase):
 
 
 class TestJupyter(DirectApiTestCase):
+    @staticmethod
+    def payload(js: str) -> list[dict]:
+        start = js.index("var data = ") + len("var data = ")
+        return json.loads(js[start : js.index(";\n", start)])
+
     def test_repr_javascript(self):
         shape = Solid.make_box(1, 1, 1)
 
@@ -1384,6 +1447,58 @@ class TestJupyter(DirectApiTestCase):
         with self.assertRaises(AttributeError):
             display(Vector())
 
+    def test_display_payload(self):
+        js = display(Solid.make_box(1, 1, 1)).data
+        self.assertNotIn("VTKFile", js)
+        data = self.payload(js)
+        self.assertEqual(len(data), 1)
+        positions = np.frombuffer(base64.b64decode(data[0]["positions"]), np.float32)
+        indices = np.frombuffer(base64.b64decode(data[0]["indices"]), np.uint32)
+        self.assertEqual(len(positions), 24 * 3)
+        self.assertEqual(len(indices), 12 * 3)
+
+    def test_display_cache(self):
+        sphere = Solid.make_sphere(1)
+        display(sphere)
+        tessellations = len(tessellation_cache)
+        display(sphere.moved(Location((5, 0, 0))))  # new TShape
+        self.assertEqual(len(tessellation_cache), tessellations + 1)
+        display(sphere)
+        display(copy.copy(sphere).move(Location((5, 0, 0))))  # shared TShape
+        self.assertEqual(len(tessellation_cache), tessellations + 1)
+
+    def test_display_decimation(self):
+        js = display(Solid.make_sphere(1), tolerance=1e-4, max_triangles=500).data
+        data = self.payload(js)
+        indices = np.frombuffer(base64.b64decode(data[0]["indices"]), np.uint32)
+        self.assertLess(len(indices) // 3, 600)
+
+    def test_display_assembly(self):
+        red = Solid.make_box(1, 1, 1)
+        red.color = Color("red")
+        assembly = Compound(
+            children=[red, Solid.make_cone(1, 0, 2).moved(Location((3, 0, 0)))]
+        )
+        js = display(assembly).data
+        data = self.payload(js)
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[0]["color"], [1, 0, 0, 1])
+        positions = np.frombuffer(base64.b64decode(data[1]["positions"]), np.float32)
+        self.assertGreaterEqual(positions.reshape(-1, 3)[:, 0].min(), 1.99)
+
+    def test_display_moved_assembly(self):
+        box = Solid.make_box(1, 1, 1).moved(Location((3, 0, 0)))
+        assembly = Compound(children=[box]).moved(Location((0, 5, 0)))
+        data = self.payload(display(assembly).data)
+        positions = np.frombuffer(base64.b64decode(data[0]["positions"]), np.float32)
+        self.assertVectorAlmostEquals(
+            Vector(*positions.reshape(-1, 3).min(axis=0).tolist()), (3, 5, 0), 5
+        )
+
+    def test_display_empty(self):
+        js = display(Compound.make_compound([])).data
+        self.assertEqual(self.payload(js), [])
+
 
 class TestLocation(DirectApiTestCase):
     def test_location(self):
@@ -1818,6 +1933,45 @@ class TestMixin1D(DirectApiTestCase):
         for i, position in enumerate(pts):
             self.assertVectorAlmostEquals(position, (i / 4, i / 4, i / 4), 5)
 
+    def test_batch_sampling(self):
+        spline = Edge.make_spline([(0, 0), (1, 2), (3, -1), (6, 4), (8, 0)])
+        distances = np.linspace(0, 1, 11)
+        params = spline.params_at(distances)
+        self.assertTrue(np.all(np.diff(params) > 0))
+        self.assertAlmostEqual(params[0], spline.param_at(0), 9)
+        self.assertAlmostEqual(params[-1], spline.param_at(1), 9)
+        # Parameters are at normalized distances along the curve
+        for distance in [0.3, 0.7]:
+            fraction = spline.trim(0, distance).length / spline.length
+            self.assertAlmostEqual(fraction, distance, 3)
+        positions = spline.positions_array(distances)
+        for i in [0, 3, 10]:
+            self.assertVectorAlmostEquals(
+                Vector(*positions[i]), spline.position_at(distances[i]), 7
+            )
+        tangents = spline.tangents_array(distances)
+        self.assertTrue(np.allclose(np.linalg.norm(tangents, axis=1), 1))
+        self.assertVectorAlmostEquals(Vector(*tangents[3]), spline % distances[3], 7)
+        frames = spline.frames_array(distances)
+        self.assertEqual(frames.shape, (11, 4, 4))
+        self.assertTrue(np.allclose(frames[:, :3, 3], positions))
+        location = spline.location_at(distances[5])
+        self.assertVectorAlmostEquals(Vector(*frames[5, :3, 3]), location.position, 7)
+
+    def test_arc_length_cache(self):
+        spline = Edge.make_spline([(0, 0), (1, 2), (3, -1)])
+        table = spline._arc_length_table()
+        self.assertIs(spline._arc_length_table(), table)
+        self.assertIs(copy.copy(spline)._arc_length_table(), table)
+        # Each thread has its own tables as the adaptors aren't thread safe
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertIsNot(executor.submit(spline._arc_length_table).result(), table)
+        # Moving the shape in place invalidates the cached adaptor
+        position = spline.position_at(0.5)
+        spline.locate(Location((0, 0, 5)))
+        self.assertIsNot(spline._arc_length_table(), table)
+        self.assertVectorAlmostEquals(spline.position_at(0.5), position + (0, 0, 5), 7)
+
     def test_tangent_at(self):
         self.assertVectorAlmostEquals(
             Edge.make_circle(1, start_angle=0, end_angle=90).tangent_at(1.0),
@@ -2588,6 +2742,63 @@ class TestShape(DirectApiTestCase):
         self.assertTrue(fuzzy.is_valid())
         self.assertAlmostEqual(fuzzy.volume, 2, 5)
 
+    def test_fuse_strategy(self):
+        # A row of overlapping boxes: 1 + 39 * 0.5
+        boxes = [Solid.make_box(1, 1, 1, Plane((i / 2, 0, 0))) for i in range(40)]
+        single = boxes[0].fuse(*boxes[1:], strategy=FuseStrategy.SINGLE)
+        self.assertAlmostEqual(single.volume, 20.5, 5)
+        tree = boxes[0].fuse(*boxes[1:], strategy=FuseStrategy.TREE)
+        self.assertTrue(tree.is_valid())
+        self.assertAlmostEqual(tree.volume, 20.5, 5)
+        parallel = Compound.make_compound(boxes).fuse(
+            strategy=FuseStrategy.TREE, max_workers=2
+        )
+        self.assertTrue(parallel.is_valid())
+        self.assertAlmostEqual(parallel.volume, 20.5, 5)
+
+        grid = [
+            Solid.make_box(1, 1, 1, Plane((i * 2, j * 2, 0)))
+            for i in range(8)
+            for j in range(8)
+        ]
+        self.assertEqual(
+            _select_fuse_strategy(grid, FuseStrategy.AUTO), FuseStrategy.TREE
+        )
+        self.assertEqual(
+            _select_fuse_strategy(grid[:10], FuseStrategy.AUTO), FuseStrategy.SINGLE
+        )
+        stacked = [Solid.make_box(1, 1, 1) for _ in range(64)]
+        self.assertEqual(
+            _select_fuse_strategy(stacked, FuseStrategy.AUTO), FuseStrategy.SINGLE
+        )
+
+    def test_fuse_glue(self):
+        box = Solid.make_box(1, 1, 1)
+        self.assertTrue(_select_glue([box, box.moved(Location((1, 0, 0)))], None))
+        self.assertTrue(_select_glue([box, box.moved(Location((3, 0, 0)))], None))
+        self.assertFalse(_select_glue([box, box.moved(Location((0.5, 0, 0)))], None))
+        self.assertTrue(_select_glue([box, box.moved(Location((0.5, 0, 0)))], True))
+
+        # Contact along a face that isn't aligned with the axes
+        rotated = Rotation(0, 0, 45)
+        pair = [box.moved(rotated), box.moved(rotated * Location((1, 0, 0)))]
+        self.assertTrue(_select_glue(pair, None))
+        pair = [box.moved(rotated), box.moved(rotated * Location((0.9, 0, 0)))]
+        self.assertFalse(_select_glue(pair, None))
+
+        # Coplanar faces may overlap
+        square = Face.make_rect(1, 1)
+        self.assertFalse(_select_glue([square, square.moved(Location((0.5, 0)))], None))
+        self.assertTrue(_select_glue([square, square.moved(Location((1, 0)))], None))
+
+        with DefaultGlue(GlueMode.OFF):
+            self.assertFalse(_select_glue([box, box.moved(Location((3, 0, 0)))], None))
+        self.assertEqual(DefaultGlue.mode, GlueMode.AUTO)
+
+        fused = box.fuse(box.moved(Location((1, 0, 0)))).clean()
+        self.assertAlmostEqual(fused.volume, 2, 5)
+        self.assertEqual(len(fused.faces()), 6)
+
     def test_faces_intersected_by_axis(self):
         box = Solid.make_box(1, 1, 1, Plane((0, 0, 1)))
         intersected_faces = box.faces_intersected_by_axis(Axis.Z)
@@ -2752,6 +2963,51 @@ class TestShape(DirectApiTestCase):
         self.assertEqual(len(visible), 1)
         self.assertEqual(len(hidden), 0)
 
+    def test_project_to_viewport_polygonal(self):
+        box = Solid.make_box(10, 10, 10)
+        visible, hidden = box.project_to_viewport((-20, 20, 20), exact=False)
+        self.assertEqual(len(visible), 9)
+        self.assertEqual(len(hidden), 3)
+
+        # Curves are approximated by line segments
+        cyl = Solid.make_cylinder(2, 10)
+        visible, _hidden = cyl.project_to_viewport((-20, 20, 20), exact=False)
+        self.assertGreater(len(visible), 6)
+        self.assertTrue(all(e.geom_type() == "LINE" for e in visible))
+
+        # The deflection is absolute and the shape's own mesh is kept
+        cyl = Solid.make_cylinder(200, 10)
+        cyl.mesh(1, 0.5)
+        face = cyl.faces()[0].wrapped
+        triangles = BRep_Tool.Triangulation_s(face, face.Location()).NbTriangles()
+        fine, _hidden = cyl.project_to_viewport((-20, 20, 20), exact=False)
+        coarse, _hidden = cyl.project_to_viewport(
+            (-20, 20, 20), exact=False, deflection=1
+        )
+        self.assertLess(len(coarse), len(fine))
+        self.assertEqual(
+            BRep_Tool.Triangulation_s(face, face.Location()).NbTriangles(), triangles
+        )
+
+    def test_project_to_viewport_cache(self):
+        box = Solid.make_box(10, 10, 10)
+        visible, _hidden = box.project_to_viewport((-20, 20, 20))
+        cached, _hidden = box.project_to_viewport((-20, 20, 20))
+        self.assertTrue(visible[0].is_same(cached[0]))
+        moved, _hidden = box.moved(Location((1, 0, 0))).project_to_viewport(
+            (-20, 20, 20)
+        )
+        self.assertFalse(visible[0].is_same(moved[0]))
+
+    def test_project_to_viewports(self):
+        views = [((-20, 20, 20),), ((5, 5, 20), (0, 1, 0)), ((20, 5, 5), (0, 0, 1))]
+        for max_workers in [1, 2]:
+            box = Solid.make_box(10, 10, 10)
+            projections = box.project_to_viewports(views, max_workers=max_workers)
+            self.assertEqual(len(projections), 3)
+            self.assertEqual([len(v) for v, _h in projections], [9, 4, 4])
+            self.assertEqual([len(h) for _v, h in projections], [3, 4, 4])
+
     def test_vertex(self):
         v = Edge.make_circle(1).vertex()
         self.assertTrue(isinstance(v, Vertex))
@@ -3041,6 +3297,31 @@ class TestShells(DirectApiTestCase):
         self.assertVectorAlmostEquals(box_shell.center(), (0.5, 0.5, 0.5), 5)
 
 
+class TestSkipClean(unittest.TestCase):
+    def test_context(self):
+        self.assertIs(SkipClean.clean, True)
+        with SkipClean():
+            with SkipClean():
+                self.assertIs(SkipClean.clean, False)
+            self.assertIs(SkipClean.clean, False)
+            # Other threads are unaffected
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                self.assertTrue(executor.submit(lambda: SkipClean.clean).result())
+        self.assertIs(SkipClean.clean, True)
+
+    def test_default(self):
+        def skip_clean():
+            SkipClean.clean = False
+            # Other threads are unaffected
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                self.assertTrue(executor.submit(lambda: SkipClean.clean).result())
+            box = Solid.make_box(1, 1, 1)
+            return len((box + box.moved(Location((1, 0, 0)))).faces())
+
+        self.assertGreater(contextvars.copy_context().run(skip_clean), 6)
+        self.assertIs(SkipClean.clean, True)
+
+
 class TestSolid(DirectApiTestCase):
     def test_make_solid(self):
         box_faces = Solid.make_box(1, 1, 1).faces()
@@ -3522,6 +3803,24 @@ class TestWire(DirectApiTestCase):
         hull_wire = Wire.make_convex_hull(adjoining_edges)
         self.assertAlmostEqual(Face.make_from_wires(hull_wire).area, 319.9612, 4)
 
+    def test_make_convex_hull_tangents(self):
+        circles = [
+            Edge.make_circle(10, Plane.XY.move(Location((-10, 0)))),
+            Edge.make_circle(7, Plane.XY.move(Location((10, 0)))),
+            Edge.make_spline([(-5, 0), (0, 5), (5, -5), (10, 2)]),
+        ]
+        hull_wire = Wire.make_convex_hull(circles)
+        self.assertTrue(hull_wire.is_closed)
+        self.assertEqual(len(hull_wire.edges().filter_by(GeomType.LINE)), 2)
+        # The connecting lines are tangent to the circles
+        alpha = math.asin(3 / 20)
+        area = (
+            50 * (math.pi + 2 * alpha)
+            + 24.5 * (math.pi - 2 * alpha)
+            + 17 * math.sqrt(20**2 - 3**2)
+        )
+        self.assertAlmostEqual(Face.make_from_wires(hull_wire).area, area, 6)
+
     # def test_fix_degenerate_edges(self):
     #     # Can't find a way to create one
     #     edge0 = Edge.make_line((0, 0, 0), (1, 0, 0))
@@ -3600,6 +3899,45 @@ class TestWire(DirectApiTestCase):
         self.assertVectorAlmostEquals(ordered_edges[1] @ 0, (1, 0, 0), 5)
         self.assertVectorAlmostEquals(ordered_edges[2] @ 0, (1, 1, 0), 5)
 
+    def test_make_chain(self):
+        edges = [
+            Edge.make_line((0, 0), (1, 0)),
+            Edge.make_three_point_arc((1, 0), (1.5, 0.5), (1, 1)),
+            Edge.make_line((0, 1), (1, 1)).reversed(),
+            Edge.make_line((0, 1), (0, 0)),
+        ]
+        wire = Wire.make_chain(edges)
+        self.assertTrue(wire.is_closed)
+        self.assertTrue(wire.is_valid())
+        self.assertEqual(len(wire.vertices()), 4)
+        self.assertAlmostEqual(wire.length, 3 + math.pi / 2, 5)
+        self.assertVectorAlmostEquals(wire @ 0, (0, 0, 0), 5)
+
+        open_wire = Wire.make_chain(edges[:3])
+        self.assertFalse(open_wire.is_closed)
+        self.assertEqual(len(open_wire.vertices()), 4)
+
+        with self.assertRaises(ValueError):
+            Wire.make_chain([edges[0], edges[2]])
+        with self.assertRaises(RuntimeError):
+            Wire.make_chain([])
+
+    def test_make_wire_sequenced(self):
+        outline = Wire.make_polygon(
+            [(math.cos(a), math.sin(a)) for a in np.linspace(0, 2 * math.pi, 50)[:-1]]
+        )
+        edges = outline.edges()
+        random.seed(42)
+        random.shuffle(edges)
+        edges = [e.reversed() if i % 3 else e for i, e in enumerate(edges)]
+        wire = Wire.make_wire(edges, sequenced=True)
+        self.assertTrue(wire.is_closed)
+        self.assertEqual(len(wire.edges()), 49)
+        self.assertAlmostEqual(wire.length, outline.length, 5)
+        ordered_edges = wire.order_edges()
+        for edge, next_edge in zip(ordered_edges, ordered_edges[1:]):
+            self.assertVectorAlmostEquals(edge @ 1, next_edge @ 0, 5)
+
 
 if __name__ == "__main__":
     unittest.main()
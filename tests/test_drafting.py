@@ -26,15 +26,21 @@ license:
 
 """
 import math
+import os
+import tempfile
 import unittest
 from datetime import date
 
+import ezdxf
+
 from build123d import (
     IN,
     Axis,
+    Box,
     BuildLine,
     BuildSketch,
     Color,
+    Cylinder,
     Edge,
     Face,
     FontStyle,
@@ -42,6 +48,7 @@ from build123d import (
     HeadType,
     Mode,
     NumberDisplay,
+    PageSize,
     Polyline,
     RadiusArc,
     Rectangle,
@@ -55,8 +62,11 @@ from build123d.drafting import (
     ArrowHead,
     DimensionLine,
     Draft,
+    DrawingSheet,
+    DrawingView,
     ExtensionLine,
     TechnicalDrawing,
+    export_drawing_sheets,
 )
 
 metric = Draft(
@@ -303,6 +313,49 @@ class TestTechnicalDrawing(unittest.TestCase):
         self.assertGreater(bbox.size.Y, 195)
         self.assertGreater(len(drawing.faces()), 110)
 
+    def test_shared_frame(self):
+        TechnicalDrawing._frames.clear()
+        drawing1 = TechnicalDrawing(title="One", nominal_text_size=9)
+        drawing2 = TechnicalDrawing(title="Two", nominal_text_size=9)
+        self.assertEqual(len(TechnicalDrawing._frames), 1)
+        self.assertEqual(len(drawing1.faces()), len(drawing2.faces()))
+        self.assertAlmostEqual(
+            drawing1.bounding_box().size.X, drawing2.bounding_box().size.X, 5
+        )
+        TechnicalDrawing(page_size=PageSize.A3, nominal_text_size=9)
+        self.assertEqual(len(TechnicalDrawing._frames), 2)
+
+
+class TestDrawingSheets(unittest.TestCase):
+    def test_export(self):
+        part = Box(40, 20, 10) - Cylinder(4, 10)
+        views = [
+            DrawingView((100, -100, 100), position=(-50, 20)),
+            DrawingView((0, 0, 100), (0, 1, 0), position=(50, 20)),
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sheets = [
+                DrawingSheet(
+                    part,
+                    views,
+                    os.path.join(tmp_dir, f"sheet.{suffix}"),
+                    {"title": suffix, "drawing_scale": 2},
+                )
+                for suffix in ["svg", "dxf"]
+            ]
+            file_names = export_drawing_sheets(sheets, max_workers=1)
+            self.assertEqual(file_names, [sheet.file_name for sheet in sheets])
+            self.assertTrue(all(os.path.getsize(f) > 0 for f in file_names))
+
+            entities = ezdxf.readfile(file_names[1]).modelspace()
+            visible = entities.query("*[layer=='visible']")
+            self.assertGreater(len(visible), 0)
+            # views of the 40 long part at half scale
+            x_values = [e.dxf.start.x for e in visible.query("LINE")]
+            self.assertTrue(-75 < min(x_values) < -25)
+            self.assertTrue(25 < max(x_values) < 75)
+            self.assertGreater(len(entities.query("*[layer=='border']")), 100)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,10 @@
+import copy
+import gzip
+import ezdxf
 import unittest
 import math
+import xml.etree.ElementTree as ET
+from unittest.mock import patch
 from typing import Union, Iterable
 from build123d import (
     Mode,
@@ -23,8 +28,21 @@ from build123d import (
     add,
     mirror,
     section,
+    Edge,
+    Wire,
+    Location,
+    Pos,
+    Rectangle,
+)
+from build123d.exporters import (
+    ExportSVG,
+    ExportDXF,
+    Drawing,
+    LineType,
+    ColorIndex,
+    SplineCache,
+    spline_cache,
 )
-from build123d.exporters import ExportSVG, ExportDXF, Drawing, LineType
 
 
 class ExportersTestCase(unittest.TestCase):
@@ -157,5 +175,147 @@ class ExportersTestCase(unittest.TestCase):
         ExportersTestCase.drawing_combo_export(drawing, "test-ellipse-rotation")
 
 
+class ExportSVGTestCase(unittest.TestCase):
+    @staticmethod
+    def read_svg(filename: str) -> ET.Element:
+        opener = gzip.open if filename.endswith(".svgz") else open
+        with opener(filename, "rb") as svg_file:
+            return ET.fromstring(svg_file.read())
+
+    def test_merged_path(self):
+        svg = ExportSVG(precision=2)
+        svg.add_shape(Wire.make_polygon([(0, 0), (1, 0), (1, 1.23456)], close=True))
+        svg.write("test-merged.svg")
+        paths = self.read_svg("test-merged.svg").findall(".//{*}path")
+        self.assertEqual(len(paths), 1)
+        self.assertEqual(paths[0].get("d"), "M 0,0 L 1,0 L 1,1.23 L 0,0")
+
+    def test_svgz(self):
+        svg = ExportSVG()
+        svg.add_layer("circles", line_type=LineType.HIDDEN)
+        svg.add_shape(ExportersTestCase.create_test_sketch())
+        svg.add_shape(Edge.make_circle(2), layer="circles")
+        svg.write("test-svgz.svgz")
+        root = self.read_svg("test-svgz.svgz")
+        groups = root.findall("./{*}g/{*}g")
+        self.assertEqual(len(groups), 2)
+        self.assertEqual(groups[1].get("id"), "circles")
+        self.assertEqual(len(groups[1].findall("{*}circle")), 1)
+
+    def test_spooled_layers(self):
+        with patch.object(ExportSVG, "_SPOOL_SIZE", 100):
+            svg = ExportSVG()
+            svg.add_layer("lines")
+        svg.add_shape([Edge.make_line((i, 0), (i, 1)) for i in range(100)], "lines")
+        self.assertTrue(svg._layers["lines"].elements._rolled)  # on disk
+        svg.write("test-spooled-1.svg")
+        svg.add_shape(Edge.make_line((100, 0), (100, 1)), "lines")
+        svg.write("test-spooled-2.svg")
+        self.assertEqual(
+            len(self.read_svg("test-spooled-1.svg").findall(".//{*}line")), 100
+        )
+        self.assertEqual(
+            len(self.read_svg("test-spooled-2.svg").findall(".//{*}line")), 101
+        )
+
+
+    def test_close(self):
+        with ExportSVG() as svg:
+            svg.add_layer("lines")
+            svg.add_shape(Edge.make_line((0, 0), (1, 1)), "lines")
+            svg.write("test-close.svg")
+        self.assertTrue(all(l.elements.closed for l in svg._layers.values()))
+        self.assertEqual(len(self.read_svg("test-close.svg").findall(".//{*}line")), 1)
+
+
+class ExportDXFStreamingTestCase(unittest.TestCase):
+    def test_entities(self):
+        dxf = ExportDXF(streaming=True)
+        dxf.add_layer("cut", color=ColorIndex.RED, line_type=LineType.DASHED)
+        dxf.add_shape(ExportersTestCase.create_test_sketch(), "cut")
+        dxf.add_shape(Edge.make_ellipse(2, 1))
+        dxf.write("test-streaming.dxf")
+        doc = ezdxf.readfile("test-streaming.dxf")
+        self.assertEqual(doc.dxfversion, ezdxf.DXF12)
+        self.assertEqual(len(doc.audit().errors), 0)
+        self.assertEqual(doc.layers.get("cut").color, ColorIndex.RED.value)
+        self.assertEqual(doc.layers.get("cut").dxf.linetype, LineType.DASHED.value)
+        entities = doc.modelspace()
+        self.assertEqual(len(entities.query("ELLIPSE SPLINE")), 0)
+        self.assertEqual({e.dxf.layer for e in entities.query("ARC CIRCLE")}, {"cut"})
+        # The ellipse is approximated by a closed polyline on the default layer
+        (ellipse,) = entities.query("POLYLINE[layer=='0']")
+        self.assertTrue(ellipse.is_closed)
+        self.assertAlmostEqual(max(p[0] for p in ellipse.points()), 2, 5)
+
+    def test_merged_lines(self):
+        dxf = ExportDXF(streaming=True)
+        dxf.add_shape(Rectangle(2, 1).faces())
+        dxf.add_shape(Wire.make_polygon([(5, 0), (6, 0), (6, 1)], close=False))
+        dxf.add_shape(Edge.make_line((0, 5), (1, 5)))
+        dxf.write("test-merged.dxf")
+        entities = ezdxf.readfile("test-merged.dxf").modelspace()
+        polylines = entities.query("POLYLINE")
+        self.assertEqual([len(list(p.points())) for p in polylines], [4, 3])
+        self.assertEqual([p.is_closed for p in polylines], [True, False])
+        self.assertEqual(len(entities.query("LINE")), 1)
+
+    def test_matches_document(self):
+        shape = ExportersTestCase.create_test_sketch()
+        for streaming in [False, True]:
+            dxf = ExportDXF(streaming=streaming)
+            dxf.add_shape(shape)
+            dxf.write(f"test-streaming-{streaming}.dxf")
+        arcs = [
+            sorted(
+                (round(a.start_point.x, 5), round(a.start_point.y, 5))
+                for a in ezdxf.readfile(f"test-streaming-{streaming}.dxf")
+                .modelspace()
+                .query("ARC")
+            )
+            for streaming in [False, True]
+        ]
+        self.assertGreater(len(arcs[0]), 0)
+        self.assertEqual(arcs[0], arcs[1])
+
+
+class SplineCacheTestCase(unittest.TestCase):
+    spline = Edge.make_spline([(0, 0), (1, 1), (2, 0), (3, 2)])
+
+    def test_shared_curves(self):
+        cache = SplineCache()
+        converted = cache.spline(self.spline)
+        self.assertIs(cache.spline(Pos(5, 5) * self.spline), converted)
+        self.assertIs(cache.spline(self.spline.moved(Location((1, 2, 3)))), converted)
+        circle = Edge.make_circle(1)
+        self.assertIsNot(cache.spline(circle), converted)
+        located = copy.copy(circle).locate(Pos(1, 0))
+        self.assertIs(cache.spline(located), cache.spline(circle))
+        self.assertEqual(len(cache), 2)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_max_size(self):
+        cache = SplineCache(max_size=2)
+        for i in range(4):
+            cache.spline(Edge.make_line((0, 0), (i + 1, 0)))
+        self.assertEqual(len(cache), 2)
+
+    def test_located_poles(self):
+        located = self.spline.moved(Location((3, 4, 0), (0, 0, 90)))
+        svg = ExportSVG(precision=3)
+        segments = svg._bspline_segments(located, reverse=False)
+        self.assertAlmostEqual(segments[0].start, complex(3, 4), 3)
+        end = located.end_point()
+        self.assertAlmostEqual(segments[-1].end, complex(end.X, end.Y), 3)
+
+        dxf = ExportDXF()
+        dxf._convert_bspline(located, {})
+        (spline,) = dxf._modelspace.query("SPLINE")
+        self.assertAlmostEqual(spline.control_points[-1][0], end.X, 5)
+        self.assertAlmostEqual(spline.control_points[-1][1], end.Y, 5)
+        self.assertGreater(len(spline_cache), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
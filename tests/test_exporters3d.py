@@ -0,0 +1,102 @@
+import copy
+import json
+import os
+import struct
+import unittest
+
+from build123d.build_enums import Unit
+from build123d.exporters3d import export_gltf
+from build123d.geometry import Color, Location
+from build123d.topology import Compound, Edge, Solid
+
+
+def read_glb(file_name: str) -> tuple[dict, bytes]:
+    """Split a glb file into its json and binary chunks"""
+    with open(file_name, "rb") as glb_file:
+        data = glb_file.read()
+    magic, version, length = struct.unpack("<III", data[:12])
+    assert magic == 0x46546C67 and version == 2 and length == len(data)
+    json_length, _ = struct.unpack("<II", data[12:20])
+    document = json.loads(data[20 : 20 + json_length])
+    bin_length, _ = struct.unpack("<II", data[20 + json_length : 28 + json_length])
+    return document, data[28 + json_length : 28 + json_length + bin_length]
+
+
+class TestExportGltf(unittest.TestCase):
+    def tearDown(self):
+        for file_name in ["test.glb", "test.gltf"]:
+            if os.path.exists(file_name):
+                os.remove(file_name)
+
+    def test_single_shape(self):
+        self.assertTrue(export_gltf(Solid.make_box(1, 1, 1), "test.glb"))
+        document, buffer = read_glb("test.glb")
+        self.assertEqual(document["asset"]["version"], "2.0")
+        self.assertEqual(len(document["meshes"]), 1)
+        self.assertNotIn("materials", document)
+        self.assertGreaterEqual(len(buffer), document["buffers"][0]["byteLength"])
+
+        primitive = document["meshes"][0]["primitives"][0]
+        position = document["accessors"][primitive["attributes"]["POSITION"]]
+        self.assertEqual(position["count"], 24)  # 6 faces * 4 nodes
+        self.assertEqual(position["min"], [0, 0, 0])
+        self.assertEqual(position["max"], [1, 1, 1])
+        indices = document["accessors"][primitive["indices"]]
+        self.assertEqual(indices["count"], 36)  # 12 triangles
+
+    def test_units_and_up_axis(self):
+        export_gltf(Solid.make_box(1, 1, 1), "test.glb", unit=Unit.CM)
+        document, _ = read_glb("test.glb")
+        root = document["nodes"][document["scenes"][0]["nodes"][0]]
+        self.assertAlmostEqual(root["matrix"][0], 0.01)
+        self.assertAlmostEqual(root["matrix"][6], -0.01)  # y -> -z
+        self.assertAlmostEqual(root["matrix"][9], 0.01)  # z -> y
+
+    def test_instancing(self):
+        box = Solid.make_box(1, 1, 1)
+        assembly = Compound(
+            children=[copy.copy(box).move(Location((2 * i, 0, 0))) for i in range(5)]
+        )
+        export_gltf(assembly, "test.glb")
+        document, _ = read_glb("test.glb")
+        self.assertEqual(len(document["meshes"]), 1)
+        instances = [n for n in document["nodes"] if "mesh" in n]
+        self.assertEqual(len(instances), 5)
+        self.assertEqual(instances[3]["matrix"][12:15], [6, 0, 0])
+
+    def test_colors(self):
+        red = Solid.make_box(1, 1, 1)
+        red.color = Color("red")
+        red.label = "red"
+        blue = Solid.make_sphere(1).move(Location((3, 0, 0)))
+        blue.color = Color(0, 0, 1, 0.5)
+        assembly = Compound(label="assembly", children=[red, blue])
+        export_gltf(assembly, "test.glb")
+        document, _ = read_glb("test.glb")
+        self.assertEqual(len(document["materials"]), 2)
+        self.assertEqual(
+            document["materials"][0]["pbrMetallicRoughness"]["baseColorFactor"],
+            [1, 0, 0, 1],
+        )
+        self.assertEqual(document["materials"][1]["alphaMode"], "BLEND")
+        names = [n["name"] for n in document["nodes"] if "name" in n]
+        self.assertIn("red", names)
+        self.assertIn("assembly", names)
+
+    def test_gltf(self):
+        export_gltf(Solid.make_cylinder(1, 2), "test.gltf", binary=False)
+        with open("test.gltf", encoding="utf-8") as gltf_file:
+            document = json.load(gltf_file)
+        self.assertTrue(
+            document["buffers"][0]["uri"].startswith(
+                "data:application/octet-stream;base64,"
+            )
+        )
+
+    def test_no_faces(self):
+        with self.assertRaises(ValueError):
+            export_gltf(Edge.make_line((0, 0), (1, 0)), "test.glb")
+
+
+if __name__ == "__main__":
+    unittest.main()
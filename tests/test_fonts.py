@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+
+from build123d.build_enums import FontStyle
+from build123d.fonts import GlyphCache, glyph_cache
+from build123d.topology import Compound, Edge
+
+
+class TestGlyphCache(unittest.TestCase):
+    def test_font_cache(self):
+        cache = GlyphCache()
+        font, font_id = cache.font()
+        self.assertIs(cache.font()[0], font)
+        self.assertNotEqual(cache.font(font_style=FontStyle.BOLD)[1], font_id)
+
+    def test_glyph_cache(self):
+        cache = GlyphCache()
+        placed, _bbox = cache.layout("aba", 10)
+        self.assertEqual(len(placed), 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIs(placed[0].glyph, placed[2].glyph)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_size_normalized(self):
+        cache = GlyphCache()
+        small, _bbox = cache.layout("ab", 2)
+        large, _bbox = cache.layout("ab", 20)
+        self.assertEqual(len(cache), 2)
+        small_box = small[1].glyph.bounding_box.Get()
+        large_box = large[1].glyph.bounding_box.Get()
+        for small_value, large_value in zip(small_box, large_box):
+            self.assertAlmostEqual(10 * small_value, large_value, 5)
+        self.assertAlmostEqual(
+            10 * small[1].position.TranslationPart().X(),
+            large[1].position.TranslationPart().X(),
+            5,
+        )
+
+    def test_max_size(self):
+        cache = GlyphCache(max_size=2)
+        for font_size in range(1, 5):
+            cache.layout("ab", font_size)
+        self.assertEqual(len(cache._glyphs), 2)
+        # The reference outlines are kept
+        self.assertEqual(len(cache), 2)
+
+    def test_invisible_characters(self):
+        cache = GlyphCache()
+        placed, _bbox = cache.layout("a b\n\tc", 10)
+        self.assertEqual(len(placed), 3)
+        _placed, bbox = cache.layout(" ", 10)
+        self.assertTrue(bbox.IsVoid())
+
+    def test_kerning(self):
+        cache = GlyphCache()
+        brep_font, _font_id = cache.font()
+        placed, _bbox = cache.layout("AV", 10)
+        advance = placed[1].position.TranslationPart().X()
+        self.assertAlmostEqual(advance, 10 * brep_font.AdvanceX("A", "V"), 5)
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            writer = GlyphCache(cache_dir)
+            writer.layout("12", 10)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+            reader = GlyphCache(cache_dir)
+            placed, bbox = reader.layout("21", 10)
+            self.assertEqual(len(placed), 2)
+            self.assertFalse(placed[0].glyph.shape.IsNull())
+            self.assertFalse(bbox.IsVoid())
+
+    def test_corrupt_disk_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            GlyphCache(cache_dir).layout("1", 10)
+            (glyph_file,) = os.listdir(cache_dir)
+            with open(os.path.join(cache_dir, glyph_file), "wb") as corrupt:
+                corrupt.write(b"corrupt")
+
+            placed, _bbox = GlyphCache(cache_dir).layout("1", 10)
+            self.assertFalse(placed[0].glyph.shape.IsNull())
+            # The corrupt entry is replaced
+            self.assertEqual(os.listdir(cache_dir), [glyph_file])
+            placed, _bbox = GlyphCache(cache_dir).layout("1", 10)
+            self.assertFalse(placed[0].glyph.shape.IsNull())
+
+
+class TestMakeText(unittest.TestCase):
+    def test_shared_glyphs(self):
+        text1 = Compound.make_text("SN-0001", 5)
+        text2 = Compound.make_text("SN-0002", 5)
+        self.assertTrue(text1.faces()[0].wrapped.IsPartner(text2.faces()[0].wrapped))
+        self.assertGreater(len(glyph_cache), 0)
+        self.assertTrue(text1.is_valid())
+
+    def test_alignment(self):
+        text = Compound.make_text("AV", 10)
+        bbox = text.bounding_box()
+        self.assertAlmostEqual(bbox.min.X, -bbox.max.X, 5)
+        self.assertAlmostEqual(bbox.min.Y, -bbox.max.Y, 5)
+        self.assertTrue(text.location.to_tuple()[0] == (0, 0, 0))
+
+    def test_text_on_path(self):
+        path = Edge.make_circle(50, start_angle=0, end_angle=180)
+        flat = Compound.make_text("Dial 0123", 5)
+        curved = Compound.make_text("Dial 0123", 5, text_path=path)
+        self.assertEqual(len(curved.faces()), len(flat.faces()))
+        self.assertAlmostEqual(curved.area, flat.area, 5)
+        # Glyphs follow the path and only their locations differ
+        for face in curved.faces():
+            self.assertLess(abs(face.center().length - 50), 5)
+        self.assertTrue(curved.faces()[0].wrapped.IsPartner(flat.faces()[0].wrapped))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
-from io import StringIO
+from io import BytesIO, StringIO
+import mmap
 import os
+import tempfile
 import unittest
 from build123d import (
     BuildLine,
@@ -7,9 +9,18 @@ from build123d import (
     Line,
     Bezier,
     RadiusArc,
+    Solid,
+)
+from build123d.importers import (
+    import_svg_as_buildline_code,
+    import_bin_brep,
+    import_brep,
+    import_step,
+    import_step_roots,
+    import_svg,
 )
-from build123d.importers import import_svg_as_buildline_code, import_brep, import_svg
 from build123d.exporters import ExportSVG
+from OCP.STEPControl import STEPControl_StepModelType, STEPControl_Writer
 from pathlib import Path
 
 
@@ -102,5 +113,122 @@ class ImportBREP(unittest.TestCase):
             import_brep("test.brep")
 
 
+class ImportBinaryBREP(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.box = Solid.make_box(1, 2, 3)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_file_extensions(self):
+        sizes = {}
+        for name in ["box.bin", "box.bbrep", "box.bin.xz", "box.bin.zlib"]:
+            file_name = os.path.join(self.temp_dir.name, name)
+            self.assertTrue(self.box.export_brep(file_name))
+            sizes[name] = os.path.getsize(file_name)
+            box = import_brep(file_name)
+            self.assertAlmostEqual(box.volume, 6, 5)
+        self.assertLess(sizes["box.bin.xz"], sizes["box.bin"])
+        self.assertLess(sizes["box.bin.zlib"], sizes["box.bin"])
+        with open(os.path.join(self.temp_dir.name, "box.bin"), "rb") as bin_file:
+            self.assertTrue(bin_file.read().startswith(b"\nOpen CASCADE Topology"))
+
+    def test_sources(self):
+        stream = BytesIO()
+        self.box.export_bin_brep(stream, compression="lzma")
+        self.assertAlmostEqual(import_bin_brep(stream.getvalue()).volume, 6, 5)
+        stream.seek(0)
+        self.assertAlmostEqual(import_bin_brep(stream).volume, 6, 5)
+
+        file_name = os.path.join(self.temp_dir.name, "box.data")
+        self.box.export_bin_brep(file_name)
+        with open(file_name, "rb") as bin_file:
+            with mmap.mmap(bin_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                self.assertAlmostEqual(import_bin_brep(data).volume, 6, 5)
+
+    def test_triangles(self):
+        self.box.mesh(0.1)
+        with_triangles, without_triangles = BytesIO(), BytesIO()
+        self.box.export_bin_brep(with_triangles)
+        self.box.export_bin_brep(without_triangles, with_triangles=False)
+        self.assertLess(
+            len(without_triangles.getvalue()), len(with_triangles.getvalue())
+        )
+
+    def test_bad_input(self):
+        with self.assertRaises(ValueError):
+            import_bin_brep("missing.bin")
+        with self.assertRaises(ValueError):
+            import_bin_brep(b"not a brep")
+        with self.assertRaises(ValueError):
+            self.box.export_bin_brep(BytesIO(), compression="bz2")
+
+
+class ImportSTEP(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.step_file = os.path.join(self.temp_dir.name, "boxes.step")
+        writer = STEPControl_Writer()
+        for height in range(1, 5):
+            writer.Transfer(
+                Solid.make_box(1, 1, height).wrapped, STEPControl_StepModelType.STEPControl_AsIs
+            )
+        writer.Write(self.step_file)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_roots(self):
+        volumes = [shape.volume for shape in import_step_roots(self.step_file)]
+        self.assertEqual(len(volumes), 4)
+        for height, volume in enumerate(volumes, 1):
+            self.assertAlmostEqual(volume, height, 5)
+
+    def test_parallel(self):
+        serial = import_step(self.step_file)
+        parallel = import_step(self.step_file, max_workers=2)
+        self.assertEqual(len(parallel.solids()), 4)
+        self.assertAlmostEqual(parallel.volume, serial.volume, 5)
+
+    def test_sidecar_cache(self):
+        step_box = import_step(self.step_file, cache=True)
+        cache_files = [f for f in os.listdir(self.temp_dir.name) if f.endswith(".bin")]
+        self.assertEqual(len(cache_files), 1)
+        cached_box = import_step(self.step_file, cache=True)
+        self.assertEqual(len(cached_box.solids()), 4)
+        self.assertAlmostEqual(cached_box.volume, step_box.volume, 5)
+
+    def test_corrupt_cache(self):
+        step_box = import_step(self.step_file, cache=True)
+        (cache_file,) = [
+            os.path.join(self.temp_dir.name, f)
+            for f in os.listdir(self.temp_dir.name)
+            if f.endswith(".bin")
+        ]
+        for content in [b"not a brep", b""]:
+            with open(cache_file, "wb") as corrupt:
+                corrupt.write(content)
+            with self.assertLogs("build123d", level="WARNING"):
+                reparsed = import_step(self.step_file, cache=True)
+            self.assertAlmostEqual(reparsed.volume, step_box.volume, 5)
+            # The cache is rewritten
+            self.assertGreater(os.path.getsize(cache_file), len(content))
+
+    def test_cache_dir(self):
+        cache_dir = os.path.join(self.temp_dir.name, "cache")
+        list(import_step_roots(self.step_file, cache=cache_dir))
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        # A modified file must not load the stale cache
+        Solid.make_box(2, 2, 2).export_step(self.step_file)
+        self.assertAlmostEqual(import_step(self.step_file, cache=cache_dir).volume, 8, 5)
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_bad_filename(self):
+        with self.assertRaises(ValueError):
+            import_step("missing.step", cache=True)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,7 +12,10 @@ import random
 import unittest
 from functools import reduce
 
+import numpy as np
+
 from build123d import *
+from build123d.topology import overlapping_pairs
 
 class TestPack(unittest.TestCase):
     """Tests for the pack helper."""
@@ -54,5 +57,52 @@ class TestPack(unittest.TestCase):
             "bbox: 0.0 <= x <= 124.0, 0.0 <= y <= 105.0, 0.0 <= z <= 0.0",
             str((Sketch() + packed).bounding_box()))
 
+    def test_skyline(self):
+        """Test the skyline packer with and without rotation."""
+        random.seed(123456)
+        inputs = [Rectangle(random.randint(1, 20), random.randint(1, 20))
+                  for _ in range(100)]
+        area = sum(i.area for i in inputs)
+        for allow_rotation in [False, True]:
+            packed = pack(inputs, 0, packer="skyline", allow_rotation=allow_rotation)
+            self.assertEqual(len(packed), len(inputs))
+            bbox = (Sketch() + packed).bounding_box()
+            self.assertAlmostEqual(bbox.min.X, 0, 5)
+            self.assertAlmostEqual(bbox.min.Y, 0, 5)
+            # The packing is reasonably dense and square(ish)
+            self.assertGreater(area / (bbox.size.X * bbox.size.Y), 0.8)
+            self.assertLess(bbox.size.Y / bbox.size.X, 1.5)
+            self.assertAlmostEqual(sum(p.area for p in packed), area, 5)
+
+    def test_skyline_rotation(self):
+        """Test that rotated objects are placed where their boxes were packed."""
+        packed = pack([Box(30, 2, 1), Box(2, 30, 1)], 1, packer="skyline",
+                      allow_rotation=True)
+        boxes = sorted((p.bounding_box() for p in packed), key=lambda b: b.min.X)
+        # The long box doesn't fit across the square(ish) packing so is rotated
+        for bbox in boxes:
+            self.assertAlmostEqual(bbox.size.X, 2, 5)
+            self.assertAlmostEqual(bbox.size.Y, 30, 5)
+            self.assertAlmostEqual(bbox.min.Y, 0, 5)
+        self.assertAlmostEqual(boxes[1].min.X - boxes[0].max.X, 1, 5)
+        with self.assertRaises(ValueError):
+            pack([Box(1, 1, 1)], 1, allow_rotation=True)
+
+    def test_fast_boxes(self):
+        """Test pack with the boxes of the meshes of the objects."""
+        random.seed(123456)
+        inputs = [Cylinder(random.randint(1, 10), 1) for _ in range(10)]
+        packed = pack(inputs, 1, optimal=False)
+        boxes = [p.bounding_box() for p in packed]
+        self.assertFalse(overlapping_pairs(
+            np.array([(b.min.X, b.min.Y) for b in boxes]),
+            np.array([(b.max.X, b.max.Y) for b in boxes])))
+
+    def test_overlapping_pairs(self):
+        """Test the sort and sweep overlap check."""
+        box_min = np.array([(0, 0), (5, 5), (1, 1), (20, 0)])
+        box_max = np.array([(2, 2), (6, 6), (3, 3), (21, 1)])
+        self.assertEqual(overlapping_pairs(box_min, box_max), [(0, 2)])
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,78 @@
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from OCP.OSD import OSD_ThreadPool
+
+from build123d.objects_part import Box, Cylinder
+from build123d.parallel import Parallelism, occt_parallel
+
+
+class TestParallelism(unittest.TestCase):
+    def tearDown(self):
+        Parallelism.reset_defaults()
+
+    def test_precedence(self):
+        with patch.dict(os.environ, {"BUILD123D_THREADS": "3"}):
+            self.assertEqual(Parallelism.threads("boolean"), 3)
+            with patch.dict(os.environ, {"BUILD123D_MESH_THREADS": "2"}):
+                self.assertEqual(Parallelism.threads("mesh"), 2)
+            Parallelism.set_defaults(boolean=4)
+            self.assertEqual(Parallelism.threads("boolean"), 4)
+            self.assertEqual(Parallelism.threads("hlr"), 3)
+            with Parallelism(1, hlr=2):
+                self.assertEqual(Parallelism.threads("boolean"), 1)
+                self.assertEqual(Parallelism.threads("hlr"), 2)
+                with Parallelism(analysis=5):
+                    self.assertEqual(Parallelism.threads("analysis"), 5)
+                    self.assertEqual(Parallelism.threads("hlr"), 2)
+            self.assertEqual(Parallelism.threads("boolean"), 4)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Parallelism(0)
+        with self.assertRaises(ValueError):
+            Parallelism.threads("render")
+        with patch.dict(os.environ, {"BUILD123D_THREADS": "many"}):
+            with self.assertRaises(ValueError):
+                Parallelism.threads("mesh")
+
+    def test_occt_parallel(self):
+        pool = OSD_ThreadPool.DefaultPool_s()
+        pool_threads = pool.NbThreads()
+        default_threads = pool.NbDefaultThreadsToLaunch()
+        try:
+            with Parallelism(1):
+                with occt_parallel("boolean") as parallel:
+                    self.assertFalse(parallel)
+            with Parallelism(2):
+                with occt_parallel("boolean") as parallel:
+                    self.assertTrue(parallel)
+                    self.assertGreaterEqual(pool.NbThreads(), 2)
+                    self.assertEqual(pool.NbDefaultThreadsToLaunch(), 2)
+                part = Box(1, 1, 1) - Cylinder(0.25, 2)
+                self.assertTrue(part.is_valid())
+            # The pool is only sized for the duration of each operation
+            self.assertEqual(pool.NbDefaultThreadsToLaunch(), default_threads)
+
+            # Operations in other threads don't wait for a running operation
+            def other_operation():
+                with Parallelism(3), occt_parallel("mesh") as parallel:
+                    return parallel, pool.NbDefaultThreadsToLaunch()
+
+            with Parallelism(2), occt_parallel("boolean"):
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    self.assertEqual(
+                        executor.submit(other_operation).result(timeout=10), (True, 3)
+                    )
+                self.assertEqual(pool.NbDefaultThreadsToLaunch(), 2)
+            self.assertEqual(pool.NbDefaultThreadsToLaunch(), default_threads)
+        finally:
+            if pool.NbThreads() != pool_threads:
+                pool.Init(pool_threads)
+            pool.SetNbDefaultThreadsToLaunch(default_threads)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import copy
+import os
+import unittest
+
+import numpy as np
+from OCP.BRep import BRep_Tool
+from OCP.BRepTools import BRepTools
+from OCP.TopLoc import TopLoc_Location
+
+from build123d.geometry import Location
+from build123d.importers import import_stl
+from build123d.tessellation import Tessellation, TessellationCache, tessellation_cache
+from build123d.topology import Solid
+
+
+class TestTessellationCache(unittest.TestCase):
+    def test_cache_hit(self):
+        cache = TessellationCache()
+        sphere = Solid.make_sphere(1)
+        first = cache.tessellate(sphere.wrapped, 1e-3, 0.1)
+        self.assertIsInstance(first, Tessellation)
+        self.assertEqual(len(cache), 1)
+        second = cache.tessellate(sphere.wrapped, 1e-3, 0.1)
+        self.assertEqual(len(cache), 1)
+        self.assertIs(first.positions, second.positions)
+
+    def test_levels_of_detail(self):
+        cache = TessellationCache()
+        sphere = Solid.make_sphere(1)
+        fine = cache.tessellate(sphere.wrapped, 1e-4, 0.1)
+        coarse = cache.tessellate(sphere.wrapped, 1e-1, 0.5)
+        self.assertLess(coarse.triangle_count, fine.triangle_count)
+        self.assertEqual(len(cache.levels(sphere.wrapped)), 2)
+        # The finer level is still available after the coarse one was meshed
+        self.assertIs(cache.tessellate(sphere.wrapped, 1e-4, 0.1).indices, fine.indices)
+
+    def test_located_instances(self):
+        cache = TessellationCache()
+        box = Solid.make_box(1, 1, 1)
+        instance = copy.copy(box).move(Location((10, 0, 0)))
+        base = cache.tessellate(box.wrapped, 1e-3)
+        moved = cache.tessellate(instance.wrapped, 1e-3)
+        self.assertEqual(len(cache), 1)
+        np.testing.assert_allclose(moved.positions, base.positions + (10, 0, 0))
+        np.testing.assert_array_equal(moved.indices, base.indices)
+
+    def test_max_size(self):
+        cache = TessellationCache(max_size=2)
+        for radius in range(1, 5):
+            cache.tessellate(Solid.make_sphere(radius).wrapped, 1e-2)
+        self.assertEqual(len(cache), 2)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_max_size_deflections(self):
+        cache = TessellationCache(max_size=2)
+        for radius in range(1, 5):
+            cache.deflection(Solid.make_sphere(radius).wrapped, target_triangles=100)
+        self.assertEqual(len(cache._deflections), 2)
+        self.assertLessEqual(len(cache._entries), 2)
+
+    def test_no_faces(self):
+        cache = TessellationCache()
+        tessellation = cache.tessellate(Solid.make_box(1, 1, 1).edges()[0].wrapped, 1)
+        self.assertEqual(tessellation.triangle_count, 0)
+
+    def test_keeps_shape_mesh(self):
+        cache = TessellationCache()
+        cylinder = Solid.make_cylinder(10, 10)
+        cylinder.mesh(1e-3, 0.05)
+        triangles = BRep_Tool.Triangulation_s(
+            cylinder.faces()[0].wrapped, TopLoc_Location()
+        ).NbTriangles()
+        coarse = cache.tessellate(cylinder.wrapped, 1.0, 0.5)
+        self.assertLess(coarse.triangle_count, triangles)
+        self.assertEqual(
+            BRep_Tool.Triangulation_s(
+                cylinder.faces()[0].wrapped, TopLoc_Location()
+            ).NbTriangles(),
+            triangles,
+        )
+
+    def test_triangulated_copy(self):
+        box = Solid.make_box(1, 1, 1).move(Location((5, 0, 0)))
+        meshed = TessellationCache.triangulated_copy(box.wrapped, 0.1)
+        self.assertTrue(BRepTools.Triangulation_s(meshed, 0.1))
+        self.assertFalse(BRepTools.Triangulation_s(box.wrapped, 0.1))
+        self.assertTrue(meshed.Location().IsEqual(box.wrapped.Location()))
+
+    def test_target_triangles(self):
+        cache = TessellationCache()
+        for radius in [0.1, 1000]:
+            for target in [1000, 5000]:
+                tessellation = cache.tessellate(
+                    Solid.make_sphere(radius).wrapped, target_triangles=target
+                )
+                self.assertAlmostEqual(
+                    tessellation.triangle_count / target, 1, delta=0.25
+                )
+
+    def test_target_triangles_cached(self):
+        cache = TessellationCache()
+        torus = Solid.make_torus(10, 1)
+        deflection = cache.deflection(torus.wrapped, target_triangles=2000)
+        levels = len(cache.levels(torus.wrapped))
+        self.assertEqual(
+            cache.deflection(torus.wrapped, target_triangles=2000), deflection
+        )
+        cache.tessellate(torus.wrapped, target_triangles=2000)
+        self.assertEqual(len(cache.levels(torus.wrapped)), levels)
+
+    def test_chordal_error(self):
+        cache = TessellationCache()
+        small = cache.tessellate(Solid.make_sphere(1).wrapped, chordal_error=1e-3)
+        large = cache.tessellate(Solid.make_sphere(100).wrapped, chordal_error=1e-3)
+        self.assertEqual(small.triangle_count, large.triangle_count)
+
+    def test_level_of_detail_required(self):
+        cache = TessellationCache()
+        with self.assertRaises(ValueError):
+            cache.tessellate(Solid.make_box(1, 1, 1).wrapped)
+        with self.assertRaises(ValueError):
+            cache.deflection(
+                Solid.make_box(1, 1, 1).wrapped, target_triangles=10, chordal_error=0.1
+            )
+
+
+class TestTessellationUsers(unittest.TestCase):
+    def tearDown(self):
+        if os.path.exists("test.stl"):
+            os.remove("test.stl")
+
+    def test_bounding_box_keeps_mesh(self):
+        box = Solid.make_box(1, 2, 3)
+        box.mesh(1e-3)
+        box.bounding_box()
+        self.assertTrue(BRepTools.Triangulation_s(box.wrapped, 1))
+
+    def test_tessellate_uses_cache(self):
+        cylinder = Solid.make_cylinder(1, 2)
+        cylinder.tessellate(1e-3, 0.2)
+        self.assertIn((1e-3, 0.2, True), tessellation_cache.levels(cylinder.wrapped))
+
+    def test_tessellate_target_triangles(self):
+        _vertices, triangles = Solid.make_sphere(50).tessellate(
+            angular_tolerance=0.5, target_triangles=3000
+        )
+        self.assertAlmostEqual(len(triangles) / 3000, 1, delta=0.25)
+
+    def test_vtk_target_triangles(self):
+        sphere = Solid.make_sphere(5)
+        coarse = sphere.to_vtk_poly_data(target_triangles=500)
+        fine = sphere.to_vtk_poly_data(target_triangles=5000)
+        self.assertLess(coarse.GetNumberOfCells(), fine.GetNumberOfCells())
+
+    def test_export_stl(self):
+        box = Solid.make_box(1, 2, 3)
+        for ascii_format in [False, True]:
+            self.assertTrue(box.export_stl("test.stl", ascii_format=ascii_format))
+            stl_box = import_stl("test.stl")
+            self.assertAlmostEqual(stl_box.area, box.area, 5)
+        with open("test.stl", encoding="ascii") as stl_file:
+            self.assertEqual(stl_file.read().count("facet normal"), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()